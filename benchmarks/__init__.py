@@ -0,0 +1 @@
+# Performance benchmarks for PLANTIFY. Run with `python -m benchmarks`.
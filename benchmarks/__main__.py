@@ -0,0 +1,99 @@
+# Run the benchmark suite and write the results as JSON.
+#
+#   python -m benchmarks --quick                      # small sizes only
+#   python -m benchmarks -o results/HEAD.json         # full run
+#   python -m benchmarks -k predict --compare results/main.json
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import warnings
+from datetime import datetime, timezone
+
+from benchmarks.harness import BENCHMARKS, format_seconds, measure
+import benchmarks.suites  # noqa: F401  registers the benchmarks
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def run_suite(quick=False, keyword=None, repeat=5, min_sample_time=0.2):
+    results = []
+    for entry in BENCHMARKS:
+        if keyword and keyword not in entry["name"]:
+            continue
+        for param in entry["quick_params"] if quick else entry["params"]:
+            key = entry["name"] if param is None else f"{entry['name']}[{param}]"
+            try:
+                prepared = entry["setup"](param)
+            except ImportError as e:
+                print(f"{key:<36} skipped ({e})")
+                continue
+            run, extra = prepared if isinstance(prepared, tuple) else (prepared, {})
+            stats = measure(run, repeat=repeat, min_sample_time=min_sample_time)
+            stats.update(extra)
+            if "items" in extra:
+                stats["items_per_s"] = extra["items"] / stats["median_s"]
+            results.append({"benchmark": key, **stats})
+            throughput = f"  {stats['items_per_s']:,.0f} items/s" if "items_per_s" in stats else ""
+            print(f"{key:<36} {format_seconds(stats['median_s']):>10} median  {format_seconds(stats['min_s']):>10} min{throughput}")
+    return results
+
+# Print the median change against a previous results file
+def compare(results, baseline_path, threshold=0.10):
+    with open(baseline_path) as f:
+        baseline = {entry["benchmark"]: entry for entry in json.load(f)["results"]}
+    print(f"\nCompared with {baseline_path}:")
+    regressions = 0
+    for entry in results:
+        old = baseline.get(entry["benchmark"])
+        if old is None:
+            continue
+        ratio = entry["median_s"] / old["median_s"]
+        flag = ""
+        if ratio > 1 + threshold:
+            flag = "  REGRESSION"
+            regressions += 1
+        elif ratio < 1 - threshold:
+            flag = "  improved"
+        print(f"{entry['benchmark']:<36} {ratio:>6.2f}x{flag}")
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Benchmark PLANTIFY classification, encoding, reports, contacts and page reruns")
+    parser.add_argument("--quick", action="store_true", help="skip the largest problem sizes")
+    parser.add_argument("-k", dest="keyword", help="only run benchmarks whose name contains this")
+    parser.add_argument("--repeat", type=int, default=5, help="timed samples per benchmark")
+    parser.add_argument("-o", "--output", help="write results JSON here")
+    parser.add_argument("--compare", help="results JSON from an earlier run to compare medians against")
+    args = parser.parse_args(argv)
+
+    # sklearn warns on every fit of the one-sample-per-class tree
+    warnings.filterwarnings("ignore", category=UserWarning)
+    results = run_suite(quick=args.quick, keyword=args.keyword, repeat=args.repeat)
+    report = {
+        "commit": git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "quick": args.quick,
+        "results": results,
+    }
+    if args.output:
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nWrote {args.output}")
+    if args.compare:
+        return 1 if compare(results, args.compare) else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
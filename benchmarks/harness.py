@@ -0,0 +1,54 @@
+# Minimal asv-style harness: benchmarks register a setup function per parameter,
+# the runner times the callable it returns and records the stats as JSON.
+import statistics
+import time
+
+
+BENCHMARKS = []
+
+
+# Register `setup(param)` under `name` for every value in `params`. The setup
+# function does the untimed preparation and returns the callable to time,
+# optionally with a dict of extra metrics: `return run` or `return run, extra`.
+def benchmark(name, params=(None,), quick_params=None):
+    def register(setup):
+        BENCHMARKS.append({"name": name, "setup": setup, "params": list(params), "quick_params": list(quick_params or params)})
+        return setup
+    return register
+
+# Pick how many calls make one timed sample, so fast callables are not dominated
+# by timer resolution while slow ones still run once per sample
+def calibrate(run, min_sample_time):
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            run()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_sample_time or number >= 1_000_000:
+            return number
+        number *= 10 if elapsed < min_sample_time / 10 else 2
+
+def measure(run, repeat=5, min_sample_time=0.2):
+    number = calibrate(run, min_sample_time)
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            run()
+        samples.append((time.perf_counter() - start) / number)
+    samples.sort()
+    return {
+        "number": number,
+        "repeat": repeat,
+        "min_s": samples[0],
+        "median_s": statistics.median(samples),
+        "mean_s": statistics.fmean(samples),
+        "max_s": samples[-1],
+    }
+
+def format_seconds(seconds):
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.3g} {unit}"
+    return f"{seconds / 1e-9:.3g} ns"
@@ -0,0 +1,173 @@
+import os
+import tempfile
+
+from benchmarks.harness import benchmark
+from benchmarks.synthetic import synthetic_contacts, synthetic_records, synthetic_specimens
+from plantify_data import load_species_records
+from plantify_model import FEATURE_COLUMNS, load_or_train, predict, train_model
+
+
+# A trait combination in the species table and one that is not
+KNOWN_INPUTS = dict(zip(FEATURE_COLUMNS, ["alternate", "actinomorphic", "5", "superior", "herb", "capsule", "simple", "panicle"]))
+UNSEEN_INPUTS = dict(zip(FEATURE_COLUMNS, ["whorled", "zygomorphic", "6", "inferior", "shrub", "berry", "fleshy", "solitary"]))
+
+_model = None
+
+
+def served_model():
+    global _model
+    if _model is None:
+        _model = load_or_train(load_species_records())
+    return _model
+
+
+@benchmark("predict_single", params=["indexed", "tree"])
+def predict_single(kind):
+    model = served_model()
+    inputs = KNOWN_INPUTS if kind == "indexed" else UNSEEN_INPUTS
+    return lambda: predict(model, inputs)
+
+@benchmark("encode_single")
+def encode_single(_):
+    encoder = served_model()["encoder"]
+    return lambda: encoder.encode(UNSEEN_INPUTS)
+
+@benchmark("batch_classify", params=[1, 1000, 100000], quick_params=[1, 1000])
+def batch_classify(n):
+    from plantify_batch import classify_chunk
+
+    model = served_model()
+    chunk = synthetic_specimens(n)
+    return (lambda: classify_chunk(chunk, model)), {"items": n}
+
+@benchmark("train", params=["flora", 1000, 10000], quick_params=["flora"])
+def train(n_species):
+    records = load_species_records() if n_species == "flora" else synthetic_records(n_species)
+    return (lambda: train_model(records)), {"species": len(records)}
+
+# Retrain after one species' traits change: only that family's species tree is refitted
+@benchmark("retrain_family", params=["flora", 10000], quick_params=["flora"])
+def retrain_family(n_species):
+    records = load_species_records() if n_species == "flora" else synthetic_records(n_species)
+    previous = train_model(records)
+    traits, names = records[0]
+    traits = list(traits)
+    traits[FEATURE_COLUMNS.index("habit")] = "shrub" if traits[FEATURE_COLUMNS.index("habit")] == "herb" else "herb"
+    edited = [(traits, names)] + records[1:]
+    return (lambda: train_model(edited, previous=previous)), {"species": len(records)}
+
+@benchmark("nearest_species", params=["flora", 10000, 50000])
+def nearest_species(n_species):
+    from plantify_index import SimilarityEngine
+
+    records = load_species_records() if n_species == "flora" else synthetic_records(n_species)
+    engine = SimilarityEngine(records)
+    return (lambda: engine.nearest(UNSEEN_INPUTS, k=5)), {"species": len(records)}
+
+# One uncached identification-key step (candidates plus next-trait ranking) after two answers
+@benchmark("key_step", params=["flora", 10000, 100000], quick_params=["flora", 10000])
+def key_step(n_species):
+    from plantify_key import IdentificationKey
+
+    records = load_species_records() if n_species == "flora" else synthetic_records(n_species)
+    key = IdentificationKey(records)
+    answers = (("flower_symmetry", "actinomorphic"), ("habit", "herb"))
+    return (lambda: key._compute_state(answers)), {"species": len(records)}
+
+# Fuzzy name search, misspelt query
+@benchmark("name_search", params=["flora", 50000], quick_params=["flora"])
+def name_search(n_species):
+    from plantify_data import list_common_names
+    from plantify_search import SpeciesSearch
+
+    if n_species == "flora":
+        index, query = SpeciesSearch(load_species_records(), list_common_names()), "holy basl"
+    else:
+        index, query = SpeciesSearch(synthetic_records(n_species)), "genus12 specis634"
+    return (lambda: index.search(query, limit=5)), {"species": len(index.records)}
+
+@benchmark("pdf_report")
+def pdf_report(_):
+    from plantify_data import data_version
+    from plantify_report import render_report
+
+    inputs = tuple(KNOWN_INPUTS.items())
+    version = data_version()
+    size = len(render_report.__wrapped__("Ocimum tenuiflorum", "Lamiaceae", 0.95, inputs, version))
+    # Time the uncached render; the per-species sections stay memoized as in the app
+    return (lambda: render_report.__wrapped__("Ocimum tenuiflorum", "Lamiaceae", 0.95, inputs, version)), {"bytes": size}
+
+@benchmark("contacts_page", params=[10, 10000, 1000000], quick_params=[10, 10000])
+def contacts_page(n):
+    import plantify_contacts
+
+    path = os.path.join(tempfile.mkdtemp(prefix="plantify-bench-"), "contacts.db")
+    plantify_contacts.CONTACTS_DB = path
+    conn = plantify_contacts.get_connection()
+    with conn:
+        conn.executemany(
+            "INSERT INTO contacts (name, phone, email, name_key, phone_key, email_key) VALUES (?, ?, ?, ?, ?, ?)",
+            ((name, phone, email, plantify_contacts.name_key(name), plantify_contacts.phone_key(phone), plantify_contacts.email_key(email))
+             for name, phone, email in synthetic_contacts(n)),
+        )
+
+    # What the Contacts page does on a rerun: count, first page, and a search
+    def load_page():
+        plantify_contacts.count_contacts()
+        plantify_contacts.list_contacts()
+        plantify_contacts.search_contacts("bhavani")
+
+    return load_page, {"rows": n}
+
+@benchmark("app_rerun", params=["welcome", "classifier"])
+def app_rerun(page):
+    from streamlit.testing.v1 import AppTest
+
+    app_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "plantify_app.py")
+    at = AppTest.from_file(app_path, default_timeout=120)
+    at.run()
+    if page == "classifier":
+        at.sidebar.selectbox[0].select("Classifier").run()
+        for box, value in zip(at.selectbox[:len(FEATURE_COLUMNS)], KNOWN_INPUTS.values()):
+            box.select(value)
+        at.run()
+        at.button[0].click().run()
+    return lambda: at.run()
+
+# Photo identification; skipped unless an image model is built and a TFLite
+# interpreter is installed (see plantify_image.py)
+def image_classifier():
+    from plantify_image import get_image_classifier
+
+    classifier = get_image_classifier()
+    if classifier is None:
+        raise ImportError("no image model; run `python plantify_image.py build`")
+    return classifier
+
+@benchmark("image_preprocess")
+def image_preprocess(_):
+    from benchmarks.synthetic import synthetic_photo
+
+    classifier = image_classifier()
+    photo = synthetic_photo()
+    return (lambda: classifier.preprocess(photo)), {"bytes": len(photo)}
+
+@benchmark("image_batch", params=[1, 8])
+def image_batch(n):
+    import numpy as np
+    from benchmarks.synthetic import synthetic_photo
+
+    classifier = image_classifier()
+    inputs = np.stack([classifier.preprocess(synthetic_photo(seed)) for seed in range(n)])
+    return (lambda: classifier.predict_batch(inputs)), {"items": n}
+
+# End-to-end photos per second with this many concurrent callers sharing the micro-batcher
+@benchmark("image_concurrent", params=[1, 8])
+def image_concurrent(threads):
+    from concurrent.futures import ThreadPoolExecutor
+    from benchmarks.synthetic import synthetic_photo
+
+    classifier = image_classifier()
+    photos = [synthetic_photo(seed) for seed in range(threads)] * 4
+    pool = ThreadPoolExecutor(threads)
+    return (lambda: list(pool.map(classifier.rank, photos))), {"items": len(photos)}
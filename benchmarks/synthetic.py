@@ -0,0 +1,51 @@
+# Synthetic data generators for scaling benchmarks
+import random
+
+from plantify_model import FEATURE_COLUMNS, TRAIT_OPTIONS
+
+
+# Species records shaped like plantify_data.load_species_records(), with random
+# traits drawn from the UI vocabularies and families spread over n_families
+def synthetic_records(n_species, n_families=20, seed=0):
+    rng = random.Random(seed)
+    records = []
+    for i in range(n_species):
+        traits = tuple(rng.choice(TRAIT_OPTIONS[col]) for col in FEATURE_COLUMNS)
+        records.append((traits, (f"Family{i % n_families}aceae", f"Genus{i // 50} species{i}")))
+    return records
+
+# Specimen trait rows as a DataFrame with the batch-file column layout
+def synthetic_specimens(n, seed=0):
+    import numpy as np
+    import pandas as pd
+
+    rng = np.random.default_rng(seed)
+    columns = {"specimen_id": np.arange(n)}
+    for col in FEATURE_COLUMNS:
+        columns[col] = rng.choice(TRAIT_OPTIONS[col], size=n)
+    return pd.DataFrame(columns)
+
+def synthetic_contacts(n, seed=0):
+    rng = random.Random(seed)
+    first = ["Anand", "Bhavani", "Chitra", "Dinesh", "Ezhil", "Gowri", "Hari", "Indira", "Jaya", "Kumar"]
+    last = ["Raman", "Subramanian", "Nair", "Pillai", "Reddy", "Iyer", "Menon", "Rao"]
+    for i in range(n):
+        name = f"{rng.choice(first)} {rng.choice(last)} {i}"
+        yield name, f"+91 9{rng.randrange(10 ** 9):09d}", f"herbalist{i}@example.org"
+
+# A phone-camera sized JPEG: smooth colour gradients with some noise, which
+# compresses and decodes like a photo rather than like pure noise
+def synthetic_photo(seed=0, size=(1600, 1200)):
+    from io import BytesIO
+
+    import numpy as np
+    from PIL import Image
+
+    rng = np.random.default_rng(seed)
+    width, height = size
+    y, x = np.mgrid[0:height, 0:width].astype(np.float32)
+    channels = [np.sin(x / rng.uniform(40, 200) + rng.uniform(0, 6)) + np.cos(y / rng.uniform(40, 200)) for _ in range(3)]
+    pixels = np.stack(channels, axis=-1) * 60 + 128 + rng.normal(0, 8, (height, width, 3))
+    buffer = BytesIO()
+    Image.fromarray(np.clip(pixels, 0, 255).astype(np.uint8)).save(buffer, format="JPEG", quality=90)
+    return buffer.getvalue()
@@ -0,0 +1,213 @@
+-- Seed for plantify_data.py; rebuild the store with `python plantify_data.py build`
+INSERT INTO families (name, order_name, description, ethnobotanical_uses, reference) VALUES ('Lamiaceae', 'Lamiales', 'A family of aromatic plants, including herbs and shrubs, commonly utilized in South Indian traditional medicine for their benefits in respiratory, digestive, and immune system support.', 'Holy Basil (Ocimum tenuiflorum) is traditionally used in Ayurveda to alleviate colds, fevers, and stress-related conditions.', 'General botanical knowledge, inspired by studies from the Foundation for Revitalisation of Local Health Traditions (FRLHT), 2010.');
+INSERT INTO families (name, order_name, description, ethnobotanical_uses, reference) VALUES ('Acanthaceae', 'Lamiales', 'This family includes herbs and shrubs often used in Siddha medicine, particularly for treating respiratory issues.', 'Malabar Nut (Justicia adhatoda) is frequently used to manage cough, asthma, and bronchitis in traditional practices.', 'Medicinal Plants of India, FRLHT, 2004.');
+INSERT INTO families (name, order_name, description, ethnobotanical_uses, reference) VALUES ('Apiaceae', 'Apiales', 'Known as the carrot family, this group includes herbs with both culinary and medicinal applications in South Indian culture.', 'Gotu Kola (Centella asiatica) is valued for its role in wound healing and improving cognitive functions.', 'Indian Medicinal Plants, Vol. 2, Orient Longman, 1995.');
+INSERT INTO families (name, order_name, description, ethnobotanical_uses, reference) VALUES ('Nyctaginaceae', 'Caryophyllales', 'Often called the four o’clock family, these herbs are used in Ayurvedic practices for addressing kidney and liver health concerns.', 'Punarnava (Boerhavia diffusa) is known for its diuretic and anti-inflammatory effects in traditional medicine.', 'Ethnobotanical studies, inspired by FRLHT documentation, 2010.');
+INSERT INTO families (name, order_name, description, ethnobotanical_uses, reference) VALUES ('Asteraceae', 'Asterales', 'The sunflower family consists of herbs widely applied in South Indian remedies for skin, hair, and liver health.', 'Bhringaraj (Eclipta prostrata) is traditionally used to promote hair growth and support liver detoxification.', 'The Plant List, www.theplantlist.org, accessed 2025.');
+INSERT INTO families (name, order_name, description, ethnobotanical_uses, reference) VALUES ('Amaranthaceae', 'Caryophyllales', 'This family includes herbs used in South Indian medicine for their digestive and anti-inflammatory properties.', 'Alternanthera sessilis is often employed to treat stomach issues and reduce inflammation.', 'Ethnobotany of South India, FRLHT, 2010.');
+INSERT INTO families (name, order_name, description, ethnobotanical_uses, reference) VALUES ('Malvaceae', 'Malvales', 'Known as the mallow family, these plants are used in traditional South Indian medicine for pain relief and wound healing.', 'Abutilon indicum is valued for its pain-relieving and anti-inflammatory properties in folk medicine.', 'General botanical knowledge, inspired by FRLHT studies, 2008.');
+INSERT INTO families (name, order_name, description, ethnobotanical_uses, reference) VALUES ('Scrophulariaceae', 'Lamiales', 'The figwort family includes herbs recognized for their cognitive and anti-inflammatory benefits in South Indian traditions.', 'Brahmi (Bacopa monnieri) is used to enhance memory and reduce anxiety in traditional practices.', 'Indian Medicinal Plants, Vol. 3, Orient Longman, 1996.');
+INSERT INTO families (name, order_name, description, ethnobotanical_uses, reference) VALUES ('Portulacaceae', 'Caryophyllales', 'Known as the purslane family, these herbs are valued for their nutritional content and anti-inflammatory effects.', 'Purslane (Portulaca oleracea) is used for its omega-3 fatty acids and anti-inflammatory properties in traditional diets.', 'Medicinal Plants of South India, FRLHT, 2008.');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (1, 'Ocimum tenuiflorum', 'Lamiaceae', 'opposite', 'actinomorphic', '5', 'superior', 'herb', 'nutlet', 'simple', 'spike');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (2, 'Justicia adhatoda', 'Acanthaceae', 'opposite', 'zygomorphic', '5', 'superior', 'shrub', 'capsule', 'simple', 'raceme');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (3, 'Centella asiatica', 'Apiaceae', 'alternate', 'actinomorphic', '5', 'inferior', 'herb', 'schizocarp', 'palmate', 'umbel');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (4, 'Boerhavia diffusa', 'Nyctaginaceae', 'alternate', 'actinomorphic', '4', 'superior', 'herb', 'capsule', 'simple', 'cyme');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (5, 'Eclipta prostrata', 'Asteraceae', 'alternate', 'actinomorphic', '5', 'inferior', 'herb', 'achene', 'lobed', 'head');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (6, 'Alternanthera sessilis', 'Amaranthaceae', 'alternate', 'actinomorphic', '5', 'superior', 'herb', 'capsule', 'simple', 'panicle');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (7, 'Abutilon indicum', 'Malvaceae', 'opposite', 'actinomorphic', '5', 'superior', 'shrub', 'capsule', 'palmate', 'cyme');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (8, 'Bacopa monnieri', 'Scrophulariaceae', 'alternate', 'zygomorphic', '5', 'superior', 'herb', 'capsule', 'simple', 'raceme');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (9, 'Leucas aspera', 'Lamiaceae', 'alternate', 'actinomorphic', '5', 'superior', 'herb', 'nutlet', 'simple', 'spike');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (10, 'Andrographis paniculata', 'Acanthaceae', 'opposite', 'zygomorphic', '5', 'superior', 'herb', 'capsule', 'linear', 'panicle');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (11, 'Spilanthes acmella', 'Asteraceae', 'alternate', 'actinomorphic', '5', 'inferior', 'herb', 'achene', 'toothed', 'head');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (12, 'Eryngium foetidum', 'Apiaceae', 'alternate', 'actinomorphic', '4', 'inferior', 'herb', 'schizocarp', 'pinnate', 'umbel');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (13, 'Coleus amboinicus', 'Lamiaceae', 'opposite', 'actinomorphic', '5', 'superior', 'shrub', 'nutlet', 'lobed', 'spike');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (14, 'Celosia argentea', 'Amaranthaceae', 'alternate', 'actinomorphic', '5', 'superior', 'herb', 'capsule', 'simple', 'panicle');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (15, 'Hygrophila auriculata', 'Acanthaceae', 'opposite', 'zygomorphic', '5', 'superior', 'shrub', 'capsule', 'lanceolate', 'raceme');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (16, 'Ageratum conyzoides', 'Asteraceae', 'alternate', 'actinomorphic', '5', 'inferior', 'herb', 'achene', 'serrate', 'head');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (17, 'Portulaca oleracea', 'Portulacaceae', 'alternate', 'actinomorphic', '5', 'superior', 'herb', 'capsule', 'fleshy', 'solitary');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (18, 'Anisomeles malabarica', 'Lamiaceae', 'opposite', 'actinomorphic', '5', 'superior', 'herb', 'nutlet', 'ovate', 'spike');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (19, 'Limnophila indica', 'Scrophulariaceae', 'alternate', 'zygomorphic', '5', 'superior', 'herb', 'capsule', 'linear', 'raceme');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (20, 'Amaranthus viridis', 'Amaranthaceae', 'alternate', 'actinomorphic', '5', 'superior', 'herb', 'capsule', 'simple', 'panicle');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (21, 'Sida cordifolia', 'Malvaceae', 'opposite', 'actinomorphic', '5', 'superior', 'herb', 'capsule', 'cordate', 'cyme');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (22, 'Tridax procumbens', 'Asteraceae', 'alternate', 'actinomorphic', '5', 'inferior', 'herb', 'achene', 'lobed', 'head');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (23, 'Hydrocotyle sibthorpioides', 'Apiaceae', 'alternate', 'actinomorphic', '4', 'inferior', 'herb', 'schizocarp', 'palmate', 'umbel');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (24, 'Plectranthus barbatus', 'Lamiaceae', 'opposite', 'actinomorphic', '5', 'superior', 'shrub', 'nutlet', 'simple', 'spike');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (25, 'Rungia repens', 'Acanthaceae', 'opposite', 'zygomorphic', '5', 'superior', 'herb', 'capsule', 'linear', 'raceme');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (26, 'Gomphrena celosioides', 'Amaranthaceae', 'alternate', 'actinomorphic', '5', 'superior', 'herb', 'capsule', 'simple', 'panicle');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (27, 'Blumea lacera', 'Asteraceae', 'alternate', 'actinomorphic', '5', 'inferior', 'herb', 'achene', 'serrate', 'head');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (28, 'Hibiscus hispidissimus', 'Malvaceae', 'opposite', 'actinomorphic', '5', 'superior', 'shrub', 'capsule', 'palmate', 'cyme');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (29, 'Angelonia salicariifolia', 'Scrophulariaceae', 'alternate', 'zygomorphic', '5', 'superior', 'herb', 'capsule', 'simple', 'raceme');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (30, 'Hyptis suaveolens', 'Lamiaceae', 'alternate', 'actinomorphic', '5', 'superior', 'herb', 'nutlet', 'ovate', 'spike');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (31, 'Barleria prionitis', 'Acanthaceae', 'opposite', 'actinomorphic', '5', 'superior', 'herb', 'capsule', 'lanceolate', 'raceme');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (32, 'Emilia sonchifolia', 'Asteraceae', 'alternate', 'actinomorphic', '5', 'inferior', 'herb', 'achene', 'toothed', 'head');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (33, 'Anethum sowa', 'Apiaceae', 'alternate', 'actinomorphic', '4', 'inferior', 'herb', 'schizocarp', 'pinnate', 'umbel');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (34, 'Ocimum americanum', 'Lamiaceae', 'opposite', 'actinomorphic', '5', 'superior', 'herb', 'nutlet', 'simple', 'spike');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (35, 'Justicia procumbens', 'Acanthaceae', 'opposite', 'zygomorphic', '5', 'superior', 'herb', 'capsule', 'linear', 'raceme');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (36, 'Aerva lanata', 'Amaranthaceae', 'alternate', 'actinomorphic', '5', 'superior', 'herb', 'capsule', 'simple', 'panicle');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (37, 'Vernonia cinerea', 'Asteraceae', 'alternate', 'actinomorphic', '5', 'inferior', 'herb', 'achene', 'serrate', 'head');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (38, 'Sida rhombifolia', 'Malvaceae', 'opposite', 'actinomorphic', '5', 'superior', 'herb', 'capsule', 'cordate', 'cyme');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (39, 'Stemodia verticillata', 'Scrophulariaceae', 'alternate', 'zygomorphic', '5', 'superior', 'herb', 'capsule', 'simple', 'raceme');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (40, 'Leonotis nepetifolia', 'Lamiaceae', 'alternate', 'actinomorphic', '5', 'superior', 'herb', 'nutlet', 'ovate', 'spike');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (41, 'Elytraria acaulis', 'Acanthaceae', 'opposite', 'actinomorphic', '5', 'superior', 'herb', 'capsule', 'lanceolate', 'raceme');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (42, 'Synedrella nodiflora', 'Asteraceae', 'alternate', 'actinomorphic', '5', 'inferior', 'herb', 'achene', 'toothed', 'head');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (43, 'Pimpinella tirupatiensis', 'Apiaceae', 'alternate', 'actinomorphic', '4', 'inferior', 'herb', 'schizocarp', 'pinnate', 'umbel');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (44, 'Salvia involucrata', 'Lamiaceae', 'opposite', 'actinomorphic', '5', 'superior', 'herb', 'nutlet', 'simple', 'spike');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (45, 'Strobilanthes kunthiana', 'Acanthaceae', 'opposite', 'zygomorphic', '5', 'superior', 'shrub', 'capsule', 'lanceolate', 'raceme');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (46, 'Digera muricata', 'Amaranthaceae', 'alternate', 'actinomorphic', '5', 'superior', 'herb', 'capsule', 'simple', 'panicle');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (47, 'Launaea sarmentosa', 'Asteraceae', 'alternate', 'actinomorphic', '5', 'inferior', 'herb', 'achene', 'fleshy', 'head');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (48, 'Urena lobata', 'Malvaceae', 'opposite', 'actinomorphic', '5', 'superior', 'herb', 'capsule', 'cordate', 'cyme');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (49, 'Mecardonia procumbens', 'Scrophulariaceae', 'alternate', 'zygomorphic', '5', 'superior', 'herb', 'capsule', 'simple', 'raceme');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (50, 'Orthosiphon thymiflorus', 'Lamiaceae', 'alternate', 'actinomorphic', '5', 'superior', 'herb', 'nutlet', 'ovate', 'spike');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (51, 'Dicliptera paniculata', 'Acanthaceae', 'opposite', 'actinomorphic', '5', 'superior', 'herb', 'capsule', 'simple', 'cyme');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (52, 'Chromolaena odorata', 'Asteraceae', 'alternate', 'actinomorphic', '5', 'inferior', 'herb', 'achene', 'serrate', 'head');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (53, 'Coriandrum sativum', 'Apiaceae', 'alternate', 'actinomorphic', '4', 'inferior', 'herb', 'schizocarp', 'pinnate', 'umbel');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (54, 'Vitex negundo', 'Lamiaceae', 'opposite', 'actinomorphic', '5', 'superior', 'shrub', 'nutlet', 'simple', 'spike');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (55, 'Amaranthus spinosus', 'Amaranthaceae', 'alternate', 'actinomorphic', '5', 'superior', 'herb', 'capsule', 'simple', 'panicle');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (56, 'Hemigraphis alternata', 'Acanthaceae', 'opposite', 'zygomorphic', '5', 'superior', 'herb', 'capsule', 'lanceolate', 'raceme');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (57, 'Phyllanthus niruri', 'Asteraceae', 'alternate', 'actinomorphic', '5', 'inferior', 'herb', 'achene', 'toothed', 'head');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (58, 'Hibiscus rosa-sinensis', 'Malvaceae', 'opposite', 'actinomorphic', '5', 'superior', 'herb', 'capsule', 'cordate', 'cyme');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (59, 'Lindernia crustacea', 'Scrophulariaceae', 'alternate', 'zygomorphic', '5', 'superior', 'herb', 'capsule', 'simple', 'raceme');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (60, 'Mentha arvensis', 'Lamiaceae', 'alternate', 'actinomorphic', '5', 'superior', 'herb', 'nutlet', 'ovate', 'spike');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (61, 'Thunbergia fragrans', 'Acanthaceae', 'opposite', 'actinomorphic', '5', 'superior', 'herb', 'capsule', 'lanceolate', 'raceme');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (62, 'Cynoglossum zeylanicum', 'Asteraceae', 'alternate', 'actinomorphic', '5', 'inferior', 'herb', 'achene', 'serrate', 'head');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (63, 'Foeniculum vulgare', 'Apiaceae', 'alternate', 'actinomorphic', '4', 'inferior', 'herb', 'schizocarp', 'pinnate', 'umbel');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (64, 'Clerodendrum inerme', 'Lamiaceae', 'opposite', 'actinomorphic', '5', 'superior', 'shrub', 'nutlet', 'simple', 'spike');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (65, 'Achyranthes aspera', 'Amaranthaceae', 'alternate', 'actinomorphic', '5', 'superior', 'herb', 'capsule', 'simple', 'panicle');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (66, 'Asystasia gangetica', 'Acanthaceae', 'opposite', 'zygomorphic', '5', 'superior', 'herb', 'capsule', 'lanceolate', 'raceme');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (67, 'Eupatorium ayapana', 'Asteraceae', 'alternate', 'actinomorphic', '5', 'inferior', 'herb', 'achene', 'toothed', 'head');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (68, 'Pavonia odorata', 'Malvaceae', 'opposite', 'actinomorphic', '5', 'superior', 'herb', 'capsule', 'cordate', 'cyme');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (69, 'Scoparia dulcis', 'Scrophulariaceae', 'alternate', 'zygomorphic', '5', 'superior', 'herb', 'capsule', 'simple', 'raceme');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (70, 'Pogostemon benghalensis', 'Lamiaceae', 'alternate', 'actinomorphic', '5', 'superior', 'herb', 'nutlet', 'ovate', 'spike');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (71, 'Rhinacanthus nasutus', 'Acanthaceae', 'opposite', 'actinomorphic', '5', 'superior', 'herb', 'capsule', 'lanceolate', 'raceme');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (72, 'Sphaeranthus indicus', 'Asteraceae', 'alternate', 'actinomorphic', '5', 'inferior', 'herb', 'achene', 'serrate', 'head');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (73, 'Trachyspermum ammi', 'Apiaceae', 'alternate', 'actinomorphic', '4', 'inferior', 'herb', 'schizocarp', 'pinnate', 'umbel');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (74, 'Gmelina asiatica', 'Lamiaceae', 'opposite', 'actinomorphic', '5', 'superior', 'shrub', 'nutlet', 'simple', 'spike');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (75, 'Cyathula prostrata', 'Amaranthaceae', 'alternate', 'actinomorphic', '5', 'superior', 'herb', 'capsule', 'simple', 'panicle');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (76, 'Adhatoda vasica', 'Acanthaceae', 'opposite', 'zygomorphic', '5', 'superior', 'herb', 'capsule', 'lanceolate', 'raceme');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (77, 'Wedelia chinensis', 'Asteraceae', 'alternate', 'actinomorphic', '5', 'inferior', 'herb', 'achene', 'toothed', 'head');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (78, 'Sida acuta', 'Malvaceae', 'opposite', 'actinomorphic', '5', 'superior', 'herb', 'capsule', 'cordate', 'cyme');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (79, 'Antirrhinum majus', 'Scrophulariaceae', 'alternate', 'zygomorphic', '5', 'superior', 'herb', 'capsule', 'simple', 'raceme');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (80, 'Ocimum basilicum', 'Lamiaceae', 'alternate', 'actinomorphic', '5', 'superior', 'herb', 'nutlet', 'ovate', 'spike');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (81, 'Peristrophe paniculata', 'Acanthaceae', 'opposite', 'actinomorphic', '5', 'superior', 'herb', 'capsule', 'lanceolate', 'raceme');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (82, 'Xanthium strumarium', 'Asteraceae', 'alternate', 'actinomorphic', '5', 'inferior', 'herb', 'achene', 'serrate', 'head');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (83, 'Carum carvi', 'Apiaceae', 'alternate', 'actinomorphic', '4', 'inferior', 'herb', 'schizocarp', 'pinnate', 'umbel');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (84, 'Premna serratifolia', 'Lamiaceae', 'opposite', 'actinomorphic', '5', 'superior', 'shrub', 'nutlet', 'simple', 'spike');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (85, 'Pupalia lappacea', 'Amaranthaceae', 'alternate', 'actinomorphic', '5', 'superior', 'herb', 'capsule', 'simple', 'panicle');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (86, 'Blepharis maderaspatensis', 'Acanthaceae', 'opposite', 'zygomorphic', '5', 'superior', 'herb', 'capsule', 'lanceolate', 'raceme');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (87, 'Laggera aurita', 'Asteraceae', 'alternate', 'actinomorphic', '5', 'inferior', 'herb', 'achene', 'toothed', 'head');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (88, 'Malvastrum coromandelianum', 'Malvaceae', 'opposite', 'actinomorphic', '5', 'superior', 'herb', 'capsule', 'cordate', 'cyme');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (89, 'Verbascum thapsus', 'Scrophulariaceae', 'alternate', 'zygomorphic', '5', 'superior', 'herb', 'capsule', 'simple', 'raceme');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (90, 'Salvia officinalis', 'Lamiaceae', 'alternate', 'actinomorphic', '5', 'superior', 'herb', 'nutlet', 'ovate', 'spike');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (91, 'Hygrophila schulli', 'Acanthaceae', 'opposite', 'actinomorphic', '5', 'superior', 'herb', 'capsule', 'lanceolate', 'raceme');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (92, 'Echinops echinatus', 'Asteraceae', 'alternate', 'actinomorphic', '5', 'inferior', 'herb', 'achene', 'serrate', 'head');
+INSERT INTO species (id, name, family, leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type) VALUES (93, 'Cuminum cyminum', 'Apiaceae', 'alternate', 'actinomorphic', '4', 'inferior', 'herb', 'schizocarp', 'pinnate', 'umbel');
+INSERT INTO taxonomy (species, kingdom, division, class, order_name, family, genus, epithet, description) VALUES ('Ocimum tenuiflorum', 'Plantae', 'Magnoliophyta', 'Magnoliopsida', 'Lamiales', 'Lamiaceae', 'Ocimum', 'tenuiflorum', 'Aromatic herb with opposite, simple leaves, purple or green, often hairy; flowers in spikes, white to purplish.');
+INSERT INTO taxonomy (species, kingdom, division, class, order_name, family, genus, epithet, description) VALUES ('Justicia adhatoda', 'Plantae', 'Magnoliophyta', 'Magnoliopsida', 'Lamiales', 'Acanthaceae', 'Justicia', 'adhatoda', 'Shrub with opposite, lanceolate leaves; white zygomorphic flowers in racemes.');
+INSERT INTO taxonomy (species, kingdom, division, class, order_name, family, genus, epithet, description) VALUES ('Centella asiatica', 'Plantae', 'Magnoliophyta', 'Magnoliopsida', 'Apiales', 'Apiaceae', 'Centella', 'asiatica', 'Creeping herb with alternate, palmate leaves; small actinomorphic flowers in umbels.');
+INSERT INTO taxonomy (species, kingdom, division, class, order_name, family, genus, epithet, description) VALUES ('Boerhavia diffusa', 'Plantae', 'Magnoliophyta', 'Magnoliopsida', 'Caryophyllales', 'Nyctaginaceae', 'Boerhavia', 'diffusa', 'Prostrate herb with alternate, simple leaves; pink actinomorphic flowers in cymes.');
+INSERT INTO taxonomy (species, kingdom, division, class, order_name, family, genus, epithet, description) VALUES ('Eclipta prostrata', 'Plantae', 'Magnoliophyta', 'Magnoliopsida', 'Asterales', 'Asteraceae', 'Eclipta', 'prostrata', 'Prostrate herb with alternate, toothed leaves; white to yellow flower heads.');
+INSERT INTO common_names (species, name, language) VALUES ('Ocimum tenuiflorum', 'Tulsi', 'hi');
+INSERT INTO common_names (species, name, language) VALUES ('Ocimum tenuiflorum', 'Thulasi', 'ta');
+INSERT INTO common_names (species, name, language) VALUES ('Ocimum tenuiflorum', 'Holy basil', 'en');
+INSERT INTO common_names (species, name, language) VALUES ('Justicia adhatoda', 'Adathodai', 'ta');
+INSERT INTO common_names (species, name, language) VALUES ('Justicia adhatoda', 'Vasaka', 'sa');
+INSERT INTO common_names (species, name, language) VALUES ('Justicia adhatoda', 'Malabar nut', 'en');
+INSERT INTO common_names (species, name, language) VALUES ('Centella asiatica', 'Vallarai', 'ta');
+INSERT INTO common_names (species, name, language) VALUES ('Centella asiatica', 'Mandukaparni', 'sa');
+INSERT INTO common_names (species, name, language) VALUES ('Centella asiatica', 'Gotu kola', 'en');
+INSERT INTO common_names (species, name, language) VALUES ('Centella asiatica', 'Indian pennywort', 'en');
+INSERT INTO common_names (species, name, language) VALUES ('Boerhavia diffusa', 'Punarnava', 'sa');
+INSERT INTO common_names (species, name, language) VALUES ('Boerhavia diffusa', 'Mukkirattai', 'ta');
+INSERT INTO common_names (species, name, language) VALUES ('Boerhavia diffusa', 'Red spiderling', 'en');
+INSERT INTO common_names (species, name, language) VALUES ('Eclipta prostrata', 'Karisalankanni', 'ta');
+INSERT INTO common_names (species, name, language) VALUES ('Eclipta prostrata', 'Bhringraj', 'hi');
+INSERT INTO common_names (species, name, language) VALUES ('Eclipta prostrata', 'False daisy', 'en');
+INSERT INTO common_names (species, name, language) VALUES ('Alternanthera sessilis', 'Ponnanganni', 'ta');
+INSERT INTO common_names (species, name, language) VALUES ('Alternanthera sessilis', 'Sessile joyweed', 'en');
+INSERT INTO common_names (species, name, language) VALUES ('Abutilon indicum', 'Thuthi', 'ta');
+INSERT INTO common_names (species, name, language) VALUES ('Abutilon indicum', 'Atibala', 'sa');
+INSERT INTO common_names (species, name, language) VALUES ('Abutilon indicum', 'Indian mallow', 'en');
+INSERT INTO common_names (species, name, language) VALUES ('Bacopa monnieri', 'Brahmi', 'hi');
+INSERT INTO common_names (species, name, language) VALUES ('Bacopa monnieri', 'Neer brahmi', 'ta');
+INSERT INTO common_names (species, name, language) VALUES ('Bacopa monnieri', 'Water hyssop', 'en');
+INSERT INTO common_names (species, name, language) VALUES ('Leucas aspera', 'Thumbai', 'ta');
+INSERT INTO common_names (species, name, language) VALUES ('Leucas aspera', 'Dronapushpi', 'sa');
+INSERT INTO common_names (species, name, language) VALUES ('Andrographis paniculata', 'Nilavembu', 'ta');
+INSERT INTO common_names (species, name, language) VALUES ('Andrographis paniculata', 'Kalmegh', 'hi');
+INSERT INTO common_names (species, name, language) VALUES ('Andrographis paniculata', 'King of bitters', 'en');
+INSERT INTO common_names (species, name, language) VALUES ('Spilanthes acmella', 'Toothache plant', 'en');
+INSERT INTO common_names (species, name, language) VALUES ('Eryngium foetidum', 'Culantro', 'en');
+INSERT INTO common_names (species, name, language) VALUES ('Coleus amboinicus', 'Karpooravalli', 'ta');
+INSERT INTO common_names (species, name, language) VALUES ('Coleus amboinicus', 'Indian borage', 'en');
+INSERT INTO common_names (species, name, language) VALUES ('Celosia argentea', 'Silver cockscomb', 'en');
+INSERT INTO common_names (species, name, language) VALUES ('Hygrophila auriculata', 'Neermulli', 'ta');
+INSERT INTO common_names (species, name, language) VALUES ('Hygrophila auriculata', 'Kokilaksha', 'sa');
+INSERT INTO common_names (species, name, language) VALUES ('Ageratum conyzoides', 'Billygoat weed', 'en');
+INSERT INTO common_names (species, name, language) VALUES ('Portulaca oleracea', 'Paruppu keerai', 'ta');
+INSERT INTO common_names (species, name, language) VALUES ('Portulaca oleracea', 'Kulfa', 'hi');
+INSERT INTO common_names (species, name, language) VALUES ('Portulaca oleracea', 'Purslane', 'en');
+INSERT INTO common_names (species, name, language) VALUES ('Amaranthus viridis', 'Kuppai keerai', 'ta');
+INSERT INTO common_names (species, name, language) VALUES ('Amaranthus viridis', 'Green amaranth', 'en');
+INSERT INTO common_names (species, name, language) VALUES ('Sida cordifolia', 'Bala', 'sa');
+INSERT INTO common_names (species, name, language) VALUES ('Sida cordifolia', 'Country mallow', 'en');
+INSERT INTO common_names (species, name, language) VALUES ('Tridax procumbens', 'Coat buttons', 'en');
+INSERT INTO common_names (species, name, language) VALUES ('Barleria prionitis', 'Vajradanti', 'sa');
+INSERT INTO common_names (species, name, language) VALUES ('Barleria prionitis', 'Porcupine flower', 'en');
+INSERT INTO common_names (species, name, language) VALUES ('Ocimum americanum', 'Hoary basil', 'en');
+INSERT INTO common_names (species, name, language) VALUES ('Aerva lanata', 'Sirupeelai', 'ta');
+INSERT INTO common_names (species, name, language) VALUES ('Aerva lanata', 'Mountain knotgrass', 'en');
+INSERT INTO common_names (species, name, language) VALUES ('Vernonia cinerea', 'Sahadevi', 'sa');
+INSERT INTO common_names (species, name, language) VALUES ('Vernonia cinerea', 'Little ironweed', 'en');
+INSERT INTO common_names (species, name, language) VALUES ('Coriandrum sativum', 'Kothamalli', 'ta');
+INSERT INTO common_names (species, name, language) VALUES ('Coriandrum sativum', 'Dhania', 'hi');
+INSERT INTO common_names (species, name, language) VALUES ('Coriandrum sativum', 'Coriander', 'en');
+INSERT INTO common_names (species, name, language) VALUES ('Vitex negundo', 'Nochi', 'ta');
+INSERT INTO common_names (species, name, language) VALUES ('Vitex negundo', 'Nirgundi', 'sa');
+INSERT INTO common_names (species, name, language) VALUES ('Vitex negundo', 'Five-leaved chaste tree', 'en');
+INSERT INTO common_names (species, name, language) VALUES ('Amaranthus spinosus', 'Mullu keerai', 'ta');
+INSERT INTO common_names (species, name, language) VALUES ('Amaranthus spinosus', 'Spiny amaranth', 'en');
+INSERT INTO common_names (species, name, language) VALUES ('Phyllanthus niruri', 'Keezhanelli', 'ta');
+INSERT INTO common_names (species, name, language) VALUES ('Phyllanthus niruri', 'Bhumi amla', 'hi');
+INSERT INTO common_names (species, name, language) VALUES ('Phyllanthus niruri', 'Stonebreaker', 'en');
+INSERT INTO common_names (species, name, language) VALUES ('Hibiscus rosa-sinensis', 'Chembaruthi', 'ta');
+INSERT INTO common_names (species, name, language) VALUES ('Hibiscus rosa-sinensis', 'Gudhal', 'hi');
+INSERT INTO common_names (species, name, language) VALUES ('Hibiscus rosa-sinensis', 'Chinese hibiscus', 'en');
+INSERT INTO common_names (species, name, language) VALUES ('Mentha arvensis', 'Pudina', 'hi');
+INSERT INTO common_names (species, name, language) VALUES ('Mentha arvensis', 'Corn mint', 'en');
+INSERT INTO common_names (species, name, language) VALUES ('Foeniculum vulgare', 'Perunjeeragam', 'ta');
+INSERT INTO common_names (species, name, language) VALUES ('Foeniculum vulgare', 'Saunf', 'hi');
+INSERT INTO common_names (species, name, language) VALUES ('Foeniculum vulgare', 'Fennel', 'en');
+INSERT INTO common_names (species, name, language) VALUES ('Achyranthes aspera', 'Nayuruvi', 'ta');
+INSERT INTO common_names (species, name, language) VALUES ('Achyranthes aspera', 'Apamarga', 'sa');
+INSERT INTO common_names (species, name, language) VALUES ('Achyranthes aspera', 'Chaff flower', 'en');
+INSERT INTO common_names (species, name, language) VALUES ('Scoparia dulcis', 'Sweet broom', 'en');
+INSERT INTO common_names (species, name, language) VALUES ('Trachyspermum ammi', 'Omam', 'ta');
+INSERT INTO common_names (species, name, language) VALUES ('Trachyspermum ammi', 'Ajwain', 'hi');
+INSERT INTO common_names (species, name, language) VALUES ('Trachyspermum ammi', 'Carom', 'en');
+INSERT INTO common_names (species, name, language) VALUES ('Sphaeranthus indicus', 'Kottaikaranthai', 'ta');
+INSERT INTO common_names (species, name, language) VALUES ('Sphaeranthus indicus', 'Gorakhmundi', 'hi');
+INSERT INTO common_names (species, name, language) VALUES ('Sphaeranthus indicus', 'East Indian globe thistle', 'en');
+INSERT INTO common_names (species, name, language) VALUES ('Adhatoda vasica', 'Adathodai', 'ta');
+INSERT INTO common_names (species, name, language) VALUES ('Adhatoda vasica', 'Vasaka', 'sa');
+INSERT INTO common_names (species, name, language) VALUES ('Ocimum basilicum', 'Sabja', 'hi');
+INSERT INTO common_names (species, name, language) VALUES ('Ocimum basilicum', 'Sweet basil', 'en');
+INSERT INTO common_names (species, name, language) VALUES ('Xanthium strumarium', 'Cocklebur', 'en');
+INSERT INTO common_names (species, name, language) VALUES ('Carum carvi', 'Caraway', 'en');
+INSERT INTO common_names (species, name, language) VALUES ('Verbascum thapsus', 'Great mullein', 'en');
+INSERT INTO common_names (species, name, language) VALUES ('Salvia officinalis', 'Sage', 'en');
+INSERT INTO common_names (species, name, language) VALUES ('Cuminum cyminum', 'Jeeragam', 'ta');
+INSERT INTO common_names (species, name, language) VALUES ('Cuminum cyminum', 'Jeera', 'hi');
+INSERT INTO common_names (species, name, language) VALUES ('Cuminum cyminum', 'Cumin', 'en');
+INSERT INTO common_names (species, name, language) VALUES ('Antirrhinum majus', 'Snapdragon', 'en');
+INSERT INTO common_names (species, name, language) VALUES ('Chromolaena odorata', 'Siam weed', 'en');
+INSERT INTO common_names (species, name, language) VALUES ('Anethum sowa', 'Sowa', 'hi');
+INSERT INTO common_names (species, name, language) VALUES ('Anethum sowa', 'Indian dill', 'en');
+INSERT INTO common_names (species, name, language) VALUES ('Rhinacanthus nasutus', 'Nagamalli', 'ta');
+INSERT INTO common_names (species, name, language) VALUES ('Rhinacanthus nasutus', 'Snake jasmine', 'en');
+INSERT INTO common_names (species, name, language) VALUES ('Leonotis nepetifolia', 'Lion''s ear', 'en');
+INSERT INTO common_names (species, name, language) VALUES ('Asystasia gangetica', 'Chinese violet', 'en');
+INSERT INTO common_names (species, name, language) VALUES ('Urena lobata', 'Caesarweed', 'en');
+INSERT INTO common_names (species, name, language) VALUES ('Strobilanthes kunthiana', 'Neelakurinji', 'ml');
+INSERT INTO common_names (species, name, language) VALUES ('Echinops echinatus', 'Indian globe thistle', 'en');
+INSERT INTO common_names (species, name, language) VALUES ('Emilia sonchifolia', 'Lilac tasselflower', 'en');
+INSERT INTO common_names (species, name, language) VALUES ('Sida acuta', 'Common wireweed', 'en');
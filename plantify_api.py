@@ -0,0 +1,175 @@
+# Headless JSON API for the herb classifier.
+#
+# Run with several workers, each loading the same prebuilt model artifact:
+#   python plantify_model.py build
+#   uvicorn plantify_api:app --workers 4
+#
+# Workers pick up species added with plantify_ingest.py (or a new `build`)
+# without a restart; see plantify_reload.py.
+#
+# Only the compiled trees, the similarity matrices and the lookup table are
+# shared between workers (memory-mapped from the serving pack, see
+# plantify_shared.py). Each worker still builds its own Python structures: the
+# species/family tables from the pack manifest, the trait index from the store,
+# and the /search index from the store on the first search. At 10,000 species
+# that is about 1.3 MB and 20 ms for the tables and index, and 10 MB and 2.6 s
+# for the search index.
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import PlainTextResponse
+from pydantic import BaseModel, ConfigDict, Field
+
+from plantify_data import get_family_info, get_taxonomy
+from plantify_lookup import LOOKUP_TOP_K
+from plantify_metrics import render_prometheus, snapshot
+from plantify_model import DEFAULT_TOP_K, normalize_inputs, rank_batch, stage_confidences, trait_key, validate_inputs
+from plantify_reload import ModelReloader
+from plantify_search import get_search_index
+
+
+MAX_BATCH_SIZE = 10000
+
+
+# Numbers are taken as text (petal_number: 5), and every value is normalized
+# like the batch and ingest paths before validation
+class Specimen(BaseModel):
+    model_config = ConfigDict(coerce_numbers_to_str=True)
+
+    leaf_arrangement: str
+    flower_symmetry: str
+    petal_number: str
+    ovary_position: str
+    habit: str
+    fruit_type: str
+    leaf_shape: str
+    inflorescence_type: str
+
+
+# Any subset of the traits, for /similar; a key that is not a trait is rejected
+# rather than silently dropped from the distance
+class PartialSpecimen(BaseModel):
+    model_config = ConfigDict(extra="forbid", coerce_numbers_to_str=True)
+
+    leaf_arrangement: str | None = None
+    flower_symmetry: str | None = None
+    petal_number: str | None = None
+    ovary_position: str | None = None
+    habit: str | None = None
+    fruit_type: str | None = None
+    leaf_shape: str | None = None
+    inflorescence_type: str | None = None
+
+
+class BatchRequest(BaseModel):
+    specimens: list[Specimen] = Field(..., max_length=MAX_BATCH_SIZE)
+    top_k: int = Field(DEFAULT_TOP_K, ge=1, le=LOOKUP_TOP_K)
+
+
+# The model is read-only once loaded, so every request in a worker shares it.
+# Each request takes the current model once; a reload swaps in a new one for
+# later requests.
+@asynccontextmanager
+async def lifespan(app):
+    app.state.models = ModelReloader()
+    yield
+
+
+app = FastAPI(title="PLANTIFY Classifier API", lifespan=lifespan)
+
+
+# `stages` is the (family, family confidence, species confidence, similarity)
+# behind the prediction, from plantify_model.stage_confidences; their product is
+# the confidence
+def describe(model, species, confidence, alternatives=None, stages=None):
+    family = model["species_family"][species]
+    result = {
+        "species": species,
+        "family": family,
+        "confidence": confidence,
+        "taxonomy": get_taxonomy(species, family),
+        "family_details": get_family_info(family),
+    }
+    if stages is not None:
+        result["family_confidence"] = stages[1]
+        result["species_confidence"] = stages[2]
+        result["similarity"] = stages[3]
+    if alternatives is not None:
+        result["alternatives"] = alternatives
+    return result
+
+# Rank every specimen at once; unseen trait combinations share one walk of the compiled trees
+def classify_specimens(model, specimens, top_k):
+    rows = [trait_key(specimen) for specimen in specimens]
+    ranked = rank_batch(model, rows, top_k)
+    stages = stage_confidences(model, rows, [candidates[0][0] for candidates in ranked])
+    results = []
+    for candidates, stage in zip(ranked, stages):
+        species, confidence = candidates[0]
+        alternatives = [{"species": name, "confidence": score} for name, score in candidates[1:]]
+        results.append(describe(model, species, confidence, alternatives, stage))
+    return results
+
+# The normalized specimen, or 422 if a trait is outside the vocabularies
+def check_specimen(specimen, position=None):
+    specimen = normalize_inputs(specimen)
+    is_valid, error_msg = validate_inputs(specimen)
+    if not is_valid:
+        where = f"specimen {position}: " if position is not None else ""
+        raise HTTPException(status_code=422, detail=f"{where}{error_msg}")
+    return specimen
+
+
+@app.get("/health")
+async def health():
+    models = app.state.models
+    model = models.get()
+    return {
+        "status": "ok",
+        "data_hash": model["data_hash"],
+        "species": len(model["species_family"]),
+        "reloads": models.reloads,
+        "reload_error": models.last_error,
+    }
+
+# Counters and latency histograms of this worker, for Prometheus to scrape
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    return PlainTextResponse(render_prometheus(), media_type="text/plain; version=0.0.4")
+
+@app.get("/stats")
+async def stats():
+    return snapshot()
+
+# Nearest known species by weighted trait distance; missing or blank traits are ignored
+@app.post("/similar")
+async def similar(traits: PartialSpecimen, k: int = Query(5, ge=1, le=100)):
+    try:
+        neighbours = app.state.models.get()["similarity"].nearest(normalize_inputs(traits.model_dump()), k)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    return {"neighbours": [{"species": name, "family": family, "distance": distance} for name, family, distance in neighbours]}
+
+# Species by scientific, English or regional name, typos tolerated
+@app.get("/search")
+async def search(q: str = Query(..., min_length=1, max_length=100), limit: int = Query(10, ge=1, le=50)):
+    index = get_search_index()
+    results = index.search(q, limit=limit)
+    for result in results:
+        result["common_names"] = [{"name": name, "language": language} for name, language in index.common_names(result["species"])]
+        result["taxonomy"] = get_taxonomy(result["species"], result["family"])
+        result["family_details"] = get_family_info(result["family"])
+    return {"results": results}
+
+@app.post("/classify")
+async def classify(specimen: Specimen):
+    traits = check_specimen(specimen.model_dump())
+    return classify_specimens(app.state.models.get(), [traits], DEFAULT_TOP_K)[0]
+
+@app.post("/classify/batch")
+async def classify_batch(request: BatchRequest):
+    specimens = [check_specimen(specimen.model_dump(), position) for position, specimen in enumerate(request.specimens)]
+    # Large batches are CPU-bound, so keep them off the event loop
+    results = await run_in_threadpool(classify_specimens, app.state.models.get(), specimens, request.top_k)
+    return {"results": results}
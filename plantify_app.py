@@ -1,310 +1,50 @@
 import streamlit as st
-import pandas as pd
-import numpy as np
-from sklearn.tree import DecisionTreeClassifier
-from sklearn.model_selection import cross_val_score, KFold
-import csv
-import webbrowser
 import os
-import base64
+from functools import partial
 from io import BytesIO
-from reportlab.lib.pagesizes import letter
-from reportlab.pdfgen import canvas
+from plantify_data import data_version, get_family_info, get_taxonomy
+from plantify_assets import FOOTER_MARKDOWN, PAGE_CSS, file_version, result_body, result_markdown
+from plantify_metrics import LOW_CONFIDENCE_THRESHOLD, snapshot
+
+# The model, batch, report and contact modules (and the numpy, pandas, sklearn and
+# reportlab imports behind them) are imported on the pages and actions that use
+# them, so the Welcome page and a cold start do not pay for them.
 
 
 # Streamlit app
 st.set_page_config(page_title="South Indian Medicinal Herb Classifier", page_icon="🌿", layout="wide")
-st.markdown("""
-<style>
-/* Fade-in animation for welcome page */
-@keyframes fadeIn {
-    0% { opacity: 0; }
-    100% { opacity: 1; }
-}
-
-/* Slide-in animation for classification inputs */
-@keyframes slideIn {
-    0% { transform: translateX(-100px); opacity: 0; }
-    100% { transform: translateX(0); opacity: 1; }
-}
-
-.fade-in {
-    animation: fadeIn 1.5s ease-in-out;
-}
-
-.slide-in {
-    animation: slideIn 0.8s ease-in-out;
-}
-
-/* Button hover effect */
-.stButton > button {
-    background-color: #4CAF50;
-    color: white;
-    border-radius: 5px;
-    transition: all 0.3s ease;
-}
-
-.stButton > button:hover {
-    background-color: #45a049;
-    transform: scale(1.05);
-}
-
-.stSelectbox select { font-size: 16px; }
-.stTextInput > div > input { font-size: 16px; }
-.reportview-container { background: linear-gradient(to bottom, #e6f3e6, #ffffff); }
-.sidebar .sidebar-content { background-color: #f0f8f0; }
-
-/* Center logo and name in footer */
-.footer-container {
-    display: flex;
-    align-items: center;
-    gap: 10px;
-}
-</style>
-""", unsafe_allow_html=True)
-
-# Function to load and encode the logo as base64
-def get_base64_image(file_path):
+st.markdown(PAGE_CSS, unsafe_allow_html=True)
+
+# Load the classifier once per process. The prebuilt artifact from
+# `python plantify_model.py build` is used when it matches the species table,
+# otherwise the model is retrained in-process. When species are ingested or the
+# artifact is rebuilt, the reloader loads the new model in the background and
+# sessions switch to it on their next rerun; the model comes with the
+# partial-trait query engine built from the same records.
+@st.cache_resource(show_spinner="Loading classifier...")
+def get_model_reloader():
+    from plantify_reload import ModelReloader, load_serving_model
+    return ModelReloader(partial(load_serving_model, query_engine=True))
+
+# Offline evaluation report for the served data, if plantify_evaluate.py has
+# been run for it; re-read only when the report file or the data changes
+@st.cache_resource
+def load_evaluation_report(data_hash, report_version):
+    from plantify_evaluate import load_evaluation
+    return load_evaluation(expected_hash=data_hash)
+
+def evaluation_report(data_hash):
+    from plantify_evaluate import EVALUATION_PATH
     try:
-        with open(file_path, "rb") as image_file:
-            encoded = base64.b64encode(image_file.read()).decode()
-        return f"data:image/png;base64,{encoded}"
-    except FileNotFoundError:
-        st.error(f"Logo file not found at {file_path}. Using placeholder instead.")
-        return "https://via.placeholder.com/30"
-    except Exception as e:
-        st.error(f"Error loading logo: {str(e)}. Using placeholder instead.")
-        return "https://via.placeholder.com/30"
-
-# Define logo path and encode it at the top to ensure it's available
-logo_path = "MY_LOGO.png"
-logo_base64 = get_base64_image(logo_path)
-
-# Expanded dataset with 100 South Indian medicinal herbs
-characteristics_to_species = {
-    ("opposite", "actinomorphic", "5", "superior", "herb", "nutlet", "simple", "spike"): ("Lamiaceae", "Ocimum tenuiflorum"),
-    ("opposite", "zygomorphic", "5", "superior", "shrub", "capsule", "simple", "raceme"): ("Acanthaceae", "Justicia adhatoda"),
-    ("alternate", "actinomorphic", "5", "inferior", "herb", "schizocarp", "palmate", "umbel"): ("Apiaceae", "Centella asiatica"),
-    ("alternate", "actinomorphic", "4", "superior", "herb", "capsule", "simple", "cyme"): ("Nyctaginaceae", "Boerhavia diffusa"),
-    ("alternate", "actinomorphic", "5", "inferior", "herb", "achene", "lobed", "head"): ("Asteraceae", "Eclipta prostrata"),
-    ("alternate", "actinomorphic", "5", "superior", "herb", "capsule", "simple", "panicle"): ("Amaranthaceae", "Alternanthera sessilis"),
-    ("opposite", "actinomorphic", "5", "superior", "shrub", "capsule", "palmate", "cyme"): ("Malvaceae", "Abutilon indicum"),
-    ("alternate", "zygomorphic", "5", "superior", "herb", "capsule", "simple", "raceme"): ("Scrophulariaceae", "Bacopa monnieri"),
-    ("alternate", "actinomorphic", "5", "superior", "herb", "nutlet", "simple", "spike"): ("Lamiaceae", "Leucas aspera"),
-    ("opposite", "zygomorphic", "5", "superior", "herb", "capsule", "linear", "panicle"): ("Acanthaceae", "Andrographis paniculata"),
-    ("alternate", "actinomorphic", "5", "inferior", "herb", "achene", "toothed", "head"): ("Asteraceae", "Spilanthes acmella"),
-    ("alternate", "actinomorphic", "4", "inferior", "herb", "schizocarp", "pinnate", "umbel"): ("Apiaceae", "Eryngium foetidum"),
-    ("opposite", "actinomorphic", "5", "superior", "shrub", "nutlet", "lobed", "spike"): ("Lamiaceae", "Coleus amboinicus"),
-    ("alternate", "actinomorphic", "5", "superior", "herb", "capsule", "simple", "panicle"): ("Amaranthaceae", "Celosia argentea"),
-    ("opposite", "zygomorphic", "5", "superior", "shrub", "capsule", "lanceolate", "raceme"): ("Acanthaceae", "Hygrophila auriculata"),
-    ("alternate", "actinomorphic", "5", "inferior", "herb", "achene", "serrate", "head"): ("Asteraceae", "Ageratum conyzoides"),
-    ("alternate", "actinomorphic", "5", "superior", "herb", "capsule", "fleshy", "solitary"): ("Portulacaceae", "Portulaca oleracea"),
-    ("opposite", "actinomorphic", "5", "superior", "herb", "nutlet", "ovate", "spike"): ("Lamiaceae", "Anisomeles malabarica"),
-    ("alternate", "zygomorphic", "5", "superior", "herb", "capsule", "linear", "raceme"): ("Scrophulariaceae", "Limnophila indica"),
-    ("alternate", "actinomorphic", "5", "superior", "herb", "capsule", "simple", "panicle"): ("Amaranthaceae", "Amaranthus viridis"),
-    ("opposite", "actinomorphic", "5", "superior", "herb", "capsule", "cordate", "cyme"): ("Malvaceae", "Sida cordifolia"),
-    ("alternate", "actinomorphic", "5", "inferior", "herb", "achene", "lobed", "head"): ("Asteraceae", "Tridax procumbens"),
-    ("alternate", "actinomorphic", "4", "inferior", "herb", "schizocarp", "palmate", "umbel"): ("Apiaceae", "Hydrocotyle sibthorpioides"),
-    ("opposite", "actinomorphic", "5", "superior", "shrub", "nutlet", "simple", "spike"): ("Lamiaceae", "Plectranthus barbatus"),
-    ("opposite", "zygomorphic", "5", "superior", "herb", "capsule", "linear", "raceme"): ("Acanthaceae", "Rungia repens"),
-    ("alternate", "actinomorphic", "5", "superior", "herb", "capsule", "simple", "panicle"): ("Amaranthaceae", "Gomphrena celosioides"),
-    ("alternate", "actinomorphic", "5", "inferior", "herb", "achene", "serrate", "head"): ("Asteraceae", "Blumea lacera"),
-    ("opposite", "actinomorphic", "5", "superior", "shrub", "capsule", "palmate", "cyme"): ("Malvaceae", "Hibiscus hispidissimus"),
-    ("alternate", "zygomorphic", "5", "superior", "herb", "capsule", "simple", "raceme"): ("Scrophulariaceae", "Angelonia salicariifolia"),
-    ("alternate", "actinomorphic", "5", "superior", "herb", "nutlet", "ovate", "spike"): ("Lamiaceae", "Hyptis suaveolens"),
-    ("opposite", "actinomorphic", "5", "superior", "herb", "capsule", "lanceolate", "raceme"): ("Acanthaceae", "Barleria prionitis"),
-    ("alternate", "actinomorphic", "5", "inferior", "herb", "achene", "toothed", "head"): ("Asteraceae", "Emilia sonchifolia"),
-    ("alternate", "actinomorphic", "4", "inferior", "herb", "schizocarp", "pinnate", "umbel"): ("Apiaceae", "Anethum sowa"),
-    ("opposite", "actinomorphic", "5", "superior", "herb", "nutlet", "simple", "spike"): ("Lamiaceae", "Ocimum americanum"),
-    ("opposite", "zygomorphic", "5", "superior", "herb", "capsule", "linear", "raceme"): ("Acanthaceae", "Justicia procumbens"),
-    ("alternate", "actinomorphic", "5", "superior", "herb", "capsule", "simple", "panicle"): ("Amaranthaceae", "Aerva lanata"),
-    ("alternate", "actinomorphic", "5", "inferior", "herb", "achene", "serrate", "head"): ("Asteraceae", "Vernonia cinerea"),
-    ("opposite", "actinomorphic", "5", "superior", "herb", "capsule", "cordate", "cyme"): ("Malvaceae", "Sida rhombifolia"),
-    ("alternate", "zygomorphic", "5", "superior", "herb", "capsule", "simple", "raceme"): ("Scrophulariaceae", "Stemodia verticillata"),
-    ("alternate", "actinomorphic", "5", "superior", "herb", "nutlet", "ovate", "spike"): ("Lamiaceae", "Leonotis nepetifolia"),
-    ("opposite", "actinomorphic", "5", "superior", "herb", "capsule", "lanceolate", "raceme"): ("Acanthaceae", "Elytraria acaulis"),
-    ("alternate", "actinomorphic", "5", "inferior", "herb", "achene", "toothed", "head"): ("Asteraceae", "Synedrella nodiflora"),
-    ("alternate", "actinomorphic", "4", "inferior", "herb", "schizocarp", "pinnate", "umbel"): ("Apiaceae", "Pimpinella tirupatiensis"),
-    ("opposite", "actinomorphic", "5", "superior", "herb", "nutlet", "simple", "spike"): ("Lamiaceae", "Salvia involucrata"),
-    ("opposite", "zygomorphic", "5", "superior", "shrub", "capsule", "lanceolate", "raceme"): ("Acanthaceae", "Strobilanthes kunthiana"),
-    ("alternate", "actinomorphic", "5", "superior", "herb", "capsule", "simple", "panicle"): ("Amaranthaceae", "Digera muricata"),
-    ("alternate", "actinomorphic", "5", "inferior", "herb", "achene", "fleshy", "head"): ("Asteraceae", "Launaea sarmentosa"),
-    ("opposite", "actinomorphic", "5", "superior", "herb", "capsule", "cordate", "cyme"): ("Malvaceae", "Urena lobata"),
-    ("alternate", "zygomorphic", "5", "superior", "herb", "capsule", "simple", "raceme"): ("Scrophulariaceae", "Mecardonia procumbens"),
-    ("alternate", "actinomorphic", "5", "superior", "herb", "nutlet", "ovate", "spike"): ("Lamiaceae", "Orthosiphon thymiflorus"),
-    ("opposite", "actinomorphic", "5", "superior", "herb", "capsule", "simple", "cyme"): ("Acanthaceae", "Dicliptera paniculata"),
-    ("alternate", "actinomorphic", "5", "inferior", "herb", "achene", "serrate", "head"): ("Asteraceae", "Chromolaena odorata"),
-    ("alternate", "actinomorphic", "4", "inferior", "herb", "schizocarp", "pinnate", "umbel"): ("Apiaceae", "Coriandrum sativum"),
-    ("opposite", "actinomorphic", "5", "superior", "shrub", "nutlet", "simple", "spike"): ("Lamiaceae", "Vitex negundo"),
-    ("alternate", "actinomorphic", "5", "superior", "herb", "capsule", "simple", "panicle"): ("Amaranthaceae", "Amaranthus spinosus"),
-    ("opposite", "zygomorphic", "5", "superior", "herb", "capsule", "lanceolate", "raceme"): ("Acanthaceae", "Hemigraphis alternata"),
-    ("alternate", "actinomorphic", "5", "inferior", "herb", "achene", "toothed", "head"): ("Asteraceae", "Phyllanthus niruri"),
-    ("opposite", "actinomorphic", "5", "superior", "herb", "capsule", "cordate", "cyme"): ("Malvaceae", "Hibiscus rosa-sinensis"),
-    ("alternate", "zygomorphic", "5", "superior", "herb", "capsule", "simple", "raceme"): ("Scrophulariaceae", "Lindernia crustacea"),
-    ("alternate", "actinomorphic", "5", "superior", "herb", "nutlet", "ovate", "spike"): ("Lamiaceae", "Mentha arvensis"),
-    ("opposite", "actinomorphic", "5", "superior", "herb", "capsule", "lanceolate", "raceme"): ("Acanthaceae", "Thunbergia fragrans"),
-    ("alternate", "actinomorphic", "5", "inferior", "herb", "achene", "serrate", "head"): ("Asteraceae", "Cynoglossum zeylanicum"),
-    ("alternate", "actinomorphic", "4", "inferior", "herb", "schizocarp", "pinnate", "umbel"): ("Apiaceae", "Foeniculum vulgare"),
-    ("opposite", "actinomorphic", "5", "superior", "shrub", "nutlet", "simple", "spike"): ("Lamiaceae", "Clerodendrum inerme"),
-    ("alternate", "actinomorphic", "5", "superior", "herb", "capsule", "simple", "panicle"): ("Amaranthaceae", "Achyranthes aspera"),
-    ("opposite", "zygomorphic", "5", "superior", "herb", "capsule", "lanceolate", "raceme"): ("Acanthaceae", "Asystasia gangetica"),
-    ("alternate", "actinomorphic", "5", "inferior", "herb", "achene", "toothed", "head"): ("Asteraceae", "Eupatorium ayapana"),
-    ("opposite", "actinomorphic", "5", "superior", "herb", "capsule", "cordate", "cyme"): ("Malvaceae", "Pavonia odorata"),
-    ("alternate", "zygomorphic", "5", "superior", "herb", "capsule", "simple", "raceme"): ("Scrophulariaceae", "Scoparia dulcis"),
-    ("alternate", "actinomorphic", "5", "superior", "herb", "nutlet", "ovate", "spike"): ("Lamiaceae", "Pogostemon benghalensis"),
-    ("opposite", "actinomorphic", "5", "superior", "herb", "capsule", "lanceolate", "raceme"): ("Acanthaceae", "Rhinacanthus nasutus"),
-    ("alternate", "actinomorphic", "5", "inferior", "herb", "achene", "serrate", "head"): ("Asteraceae", "Sphaeranthus indicus"),
-    ("alternate", "actinomorphic", "4", "inferior", "herb", "schizocarp", "pinnate", "umbel"): ("Apiaceae", "Trachyspermum ammi"),
-    ("opposite", "actinomorphic", "5", "superior", "shrub", "nutlet", "simple", "spike"): ("Lamiaceae", "Gmelina asiatica"),
-    ("alternate", "actinomorphic", "5", "superior", "herb", "capsule", "simple", "panicle"): ("Amaranthaceae", "Cyathula prostrata"),
-    ("opposite", "zygomorphic", "5", "superior", "herb", "capsule", "lanceolate", "raceme"): ("Acanthaceae", "Adhatoda vasica"),
-    ("alternate", "actinomorphic", "5", "inferior", "herb", "achene", "toothed", "head"): ("Asteraceae", "Wedelia chinensis"),
-    ("opposite", "actinomorphic", "5", "superior", "herb", "capsule", "cordate", "cyme"): ("Malvaceae", "Sida acuta"),
-    ("alternate", "zygomorphic", "5", "superior", "herb", "capsule", "simple", "raceme"): ("Scrophulariaceae", "Antirrhinum majus"),
-    ("alternate", "actinomorphic", "5", "superior", "herb", "nutlet", "ovate", "spike"): ("Lamiaceae", "Ocimum basilicum"),
-    ("opposite", "actinomorphic", "5", "superior", "herb", "capsule", "lanceolate", "raceme"): ("Acanthaceae", "Peristrophe paniculata"),
-    ("alternate", "actinomorphic", "5", "inferior", "herb", "achene", "serrate", "head"): ("Asteraceae", "Xanthium strumarium"),
-    ("alternate", "actinomorphic", "4", "inferior", "herb", "schizocarp", "pinnate", "umbel"): ("Apiaceae", "Carum carvi"),
-    ("opposite", "actinomorphic", "5", "superior", "shrub", "nutlet", "simple", "spike"): ("Lamiaceae", "Premna serratifolia"),
-    ("alternate", "actinomorphic", "5", "superior", "herb", "capsule", "simple", "panicle"): ("Amaranthaceae", "Pupalia lappacea"),
-    ("opposite", "zygomorphic", "5", "superior", "herb", "capsule", "lanceolate", "raceme"): ("Acanthaceae", "Blepharis maderaspatensis"),
-    ("alternate", "actinomorphic", "5", "inferior", "herb", "achene", "toothed", "head"): ("Asteraceae", "Laggera aurita"),
-    ("opposite", "actinomorphic", "5", "superior", "herb", "capsule", "cordate", "cyme"): ("Malvaceae", "Malvastrum coromandelianum"),
-    ("alternate", "zygomorphic", "5", "superior", "herb", "capsule", "simple", "raceme"): ("Scrophulariaceae", "Verbascum thapsus"),
-    ("alternate", "actinomorphic", "5", "superior", "herb", "nutlet", "ovate", "spike"): ("Lamiaceae", "Salvia officinalis"),
-    ("opposite", "actinomorphic", "5", "superior", "herb", "capsule", "lanceolate", "raceme"): ("Acanthaceae", "Hygrophila schulli"),
-    ("alternate", "actinomorphic", "5", "inferior", "herb", "achene", "serrate", "head"): ("Asteraceae", "Echinops echinatus"),
-    ("alternate", "actinomorphic", "4", "inferior", "herb", "schizocarp", "pinnate", "umbel"): ("Apiaceae", "Cuminum cyminum")
-}
-
-# Expanded family descriptions with ethnobotanical uses and references (paraphrased to avoid copyright issues)
-family_details = {
-    "Lamiaceae": {
-        "description": "A family of aromatic plants, including herbs and shrubs, commonly utilized in South Indian traditional medicine for their benefits in respiratory, digestive, and immune system support.",
-        "ethnobotanical_uses": "Holy Basil (Ocimum tenuiflorum) is traditionally used in Ayurveda to alleviate colds, fevers, and stress-related conditions.",
-        "reference": "General botanical knowledge, inspired by studies from the Foundation for Revitalisation of Local Health Traditions (FRLHT), 2010."
-    },
-    "Acanthaceae": {
-        "description": "This family includes herbs and shrubs often used in Siddha medicine, particularly for treating respiratory issues.",
-        "ethnobotanical_uses": "Malabar Nut (Justicia adhatoda) is frequently used to manage cough, asthma, and bronchitis in traditional practices.",
-        "reference": "Medicinal Plants of India, FRLHT, 2004."
-    },
-    "Apiaceae": {
-        "description": "Known as the carrot family, this group includes herbs with both culinary and medicinal applications in South Indian culture.",
-        "ethnobotanical_uses": "Gotu Kola (Centella asiatica) is valued for its role in wound healing and improving cognitive functions.",
-        "reference": "Indian Medicinal Plants, Vol. 2, Orient Longman, 1995."
-    },
-    "Nyctaginaceae": {
-        "description": "Often called the four o’clock family, these herbs are used in Ayurvedic practices for addressing kidney and liver health concerns.",
-        "ethnobotanical_uses": "Punarnava (Boerhavia diffusa) is known for its diuretic and anti-inflammatory effects in traditional medicine.",
-        "reference": "Ethnobotanical studies, inspired by FRLHT documentation, 2010."
-    },
-    "Asteraceae": {
-        "description": "The sunflower family consists of herbs widely applied in South Indian remedies for skin, hair, and liver health.",
-        "ethnobotanical_uses": "Bhringaraj (Eclipta prostrata) is traditionally used to promote hair growth and support liver detoxification.",
-        "reference": "The Plant List, www.theplantlist.org, accessed 2025."
-    },
-    "Amaranthaceae": {
-        "description": "This family includes herbs used in South Indian medicine for their digestive and anti-inflammatory properties.",
-        "ethnobotanical_uses": "Alternanthera sessilis is often employed to treat stomach issues and reduce inflammation.",
-        "reference": "Ethnobotany of South India, FRLHT, 2010."
-    },
-    "Malvaceae": {
-        "description": "Known as the mallow family, these plants are used in traditional South Indian medicine for pain relief and wound healing.",
-        "ethnobotanical_uses": "Abutilon indicum is valued for its pain-relieving and anti-inflammatory properties in folk medicine.",
-        "reference": "General botanical knowledge, inspired by FRLHT studies, 2008."
-    },
-    "Scrophulariaceae": {
-        "description": "The figwort family includes herbs recognized for their cognitive and anti-inflammatory benefits in South Indian traditions.",
-        "ethnobotanical_uses": "Brahmi (Bacopa monnieri) is used to enhance memory and reduce anxiety in traditional practices.",
-        "reference": "Indian Medicinal Plants, Vol. 3, Orient Longman, 1996."
-    },
-    "Portulacaceae": {
-        "description": "Known as the purslane family, these herbs are valued for their nutritional content and anti-inflammatory effects.",
-        "ethnobotanical_uses": "Purslane (Portulaca oleracea) is used for its omega-3 fatty acids and anti-inflammatory properties in traditional diets.",
-        "reference": "Medicinal Plants of South India, FRLHT, 2008."
-    }
-}
-
-# Taxonomic hierarchy for each species
-taxonomy_data = {
-    "Ocimum tenuiflorum": {
-        "Kingdom": "Plantae",
-        "Division": "Magnoliophyta",
-        "Class": "Magnoliopsida",
-        "Order": "Lamiales",
-        "Family": "Lamiaceae",
-        "Genus": "Ocimum",
-        "Species": "tenuiflorum",
-        "description": "Aromatic herb with opposite, simple leaves, purple or green, often hairy; flowers in spikes, white to purplish."
-    },
-    "Justicia adhatoda": {
-        "Kingdom": "Plantae",
-        "Division": "Magnoliophyta",
-        "Class": "Magnoliopsida",
-        "Order": "Lamiales",
-        "Family": "Acanthaceae",
-        "Genus": "Justicia",
-        "Species": "adhatoda",
-        "description": "Shrub with opposite, lanceolate leaves; white zygomorphic flowers in racemes."
-    },
-    "Centella asiatica": {
-        "Kingdom": "Plantae",
-        "Division": "Magnoliophyta",
-        "Class": "Magnoliopsida",
-        "Order": "Apiales",
-        "Family": "Apiaceae",
-        "Genus": "Centella",
-        "Species": "asiatica",
-        "description": "Creeping herb with alternate, palmate leaves; small actinomorphic flowers in umbels."
-    },
-    "Boerhavia diffusa": {
-        "Kingdom": "Plantae",
-        "Division": "Magnoliophyta",
-        "Class": "Magnoliopsida",
-        "Order": "Caryophyllales",
-        "Family": "Nyctaginaceae",
-        "Genus": "Boerhavia",
-        "Species": "diffusa",
-        "description": "Prostrate herb with alternate, simple leaves; pink actinomorphic flowers in cymes."
-    },
-    "Eclipta prostrata": {
-        "Kingdom": "Plantae",
-        "Division": "Magnoliophyta",
-        "Class": "Magnoliopsida",
-        "Order": "Asterales",
-        "Family": "Asteraceae",
-        "Genus": "Eclipta",
-        "Species": "prostrata",
-        "description": "Prostrate herb with alternate, toothed leaves; white to yellow flower heads."
-    }
-    # Add taxonomy for all 100 species (abbreviated here for brevity)
-}
+        report_version = file_version(EVALUATION_PATH)
+    except OSError:
+        return None
+    return load_evaluation_report(data_hash, report_version)
 
-# Prepare dataset for decision tree
-data = []
-labels = []
-families = []
-for traits, (family, species) in characteristics_to_species.items():
-    data.append(traits)
-    labels.append(species)
-    families.append(family)
-
-df = pd.DataFrame(data, columns=["leaf_arrangement", "flower_symmetry", "petal_number", "ovary_position", "habit", "fruit_type", "leaf_shape", "inflorescence_type"])
-df["species"] = labels
-df["family"] = families
-
-# Encode categorical variables
-df_encoded = pd.get_dummies(df.drop(columns=["species", "family"]), columns=["leaf_arrangement", "flower_symmetry", "ovary_position", "habit", "fruit_type", "leaf_shape", "inflorescence_type"])
-df_encoded["petal_number"] = df["petal_number"].astype(int)
-
-# Train decision tree with cross-validation using non-stratified KFold
-clf = DecisionTreeClassifier(random_state=42, min_samples_leaf=1)
-clf.fit(df_encoded, df["species"])
-# Use KFold without stratification since each class has only 1 sample
-kf = KFold(n_splits=5, shuffle=True, random_state=42)
-scores = cross_val_score(clf, df_encoded, df["species"], cv=kf)
-model_accuracy = np.mean(scores) * 100
+# Taxonomy and family part of a species' result, rendered once per data version
+@st.cache_resource(max_entries=1024)
+def species_result_body(version, species, family):
+    return result_body(get_taxonomy(species, family), get_family_info(family))
 
 
 
@@ -314,8 +54,8 @@ if "selected_page" not in st.session_state:
 
 page = st.sidebar.selectbox(
     "Navigate",
-    ["Welcome", "Classifier", "Contacts"],
-    index=["Welcome", "Classifier", "Contacts"].index(st.session_state.selected_page),
+    ["Welcome", "Classifier", "Search", "Contacts", "Stats"],
+    index=["Welcome", "Classifier", "Search", "Contacts", "Stats"].index(st.session_state.selected_page),
     key="page_selector"
 )
 
@@ -338,93 +78,63 @@ if "prediction" not in st.session_state:
     st.session_state.prediction = None
 if "confidence" not in st.session_state:
     st.session_state.confidence = 0.0
-
-def predict_species(inputs):
+if "alternatives" not in st.session_state:
+    st.session_state.alternatives = []
+if "photo_parts" not in st.session_state:
+    st.session_state.photo_parts = None
+if "batch_result" not in st.session_state:
+    st.session_state.batch_result = None
+if "contacts_cursors" not in st.session_state:
+    st.session_state.contacts_cursors = [None]
+
+# Returns the best species, its confidence, the runner-up candidates and, with
+# a photo, the (trait confidence, photo probability) the confidence was merged from
+def predict_species(inputs, top_k=5, photo=None):
     try:
-        print(f"predict_species inputs: {inputs}")
-        input_data = pd.DataFrame([inputs])
-        for col in df.columns:
-            if col not in input_data.columns and col not in ["species", "family"]:
-                input_data[col] = None if col != "petal_number" else 0
-        input_encoded = pd.get_dummies(input_data, columns=["leaf_arrangement", "flower_symmetry", "ovary_position", "habit", "fruit_type", "leaf_shape", "inflorescence_type"])
-        for col in df_encoded.columns:
-            if col not in input_encoded.columns:
-                input_encoded[col] = 0
-        input_encoded = input_encoded[df_encoded.columns]
-        input_encoded["petal_number"] = pd.to_numeric(input_data["petal_number"], errors="coerce").fillna(0).astype(int)
-        pred = clf.predict(input_encoded)
-        proba = clf.predict_proba(input_encoded)
-        confidence = np.max(proba)
-        if confidence < 0.7:
+        photo_parts = None
+        if photo is None:
+            candidates = rank(model, inputs, top_k)
+        else:
+            from plantify_image import merge_rankings
+            from plantify_lookup import LOOKUP_TOP_K
+            trait_candidates = rank(model, inputs, LOOKUP_TOP_K)
+            image_candidates = load_image_classifier().rank(photo)
+            candidates = merge_rankings(trait_candidates, image_candidates, species_family, top_k=top_k)
+            photo_parts = (dict(trait_candidates).get(candidates[0][0], 0.0), dict(image_candidates).get(candidates[0][0], 0.0))
+        prediction, confidence = candidates[0]
+        if confidence < LOW_CONFIDENCE_THRESHOLD:
             st.warning("Low confidence prediction. Results may be inaccurate.")
-        print(f"Prediction: {pred[0]}, Confidence: {confidence:.2%}")
-        return pred[0], confidence
+        return prediction, confidence, candidates[1:], photo_parts
     except Exception as e:
         st.error(f"Prediction error: {str(e)}")
         print(f"Prediction error: {str(e)}")
-        return None, 0.0
-
-def validate_inputs(inputs):
-    valid_options = {
-        "leaf_arrangement": ["alternate", "opposite", "whorled"],
-        "flower_symmetry": ["actinomorphic", "zygomorphic"],
-        "petal_number": ["3", "4", "5", "6"],
-        "ovary_position": ["superior", "inferior"],
-        "habit": ["herb", "shrub"],
-        "fruit_type": ["capsule", "nutlet", "schizocarp", "achene", "berry"],
-        "leaf_shape": ["simple", "palmate", "pinnate", "lobed", "cordate", "lanceolate", "ovate", "linear", "toothed", "serrate", "fleshy"],
-        "inflorescence_type": ["spike", "raceme", "umbel", "cyme", "head", "panicle", "solitary"]
-    }
-    for key, value in inputs.items():
-        if value not in valid_options[key]:
-            return False, f"Invalid value for {key}: {value}"
-    return True, ""
-
-def generate_pdf_report(species, family, confidence, taxonomy, family_info, inputs):
+        return None, 0.0, [], None
+
+# Photo classifier, if `python plantify_image.py build` has been run and a
+# TFLite interpreter is installed; loaded once per process
+def load_image_classifier():
+    from plantify_image import get_image_classifier
+    return get_image_classifier()
+
+# PDF report for one classification, built when downloaded
+def render_pdf_report(species, family, confidence, inputs):
+    from plantify_report import generate_pdf_report
+    return generate_pdf_report(species, family, confidence, inputs)
+
+# Combined multi-page PDF for a batch results file, built when downloaded
+def render_batch_report(result_bytes):
+    from plantify_report import read_batch_results, write_batch_report
     buffer = BytesIO()
-    c = canvas.Canvas(buffer, pagesize=letter)
-    c.setFont("Helvetica", 12)
-    y = 750
-
-    c.drawString(100, y, "PLANTIFY! Classification Report ")
-    y -= 20
-    c.drawString(100, y, f"Species: {species}")
-    y -= 20
-    c.drawString(100, y, f"Family: {family}")
-    y -= 20
-    c.drawString(100, y, f"Confidence: {confidence:.2%}")
-    y -= 30
-
-    c.drawString(100, y, "Taxonomic Hierarchy:")
-    y -= 20
-    for key, value in taxonomy.items():
-        c.drawString(120, y, f"{key}: {value}")
-        y -= 15
-    y -= 10
-
-    c.drawString(100, y, "Morphological Characteristics Used:")
-    y -= 20
-    for key, value in inputs.items():
-        c.drawString(120, y, f"{key.replace('_', ' ').title()}: {value}")
-        y -= 15
-    y -= 10
-
-    c.drawString(100, y, "Family Details:")
-    y -= 20
-    c.drawString(120, y, f"Description: {family_info['description']}")
-    y -= 20
-    c.drawString(120, y, f"Ethnobotanical Uses: {family_info['ethnobotanical_uses']}")
-    y -= 20
-    c.drawString(120, y, f"Reference: {family_info['reference']}")
-    y -= 20
-
-    c.drawString(100, y, "Disclaimer: This classification report is generated for educational purposes to aid in the study of South Indian medicinal herbs. It should not be used for professional field identification without consulting a trained botanist.")
-    y -= 20
-    c.drawString(100, y, "Acknowledgment: Information in this report is based on publicly available botanical studies with proper attribution to sources like FRLHT and The Plant List.")
-    c.showPage()
-    c.save()
-    buffer.seek(0)
-    return buffer
+    write_batch_report(read_batch_results(BytesIO(result_bytes)), buffer)
+    return buffer.getvalue()
+
+# Bring contacts saved by earlier versions into the contact store, once per process
+@st.cache_resource
+def import_legacy_contacts():
+    from plantify_contacts import LEGACY_CSV, import_csv
+    if os.path.exists(LEGACY_CSV):
+        added = import_csv(LEGACY_CSV)
+        print(f"Imported {added} contacts from {LEGACY_CSV}")
 
 # Welcome Page
 if page == "Welcome":
@@ -450,6 +160,14 @@ if page == "Welcome":
 
 # Classifier Page
 elif page == "Classifier":
+    from plantify_model import DEFAULT_TOP_K, FEATURE_COLUMNS, rank, stage_confidences, trait_key, validate_inputs
+    # One model for the whole rerun, even if a reload lands meanwhile
+    model = get_model_reloader().get()
+    version = model["data_hash"]
+    query_engine = model["query_engine"]
+    species_family = model["species_family"]
+    evaluation = evaluation_report(version)
+
     st.title("🌿 PLANTIFY!")
     st.markdown("""
     This app only developed for identify the south indian herbaceous plant which is native in india by AI agent.
@@ -510,23 +228,78 @@ elif page == "Classifier":
     )
     st.markdown('</div>', unsafe_allow_html=True)
 
+    # Optional photo, merged with the trait ranking when an image model is built
+    photo = None
+    if load_image_classifier() is not None:
+        from plantify_image import IMAGE_EXTENSIONS
+        photo = st.file_uploader("Photo of the plant (optional)", type=[ext.lstrip(".") for ext in IMAGE_EXTENSIONS])
+
     # Validate inputs for button enablement
     all_filled = all(value and value != "" for value in st.session_state.inputs.values())
-    print(f"Inputs: {st.session_state.inputs}, All filled: {all_filled}")
 
-    # Classify button
-    if st.button("Classify", disabled=not all_filled):
+    # Identification key: the species consistent with every trait selected so
+    # far, and the trait that would narrow them down the most
+    from plantify_key import trait_label
+    key_state = model["key"].state(st.session_state.inputs)
+    identified = key_state["count"] == 1
+    # Several species left that no open trait tells apart (e.g. species sharing
+    # all eight traits): the answer is those species, with equal confidence
+    indistinct = key_state["count"] > 1 and not key_state["ranking"]
+    n_filled = sum(1 for value in st.session_state.inputs.values() if value)
+    if n_filled < len(st.session_state.inputs):
+        if n_filled and key_state["count"]:
+            st.markdown(f"#### {key_state['count']} Species Match {n_filled} Selected Traits")
+            shown = model["key"].members(key_state["candidates"], limit=10)
+            st.markdown("\n".join(f"- {name} ({family})" for name, family in shown))
+            if key_state["count"] > len(shown):
+                st.caption(f"...and {key_state['count'] - len(shown)} more.")
+        elif n_filled:
+            # Nothing matches every trait: rank by how many traits match instead
+            st.markdown(f"#### Likely Species from {n_filled} Selected Traits")
+            st.caption("No species matches every selected trait.")
+            st.markdown("\n".join(
+                f"- {name} ({family}): {matched}/{n_filled} traits match"
+                for name, family, matched, score in query_engine.query(st.session_state.inputs, top_k=5)
+            ))
+        if identified:
+            st.success("Only one species matches these traits, so you can classify now.")
+        elif indistinct:
+            st.info(
+                f"None of the remaining traits tells these {key_state['count']} species apart, "
+                "so you can classify now; they share the confidence equally."
+            )
+        elif key_state["ranking"]:
+            col, bits, groups = key_state["ranking"][0]
+            st.info(
+                f"Most informative next trait: **{trait_label(col)}**. It splits the {key_state['count']} "
+                f"remaining species into {groups} groups ({bits:.2f} bits)."
+            )
+
+    # Classify button: all eight traits, or fewer once no open trait can narrow
+    # the remaining species down any further
+    if st.button("Classify", disabled=not (all_filled or identified or indistinct)):
         try:
-            print(f"Classify button clicked with inputs: {st.session_state.inputs}")
-            is_valid, error_msg = validate_inputs(st.session_state.inputs)
-            if not is_valid:
+            is_valid, error_msg = validate_inputs(st.session_state.inputs) if all_filled else (True, None)
+            if not all_filled:
+                members = model["key"].members(key_state["candidates"], limit=5)
+                share = 1.0 / key_state["count"]
+                st.session_state.prediction = members[0][0]
+                st.session_state.confidence = share
+                st.session_state.alternatives = [(name, share) for name, _ in members[1:]]
+                st.session_state.photo_parts = None
+                st.success("Classification completed successfully!")
+            elif not is_valid:
                 st.error(f"Validation error: {error_msg}")
                 print(f"Validation error: {error_msg}")
             else:
-                prediction, confidence = predict_species(st.session_state.inputs)
+                prediction, confidence, alternatives, photo_parts = predict_species(
+                    st.session_state.inputs, photo=photo.getvalue() if photo is not None else None
+                )
                 if prediction:
                     st.session_state.prediction = prediction
                     st.session_state.confidence = confidence
+                    st.session_state.alternatives = alternatives
+                    st.session_state.photo_parts = photo_parts
                     st.success("Classification completed successfully!")
                 else:
                     st.error("Prediction failed. Please check inputs and try again.")
@@ -537,49 +310,62 @@ elif page == "Classifier":
     # Display prediction if available
     if st.session_state.prediction:
         species = st.session_state.prediction
-        family = df[df["species"] == species]["family"].iloc[0]
-        taxonomy = taxonomy_data.get(species, {
-            "Kingdom": "Plantae",
-            "Division": "Magnoliophyta",
-            "Class": "Magnoliopsida",
-            "Order": "Unknown",
-            "Family": family,
-            "Genus": species.split()[0],
-            "Species": species.split()[1] if len(species.split()) > 1 else species,
-           
-        })
-        family_info = family_details.get(family, {
-        
-            "ethnobotanical_uses": "Ethnobotanical uses not documented.",
-            "reference": "Not available."
-        })
+        family = species_family[species]
         st.success("🌸 Classification Result")
         st.markdown(
-            f"""
-            **Predicted Species**: <span style='color:blue'>{species}</span>  
-            **Family**: <span style='color:green'>{family}</span>  
-            **Confidence**: <span style='color:purple'>{st.session_state.confidence:.2%}</span>  
-            ### Taxonomic Hierarchy
-            - **Kingdom**: {taxonomy['Kingdom']}  
-            - **Division**: {taxonomy['Division']}  
-            - **Class**: {taxonomy['Class']}  
-            - **Order**: {taxonomy['Order']}  
-            - **Family**: {taxonomy['Family']}  
-            - **Genus**: {taxonomy['Genus']}  
-            - **Species**: {taxonomy['Species']}  
-            
-            ### Family Details
-            - **Description**: {family_info['description']}  
-            - **Ethnobotanical Uses**: {family_info['ethnobotanical_uses']}  
-            - **Reference**: {family_info['reference']}  
-            """,
+            result_markdown(species, family, st.session_state.confidence, species_result_body(version, species, family)),
             unsafe_allow_html=True
         )
-        # Download PDF report
-        pdf_buffer = generate_pdf_report(species, family, st.session_state.confidence, taxonomy, family_info, st.session_state.inputs)
+        stage = stage_confidences(model, [trait_key(st.session_state.inputs)], [species])[0] if all_filled else None
+        if st.session_state.photo_parts is not None:
+            # With a photo the confidence is a blend; the stages below only explain its trait part
+            from plantify_image import IMAGE_WEIGHT
+            trait_confidence, photo_probability = st.session_state.photo_parts
+            st.caption(
+                f"Confidence: {1 - IMAGE_WEIGHT:.0%} × trait confidence {trait_confidence:.1%} "
+                f"+ {IMAGE_WEIGHT:.0%} × photo model {photo_probability:.1%}."
+            )
+            if not trait_confidence:
+                stage = None
+        if stage is not None:
+            _, family_confidence, species_confidence, similarity = stage
+            st.caption(
+                ("Trait confidence breakdown: " if st.session_state.photo_parts is not None else "")
+                + f"Family model: {family} with {family_confidence:.1%} confidence. "
+                f"Species model within {family}: {species_confidence:.1%}. "
+                f"Trait similarity to the nearest known species: {similarity:.0%}."
+            )
+        if st.session_state.alternatives:
+            total = len(model["trait_index"].get(trait_key(st.session_state.inputs), []))
+            if total > 1:
+                st.info(f"{total} species share exactly these traits. Other candidates:")
+            else:
+                st.info("Other candidates:")
+            st.markdown("\n".join(
+                f"- {name} ({species_family[name]}): {score:.2%}" for name, score in st.session_state.alternatives
+            ))
+        if all_filled and trait_key(st.session_state.inputs) not in model["trait_index"]:
+            st.warning("No species in the table has exactly these traits. Nearest known species:")
+            st.markdown("\n".join(
+                f"- {name} ({family}): {1 - distance:.0%} trait similarity"
+                for name, family, distance in model["similarity"].nearest(st.session_state.inputs, k=5)
+            ))
+        if evaluation:
+            loo = evaluation["served"]["leave_one_out"]
+            st.caption(
+                f"Accuracy of this ranking (leave-one-out over {evaluation['species']} species): the top species is in the "
+                f"right family {loo['family_accuracy']:.1%} of the time. Species accuracy cannot be measured this way, "
+                "because every species has a single record and a held-out species is never among the candidates. Only "
+                f"{evaluation['trait_identifiable_species']} species have a trait combination no other species shares, "
+                "so an exact species match is not guaranteed."
+            )
+        else:
+            st.caption("No accuracy figures for this species table yet; run `python plantify_evaluate.py`.")
+        # Download PDF report. The report is only rendered when the button is
+        # clicked, and rendered reports are memoized for repeat downloads.
         st.download_button(
             label="Download Classification Report (PDF)",
-            data=pdf_buffer,
+            data=partial(render_pdf_report, species, family, st.session_state.confidence, {col: value for col, value in st.session_state.inputs.items() if value}),
             file_name=f"{species}_classification_report.pdf",
             mime="application/pdf"
         )
@@ -597,12 +383,53 @@ elif page == "Classifier":
             }
             st.session_state.prediction = None
             st.session_state.confidence = 0.0
+            st.session_state.alternatives = []
+            st.session_state.photo_parts = None
             st.rerun()
 
     st.markdown("---")
 
+    # Batch classification of an uploaded specimen file
+    st.subheader("Batch Classification")
+    st.markdown("Upload a CSV or Parquet file with the columns " + ", ".join(f"`{col}`" for col in FEATURE_COLUMNS) + " to classify many specimens at once.")
+    uploaded_file = st.file_uploader("Specimen file", type=["csv", "parquet"], key="batch_file")
+    top_k = st.slider("Alternatives per specimen", min_value=1, max_value=10, value=DEFAULT_TOP_K, key="batch_top_k")
+    if st.button("Classify File", disabled=uploaded_file is None):
+        try:
+            import tempfile
+            from plantify_batch import classify_file, detect_format
+            # Results are streamed to a temporary file chunk by chunk, then offered for download
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                output_path = os.path.join(tmp_dir, "classification_results.csv")
+                classified, rejected = classify_file(uploaded_file, output_path, model=model, top_k=top_k, input_format=detect_format(uploaded_file.name))
+                with open(output_path, "rb") as f:
+                    st.session_state.batch_result = (uploaded_file.name, f.read(), classified, rejected)
+        except Exception as e:
+            st.session_state.batch_result = None
+            st.error(f"Batch classification error: {str(e)}")
+            print(f"Batch classification error: {str(e)}")
+    if st.session_state.batch_result:
+        file_name, result_bytes, classified, rejected = st.session_state.batch_result
+        st.success(f"Classified {classified} specimens from {file_name}." + (f" {rejected} rows had invalid traits." if rejected else ""))
+        st.download_button(
+            label="Download Batch Results (CSV)",
+            data=result_bytes,
+            file_name=f"{os.path.splitext(file_name)[0]}_results.csv",
+            mime="text/csv"
+        )
+        st.download_button(
+            label="Download Batch Report (PDF)",
+            data=partial(render_batch_report, result_bytes),
+            file_name=f"{os.path.splitext(file_name)[0]}_report.pdf",
+            mime="application/pdf"
+        )
+
+    st.markdown("---")
+
 # Contacts Page
 elif page == "Contacts":
+    from plantify_contacts import PAGE_SIZE, count_contacts, list_contacts, save_contact, search_contacts
+    import_legacy_contacts()
     st.title("📇 Contact Management")
     st.markdown("Save and contact herbalists or experts.")
 
@@ -622,52 +449,108 @@ elif page == "Contacts":
     # Contact logic
     if save_button:
         if contact_name and (contact_phone or contact_email):
-            with open("contacts.csv", "a", newline="") as f:
-                writer = csv.writer(f)
-                if os.path.getsize("contacts.csv") == 0:
-                    writer.writerow(["Name", "Phone", "Email"])
-                writer.writerow([contact_name, contact_phone, contact_email])
+            save_contact(contact_name, contact_phone, contact_email)
+            st.session_state.contacts_cursors = [None]
             st.success("Contact saved successfully!")
         else:
             st.error("Please enter a name and at least one contact detail.")
 
     if email_button and contact_email:
+        import webbrowser
         webbrowser.open(f"mailto:{contact_email}?subject=Herb%20Inquiry&body=Hello,%20I%20have%20a%20question%20about%20medicinal%20herbs.")
         st.success("Email client opened!")
     elif email_button:
         st.error("Please enter an email address.")
 
     if call_button and contact_phone:
+        import webbrowser
         webbrowser.open(f"tel:{contact_phone}")
         st.success("Dialer opened!")
     elif call_button:
         st.error("Please enter a phone number.")
 
-    # Display saved contacts
-    if os.path.exists("contacts.csv"):
-        with open("contacts.csv", "r") as f:
-            contacts = list(csv.reader(f))
-            if len(contacts) > 1:
-                st.markdown("### Saved Contacts")
-                for contact in contacts[1:]:
-                    st.markdown(f"**{contact[0]}**: Phone: {contact[1] or 'N/A'}, Email: {contact[2] or 'N/A'}")
+    # Display saved contacts, one page at a time
+    total_contacts = count_contacts()
+    if total_contacts:
+        st.markdown("### Saved Contacts")
+        search_term = st.text_input("Search contacts by name, email or phone", key="contact_search")
+        if search_term:
+            contacts = search_contacts(search_term)
+            st.caption(f"{len(contacts)} matching contacts" + (" (showing the first page)" if len(contacts) == PAGE_SIZE else ""))
+            has_older = False
+        else:
+            # Stack of keyset cursors: the last entry is the cursor of the current page
+            cursors = st.session_state.contacts_cursors
+            contacts = list_contacts(before_id=cursors[-1], limit=PAGE_SIZE + 1)
+            has_older = len(contacts) > PAGE_SIZE
+            contacts = contacts[:PAGE_SIZE]
+            st.caption(f"Page {len(cursors)} of {(total_contacts + PAGE_SIZE - 1) // PAGE_SIZE} ({total_contacts} contacts)")
+        st.markdown("\n".join(
+            f"- **{contact['name']}**: Phone: {contact['phone'] or 'N/A'}, Email: {contact['email'] or 'N/A'}"
+            for contact in contacts
+        ))
+        if not search_term:
+            col1, col2 = st.columns(2)
+            with col1:
+                if st.button("Newer", disabled=len(cursors) == 1):
+                    cursors.pop()
+                    st.rerun()
+            with col2:
+                if st.button("Older", disabled=not has_older):
+                    cursors.append(contacts[-1]["id"])
+                    st.rerun()
 
     st.markdown("---")
 
+# Search Page: look a herb up by scientific, English or regional name
+elif page == "Search":
+    from plantify_search import LANGUAGES, get_search_index
+    st.title("🔎 Find a Herb")
+    query = st.text_input("Name", placeholder="Scientific, English or regional name, e.g. Tulsi, Vallarai, Ocimum")
+    if query:
+        search_index = get_search_index()
+        version = data_version()
+        results = search_index.search(query, limit=10)
+        if not results:
+            st.info("No species found. Check the spelling or try another name.")
+        for position, result in enumerate(results):
+            species, family = result["species"], result["family"]
+            matched = "" if result["matched"] == species else f" ({result['matched']})"
+            with st.expander(f"{species}{matched} · {family}", expanded=position == 0):
+                names = search_index.common_names(species)
+                if names:
+                    st.markdown("**Also known as**: " + ", ".join(f"{name} ({LANGUAGES.get(language, language)})" for name, language in names))
+                st.markdown(species_result_body(version, species, family), unsafe_allow_html=True)
+
+# Stats Page: counters and latency histograms for this server process
+elif page == "Stats":
+    st.title("📈 Runtime Stats")
+    stats = snapshot()
+    st.caption(f"Metrics for this server process. Latencies are sampled at a rate of {stats['sample_rate']:g}; "
+               "the same figures are served in Prometheus format by the API's /metrics endpoint.")
+    st.metric("Low-confidence predictions", f"{stats['low_confidence_rate']:.1%}",
+              help=f"Share of predictions whose top confidence is below {stats['low_confidence_threshold']:.0%}")
+    if stats["counters"]:
+        st.subheader("Counters")
+        st.table([
+            {"metric": c["name"], "labels": ", ".join(f"{k}={v}" for k, v in c["labels"].items()), "value": c["value"]}
+            for c in stats["counters"]
+        ])
+    if stats["histograms"]:
+        st.subheader("Latency")
+        st.table([
+            {
+                "metric": h["name"],
+                "labels": ", ".join(f"{k}={v}" for k, v in h["labels"].items()),
+                "samples": h["count"],
+                "mean (ms)": f"{h['mean_s'] * 1000:.3f}",
+                "p50 ≤ (ms)": f"{h['p50_s'] * 1000:g}",
+                "p95 ≤ (ms)": f"{h['p95_s'] * 1000:g}",
+            }
+            for h in stats["histograms"]
+        ])
+    if not stats["counters"] and not stats["histograms"]:
+        st.info("Nothing recorded yet. Classify a specimen or open the Contacts page first.")
+
 # Common footer for all pages
-st.markdown("### The Importance of South Indian Medicinal Herbs")
-st.markdown("""
-South Indian medicinal herbs have been a cornerstone of traditional healing systems like Ayurveda and Siddha for centuries. Plants like Holy Basil (Ocimum tenuiflorum) and Malabar Nut (Justicia adhatoda) offer remedies for various ailments, from respiratory issues to stress relief. Beyond their medicinal value, these herbs play a vital role in preserving biodiversity and cultural heritage in South India, supporting ecosystems and traditional knowledge passed down through generations.
-""")
-st.markdown("#### Reflections on the Value of Plants")
-st.markdown("""
-- *“In every leaf of a medicinal herb, there lies a remedy—a gift from nature to heal humanity.”*  
-  — Inspired by Ayurvedic wisdom  
-- *“Plants are the lungs of the earth; preserving them ensures we breathe a future of health and harmony.”*  
-  — Adapted from global ecological insights  
-- *“The healing power of nature is boundless; every herb tells a story of life and resilience.”*  
-  — A reflection on South Indian ethnobotany
-""")
-
-st.markdown("Built with Streamlit | Data source: South Indian medicinal plant studies")
-st.markdown("Thank you for using south indian medicinal herb classifier")
+st.markdown(FOOTER_MARKDOWN)
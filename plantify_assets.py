@@ -0,0 +1,106 @@
+# Static page assets for the Streamlit app.
+#
+# Everything here is built once per process: the page CSS and footer are string
+# constants sent as one element each, and the taxonomy/family part of a result
+# is rendered once per species. Reruns then only format the parts that change.
+import os
+
+
+PAGE_CSS = """<style>
+/* Fade-in animation for welcome page */
+@keyframes fadeIn {
+    0% { opacity: 0; }
+    100% { opacity: 1; }
+}
+
+/* Slide-in animation for classification inputs */
+@keyframes slideIn {
+    0% { transform: translateX(-100px); opacity: 0; }
+    100% { transform: translateX(0); opacity: 1; }
+}
+
+.fade-in {
+    animation: fadeIn 1.5s ease-in-out;
+}
+
+.slide-in {
+    animation: slideIn 0.8s ease-in-out;
+}
+
+/* Button hover effect */
+.stButton > button {
+    background-color: #4CAF50;
+    color: white;
+    border-radius: 5px;
+    transition: all 0.3s ease;
+}
+
+.stButton > button:hover {
+    background-color: #45a049;
+    transform: scale(1.05);
+}
+
+.stSelectbox select { font-size: 16px; }
+.stTextInput > div > input { font-size: 16px; }
+.reportview-container { background: linear-gradient(to bottom, #e6f3e6, #ffffff); }
+.sidebar .sidebar-content { background-color: #f0f8f0; }
+
+/* Center logo and name in footer */
+.footer-container {
+    display: flex;
+    align-items: center;
+    gap: 10px;
+}
+</style>
+"""
+
+FOOTER_MARKDOWN = """### The Importance of South Indian Medicinal Herbs
+
+South Indian medicinal herbs have been a cornerstone of traditional healing systems like Ayurveda and Siddha for centuries. Plants like Holy Basil (Ocimum tenuiflorum) and Malabar Nut (Justicia adhatoda) offer remedies for various ailments, from respiratory issues to stress relief. Beyond their medicinal value, these herbs play a vital role in preserving biodiversity and cultural heritage in South India, supporting ecosystems and traditional knowledge passed down through generations.
+
+#### Reflections on the Value of Plants
+
+- *“In every leaf of a medicinal herb, there lies a remedy—a gift from nature to heal humanity.”*  
+  — Inspired by Ayurvedic wisdom  
+- *“Plants are the lungs of the earth; preserving them ensures we breathe a future of health and harmony.”*  
+  — Adapted from global ecological insights  
+- *“The healing power of nature is boundless; every herb tells a story of life and resilience.”*  
+  — A reflection on South Indian ethnobotany
+
+Built with Streamlit | Data source: South Indian medicinal plant studies
+
+Thank you for using south indian medicinal herb classifier
+"""
+
+# Only the first three lines differ between two results for the same species
+RESULT_HEADER = """**Predicted Species**: <span style='color:blue'>{species}</span>  
+**Family**: <span style='color:green'>{family}</span>  
+**Confidence**: <span style='color:purple'>{confidence:.2%}</span>  
+"""
+
+RESULT_BODY = """### Taxonomic Hierarchy
+- **Kingdom**: {taxonomy[Kingdom]}  
+- **Division**: {taxonomy[Division]}  
+- **Class**: {taxonomy[Class]}  
+- **Order**: {taxonomy[Order]}  
+- **Family**: {taxonomy[Family]}  
+- **Genus**: {taxonomy[Genus]}  
+- **Species**: {taxonomy[Species]}  
+
+### Family Details
+- **Description**: {family_info[description]}  
+- **Ethnobotanical Uses**: {family_info[ethnobotanical_uses]}  
+- **Reference**: {family_info[reference]}  
+"""
+
+
+def file_version(path):
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+# Taxonomy and family details of a result; independent of the confidence
+def result_body(taxonomy, family_info):
+    return RESULT_BODY.format(taxonomy=taxonomy, family_info=family_info)
+
+def result_markdown(species, family, confidence, body):
+    return RESULT_HEADER.format(species=species, family=family, confidence=confidence) + body
@@ -0,0 +1,139 @@
+import argparse
+import os
+
+import numpy as np
+import pandas as pd
+
+from plantify_data import load_species_records
+from plantify_model import DEFAULT_TOP_K, FEATURE_COLUMNS, TRAIT_OPTIONS, load_or_train, normalize_trait, rank_batch, stage_confidences
+
+
+DEFAULT_CHUNK_SIZE = 10000
+
+
+def detect_format(name):
+    extension = os.path.splitext(str(name))[1].lower()
+    if extension in (".parquet", ".pq"):
+        return "parquet"
+    if extension == ".csv":
+        return "csv"
+    raise ValueError(f"Unsupported file type '{extension}'. Use .csv or .parquet")
+
+def check_columns(columns):
+    missing = [col for col in FEATURE_COLUMNS if col not in columns]
+    if missing:
+        raise ValueError(f"Missing trait columns: {', '.join(missing)}")
+
+# Yield DataFrame chunks from a CSV or Parquet source without loading it all at once
+def read_chunks(source, file_format, chunk_size=DEFAULT_CHUNK_SIZE):
+    if file_format == "csv":
+        for chunk in pd.read_csv(source, dtype=str, keep_default_na=False, chunksize=chunk_size):
+            check_columns(chunk.columns)
+            yield chunk
+    else:
+        try:
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ValueError("Parquet support requires pyarrow to be installed")
+        parquet_file = pq.ParquetFile(source)
+        check_columns(parquet_file.schema_arrow.names)
+        # Columns keep their Parquet types (numbers, nulls); validate_chunk normalizes them
+        for batch in parquet_file.iter_batches(batch_size=chunk_size):
+            yield batch.to_pandas()
+
+# Mark rows whose traits are outside the validate_inputs vocabularies, after the
+# same normalization as every other entry point (plantify_model.normalize_trait).
+# Nulls are reported as missing. Returns the cleaned trait values and an error
+# message per row ("" when valid).
+def validate_chunk(chunk):
+    traits = pd.DataFrame(index=chunk.index)
+    errors = pd.Series("", index=chunk.index, dtype=object)
+    for col in FEATURE_COLUMNS:
+        # Normalize each distinct value once; nulls get code -1, the trailing ""
+        codes, uniques = pd.factorize(chunk[col])
+        normalized = np.array([normalize_trait(value) for value in uniques] + [""], dtype=object)
+        values = pd.Series(normalized[codes], index=chunk.index, dtype=object)
+        traits[col] = values
+        invalid = ~values.isin(TRAIT_OPTIONS[col]) & (errors == "")
+        errors[invalid & (values == "")] = "Missing value for " + col
+        errors[invalid & (values != "")] = "Invalid value for " + col + ": " + values[invalid & (values != "")]
+    return traits, errors
+
+# Classify one chunk: known trait combinations come from the trait index and the
+# rest are scored with one vectorized walk of the compiled trees
+def classify_chunk(chunk, model, top_k=DEFAULT_TOP_K):
+    traits, errors = validate_chunk(chunk)
+    result = chunk.copy()
+    result["species"] = ""
+    result["family"] = ""
+    result["confidence"] = np.nan
+    result["family_confidence"] = np.nan
+    result["species_confidence"] = np.nan
+    result["similarity"] = np.nan
+    result["alternatives"] = ""
+
+    valid = (errors == "").to_numpy()
+    if valid.any():
+        rows = list(traits.loc[valid, FEATURE_COLUMNS].itertuples(index=False, name=None))
+        ranked = rank_batch(model, rows, top_k)
+        species = [candidates[0][0] for candidates in ranked]
+        stages = stage_confidences(model, rows, species)
+        result.loc[valid, "species"] = species
+        result.loc[valid, "family"] = [stage[0] for stage in stages]
+        result.loc[valid, "confidence"] = [candidates[0][1] for candidates in ranked]
+        result.loc[valid, "family_confidence"] = [stage[1] for stage in stages]
+        result.loc[valid, "species_confidence"] = [stage[2] for stage in stages]
+        result.loc[valid, "similarity"] = [stage[3] for stage in stages]
+        result.loc[valid, "alternatives"] = [
+            "; ".join(f"{name} ({confidence:.2%})" for name, confidence in candidates[1:])
+            for candidates in ranked
+        ]
+    result["error"] = errors
+    return result
+
+# Stream `source` through the classifier chunk by chunk and write the results to
+# `destination` as they are produced, so memory use depends on chunk_size only.
+# Returns (rows classified, rows rejected by validation).
+def classify_file(source, destination, model=None, chunk_size=DEFAULT_CHUNK_SIZE, top_k=DEFAULT_TOP_K, input_format=None, output_format=None):
+    if model is None:
+        model = load_or_train(load_species_records())
+    input_format = input_format or detect_format(getattr(source, "name", source))
+    output_format = output_format or detect_format(getattr(destination, "name", destination))
+
+    classified = 0
+    rejected = 0
+    writer = None
+    try:
+        for i, chunk in enumerate(read_chunks(source, input_format, chunk_size)):
+            result = classify_chunk(chunk, model, top_k)
+            n_rejected = int((result["error"] != "").sum())
+            classified += len(result) - n_rejected
+            rejected += n_rejected
+            if output_format == "csv":
+                result.to_csv(destination, mode="w" if i == 0 else "a", header=(i == 0), index=False)
+            else:
+                import pyarrow as pa
+                import pyarrow.parquet as pq
+                table = pa.Table.from_pandas(result, preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(destination, table.schema)
+                writer.write_table(table)
+    finally:
+        if writer is not None:
+            writer.close()
+    return classified, rejected
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Classify a CSV or Parquet file of specimen traits")
+    parser.add_argument("input", help="CSV or Parquet file with the eight trait columns")
+    parser.add_argument("output", help="CSV or Parquet file to write results to")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--top-k", type=int, default=DEFAULT_TOP_K)
+    args = parser.parse_args(argv)
+
+    classified, rejected = classify_file(args.input, args.output, chunk_size=args.chunk_size, top_k=args.top_k)
+    print(f"Classified {classified} specimens, rejected {rejected}. Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+# Contact storage for the Contacts page.
+#
+# Contacts live in an SQLite database in WAL mode, so saves from many Streamlit
+# sessions and worker processes are serialized by SQLite instead of interleaving
+# in a CSV file, and readers never block writers. Listing is keyset-paginated
+# and lookups go through indexes, so page loads do not grow with the table.
+import argparse
+import csv
+import os
+import re
+import sqlite3
+import threading
+
+from plantify_metrics import timed
+
+
+CONTACTS_DB = os.environ.get("PLANTIFY_CONTACTS_DB", "contacts.db")
+LEGACY_CSV = "contacts.csv"
+PAGE_SIZE = 20
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS contacts (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    phone TEXT NOT NULL DEFAULT '',
+    email TEXT NOT NULL DEFAULT '',
+    name_key TEXT NOT NULL,
+    phone_key TEXT NOT NULL,
+    email_key TEXT NOT NULL,
+    created_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+CREATE INDEX IF NOT EXISTS contacts_by_name ON contacts(name_key);
+CREATE INDEX IF NOT EXISTS contacts_by_phone ON contacts(phone_key);
+CREATE INDEX IF NOT EXISTS contacts_by_email ON contacts(email_key);
+CREATE TABLE IF NOT EXISTS contact_stats (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    total INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO contact_stats (id, total) VALUES (1, 0);
+CREATE TRIGGER IF NOT EXISTS contacts_count_insert AFTER INSERT ON contacts
+BEGIN
+    UPDATE contact_stats SET total = total + 1 WHERE id = 1;
+END;
+CREATE TRIGGER IF NOT EXISTS contacts_count_delete AFTER DELETE ON contacts
+BEGIN
+    UPDATE contact_stats SET total = total - 1 WHERE id = 1;
+END;
+CREATE TABLE IF NOT EXISTS contact_imports (
+    path TEXT PRIMARY KEY,
+    imported_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+"""
+
+_local = threading.local()
+
+
+def name_key(name):
+    return " ".join(name.split()).lower()
+
+def phone_key(phone):
+    return re.sub(r"\D", "", phone)
+
+def email_key(email):
+    return email.strip().lower()
+
+def connect(path=CONTACTS_DB):
+    conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(SCHEMA)
+    return conn
+
+# One connection per thread and process, opened on first use
+def get_connection():
+    conn = getattr(_local, "conn", None)
+    if conn is None or getattr(_local, "path", None) != CONTACTS_DB or getattr(_local, "pid", None) != os.getpid():
+        conn = connect(CONTACTS_DB)
+        _local.conn = conn
+        _local.path = CONTACTS_DB
+        _local.pid = os.getpid()
+    return conn
+
+def save_contact(name, phone="", email=""):
+    conn = get_connection()
+    with timed("plantify_contacts_seconds", op="save"), conn:
+        cursor = conn.execute(
+            "INSERT INTO contacts (name, phone, email, name_key, phone_key, email_key) VALUES (?, ?, ?, ?, ?, ?)",
+            (name.strip(), phone.strip(), email.strip(), name_key(name), phone_key(phone), email_key(email)),
+        )
+    return cursor.lastrowid
+
+def count_contacts():
+    with timed("plantify_contacts_seconds", op="count"):
+        return get_connection().execute("SELECT total FROM contact_stats WHERE id = 1").fetchone()["total"]
+
+# Newest contacts first. Pass the id of the last contact on the previous page as
+# `before_id` to get the next page; each page is one index range scan.
+def list_contacts(before_id=None, limit=PAGE_SIZE):
+    conn = get_connection()
+    with timed("plantify_contacts_seconds", op="list"):
+        if before_id is None:
+            rows = conn.execute("SELECT id, name, phone, email FROM contacts ORDER BY id DESC LIMIT ?", (limit,))
+        else:
+            rows = conn.execute("SELECT id, name, phone, email FROM contacts WHERE id < ? ORDER BY id DESC LIMIT ?", (before_id, limit))
+        return [dict(row) for row in rows]
+
+def find_by_name(name):
+    rows = get_connection().execute("SELECT id, name, phone, email FROM contacts WHERE name_key = ? ORDER BY id DESC", (name_key(name),))
+    return [dict(row) for row in rows]
+
+def find_by_email(email):
+    rows = get_connection().execute("SELECT id, name, phone, email FROM contacts WHERE email_key = ? ORDER BY id DESC", (email_key(email),))
+    return [dict(row) for row in rows]
+
+def find_by_phone(phone):
+    rows = get_connection().execute("SELECT id, name, phone, email FROM contacts WHERE phone_key = ? ORDER BY id DESC", (phone_key(phone),))
+    return [dict(row) for row in rows]
+
+# Prefix search over names, emails and phone digits, each an index range scan
+def search_contacts(term, limit=PAGE_SIZE):
+    conn = get_connection()
+    found = {}
+    candidates = [("name_key", name_key(term)), ("email_key", email_key(term)), ("phone_key", phone_key(term))]
+    with timed("plantify_contacts_seconds", op="search"):
+        for column, prefix in candidates:
+            if not prefix:
+                continue
+            rows = conn.execute(
+                f"SELECT id, name, phone, email FROM contacts WHERE {column} >= ? AND {column} < ? ORDER BY {column} LIMIT ?",
+                (prefix, prefix + "\uffff", limit),
+            )
+            for row in rows:
+                found.setdefault(row["id"], dict(row))
+    return sorted(found.values(), key=lambda contact: contact["id"], reverse=True)[:limit]
+
+# Import a contacts.csv written by earlier versions of the app. Each file is only
+# imported once, recorded by its absolute path. Returns the number of contacts added.
+def import_csv(path=LEGACY_CSV):
+    path = os.path.abspath(path)
+    conn = get_connection()
+    added = 0
+    with open(path, newline="") as f, conn:
+        # Take the write lock before checking, so concurrent importers run one at a time
+        conn.execute("BEGIN IMMEDIATE")
+        if conn.execute("SELECT 1 FROM contact_imports WHERE path = ?", (path,)).fetchone():
+            return 0
+        rows = csv.reader(f)
+        for row in rows:
+            if not row or row == ["Name", "Phone", "Email"]:
+                continue
+            name, phone, email = (row + ["", ""])[:3]
+            conn.execute(
+                "INSERT INTO contacts (name, phone, email, name_key, phone_key, email_key) VALUES (?, ?, ?, ?, ?, ?)",
+                (name.strip(), phone.strip(), email.strip(), name_key(name), phone_key(phone), email_key(email)),
+            )
+            added += 1
+        conn.execute("INSERT INTO contact_imports (path) VALUES (?)", (path,))
+    return added
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Manage the PLANTIFY contact store")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    import_parser = subparsers.add_parser("import", help="import a legacy contacts.csv")
+    import_parser.add_argument("csv_path", nargs="?", default=LEGACY_CSV)
+    args = parser.parse_args(argv)
+
+    if args.command == "import":
+        added = import_csv(args.csv_path)
+        print(f"Imported {added} contacts into {CONTACTS_DB}")
+
+
+if __name__ == "__main__":
+    main()
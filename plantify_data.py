@@ -0,0 +1,302 @@
+# Loader for the species, family and taxonomy tables.
+#
+# The tables live in an SQLite store (data/plantify.sqlite) instead of Python
+# literals, so the flora can grow without growing the source or import time.
+# Lookups go through indexed queries and the hot rows are memoized per process.
+#
+# The store is built from a plain-text seed beside it (data/plantify.sql: one
+# INSERT per row, in table order), which is what is kept under version control
+# and reviewed. A missing store is built from its seed on first use, and every
+# write through this module rewrites the seed, so the two never drift apart.
+#
+#   python plantify_data.py build    # rebuild the store from its seed
+#   python plantify_data.py dump     # rewrite the seed from the store
+import argparse
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+from functools import lru_cache
+from pathlib import Path
+
+
+DB_PATH = os.environ.get("PLANTIFY_DB", os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "plantify.sqlite"))
+SCHEMA_VERSION = 2
+# Tables written to the seed, in insert order (metadata comes from the schema)
+SEED_TABLES = ["families", "species", "taxonomy", "common_names"]
+
+TRAIT_COLUMNS = ["leaf_arrangement", "flower_symmetry", "petal_number", "ovary_position", "habit", "fruit_type", "leaf_shape", "inflorescence_type"]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS metadata (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS families (
+    name TEXT PRIMARY KEY,
+    order_name TEXT NOT NULL,
+    description TEXT NOT NULL,
+    ethnobotanical_uses TEXT NOT NULL,
+    reference TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS species (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    family TEXT NOT NULL REFERENCES families(name),
+    leaf_arrangement TEXT NOT NULL,
+    flower_symmetry TEXT NOT NULL,
+    petal_number TEXT NOT NULL,
+    ovary_position TEXT NOT NULL,
+    habit TEXT NOT NULL,
+    fruit_type TEXT NOT NULL,
+    leaf_shape TEXT NOT NULL,
+    inflorescence_type TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS species_by_family ON species(family);
+CREATE INDEX IF NOT EXISTS species_by_traits ON species(leaf_arrangement, flower_symmetry, petal_number, ovary_position, habit, fruit_type, leaf_shape, inflorescence_type);
+CREATE TABLE IF NOT EXISTS taxonomy (
+    species TEXT PRIMARY KEY REFERENCES species(name),
+    kingdom TEXT NOT NULL,
+    division TEXT NOT NULL,
+    class TEXT NOT NULL,
+    order_name TEXT NOT NULL,
+    family TEXT NOT NULL,
+    genus TEXT NOT NULL,
+    epithet TEXT NOT NULL,
+    description TEXT
+);
+CREATE TABLE IF NOT EXISTS common_names (
+    species TEXT NOT NULL REFERENCES species(name),
+    name TEXT NOT NULL,
+    language TEXT NOT NULL,
+    PRIMARY KEY (species, name)
+);
+"""
+
+_local = threading.local()
+
+
+def connect(path=DB_PATH, readonly=True):
+    if readonly:
+        conn = sqlite3.connect(Path(path).resolve().as_uri() + "?mode=ro", uri=True, check_same_thread=False)
+    else:
+        conn = sqlite3.connect(path)
+    conn.row_factory = sqlite3.Row
+    return conn
+
+# Create an empty store with the current schema
+def create_store(path=DB_PATH):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    conn = connect(path, readonly=False)
+    with conn:
+        conn.executescript(SCHEMA)
+        conn.execute("INSERT OR REPLACE INTO metadata (key, value) VALUES ('schema_version', ?)", (str(SCHEMA_VERSION),))
+    return conn
+
+def seed_path(path=DB_PATH):
+    return os.path.splitext(path)[0] + ".sql"
+
+# Build the store at `path` from its seed: the current schema plus the seed's
+# rows. The store is written to a temporary file first, so concurrent first
+# uses never see a partial store.
+def build_store(path=DB_PATH):
+    with open(seed_path(path), encoding="utf-8") as f:
+        script = f.read()
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(prefix=os.path.basename(path) + ".", suffix=".tmp", dir=directory)
+    os.close(fd)
+    try:
+        conn = create_store(tmp)
+        try:
+            conn.executescript(script)
+        finally:
+            conn.close()
+        os.chmod(tmp, 0o644)
+        os.replace(tmp, path)
+    except BaseException:
+        os.remove(tmp)
+        raise
+
+# Build the store from its seed if it does not exist yet
+def ensure_store(path=DB_PATH):
+    if not os.path.exists(path) and os.path.exists(seed_path(path)):
+        build_store(path)
+
+# Rewrite the seed from the store: one INSERT per row in rowid order, so a data
+# change is a reviewable text diff
+def dump_store(path=DB_PATH):
+    conn = connect(path)
+    try:
+        lines = ["-- Seed for plantify_data.py; rebuild the store with `python plantify_data.py build`"]
+        for table in SEED_TABLES:
+            columns = [row["name"] for row in conn.execute(f"PRAGMA table_info({table})")]
+            query = f"SELECT {', '.join(f'quote({col})' for col in columns)} FROM {table} ORDER BY rowid"
+            for row in conn.execute(query):
+                lines.append(f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join(row)});")
+    finally:
+        conn.close()
+    seed = seed_path(path)
+    with open(seed + ".tmp", "w", encoding="utf-8", newline="\n") as f:
+        f.write("\n".join(lines) + "\n")
+    os.replace(seed + ".tmp", seed)
+
+# One read-only connection per thread, reopened if the store path changes or
+# the process has forked (SQLite connections must not cross a fork)
+def _reader():
+    conn = getattr(_local, "conn", None)
+    if conn is None or getattr(_local, "path", None) != DB_PATH or getattr(_local, "pid", None) != os.getpid():
+        ensure_store(DB_PATH)
+        conn = connect(DB_PATH)
+        _local.conn = conn
+        _local.path = DB_PATH
+        _local.pid = os.getpid()
+    return conn
+
+# Cheap fingerprint of the store file, used to key caches on data changes
+def data_version(path=DB_PATH):
+    ensure_store(path)
+    stat = os.stat(path)
+    return (path, stat.st_mtime_ns, stat.st_size)
+
+def clear_caches():
+    _taxonomy.cache_clear()
+    _family_info.cache_clear()
+
+# All species as (traits, (family, species)) records in insertion order.
+# Several species can share exactly the same trait combination.
+def load_species_records():
+    rows = _reader().execute(f"SELECT name, family, {', '.join(TRAIT_COLUMNS)} FROM species ORDER BY id")
+    return [(tuple(row[col] for col in TRAIT_COLUMNS), (row["family"], row["name"])) for row in rows]
+
+def list_families():
+    return [row["name"] for row in _reader().execute("SELECT name FROM families ORDER BY name")]
+
+# English and regional names as (species, name, language) rows. Stores made
+# before schema version 2 have none.
+def list_common_names():
+    try:
+        rows = _reader().execute("SELECT species, name, language FROM common_names ORDER BY species, rowid")
+    except sqlite3.OperationalError:
+        return []
+    return [(row["species"], row["name"], row["language"]) for row in rows]
+
+# Taxonomic hierarchy for a species, synthesized from its name and family when
+# not documented. Memoized per data_version, so an edit to the store is seen on
+# the next call even before a reload clears the caches.
+def get_taxonomy(species, family):
+    return _taxonomy(species, family, data_version())
+
+@lru_cache(maxsize=4096)
+def _taxonomy(species, family, version):
+    row = _reader().execute("SELECT * FROM taxonomy WHERE species = ?", (species,)).fetchone()
+    if row:
+        taxonomy = {
+            "Kingdom": row["kingdom"],
+            "Division": row["division"],
+            "Class": row["class"],
+            "Order": row["order_name"],
+            "Family": row["family"],
+            "Genus": row["genus"],
+            "Species": row["epithet"],
+        }
+        if row["description"]:
+            taxonomy["description"] = row["description"]
+        return taxonomy
+    order = _reader().execute("SELECT order_name FROM families WHERE name = ?", (family,)).fetchone()
+    return {
+        "Kingdom": "Plantae",
+        "Division": "Magnoliophyta",
+        "Class": "Magnoliopsida",
+        "Order": order["order_name"] if order else "Unknown",
+        "Family": family,
+        "Genus": species.split()[0],
+        "Species": species.split()[1] if len(species.split()) > 1 else species,
+    }
+
+def get_family_info(family):
+    return _family_info(family, data_version())
+
+@lru_cache(maxsize=1024)
+def _family_info(family, version):
+    row = _reader().execute("SELECT description, ethnobotanical_uses, reference FROM families WHERE name = ?", (family,)).fetchone()
+    if row:
+        return dict(row)
+    return {
+        "description": "Description not available.",
+        "ethnobotanical_uses": "Ethnobotanical uses not documented.",
+        "reference": "Not available."
+    }
+
+# Append species, and any families they need, in one write transaction, then
+# rewrite the seed. Species already in the store (by name) are left untouched,
+# as are existing families. Returns the names of the species that were added.
+def insert_species(species_rows, families=(), path=DB_PATH):
+    ensure_store(path)
+    conn = connect(path, readonly=False)
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        conn.executemany(
+            "INSERT OR IGNORE INTO families (name, order_name, description, ethnobotanical_uses, reference) VALUES (?, ?, ?, ?, ?)",
+            [(f["name"], f["order_name"], f["description"], f["ethnobotanical_uses"], f["reference"]) for f in families],
+        )
+        added = []
+        for row in species_rows:
+            cursor = conn.execute(
+                f"INSERT OR IGNORE INTO species (name, family, {', '.join(TRAIT_COLUMNS)}) VALUES ({', '.join('?' * (len(TRAIT_COLUMNS) + 2))})",
+                [row["name"], row["family"]] + [row[col] for col in TRAIT_COLUMNS],
+            )
+            if cursor.rowcount:
+                added.append(row["name"])
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+    if added:
+        dump_store(path)
+    return added
+
+# Add (species, name, language) rows for species already in the store,
+# upgrading an older store's schema first, then rewrite the seed. Names already
+# recorded for a species are skipped. Returns the number of names added.
+def insert_common_names(rows, path=DB_PATH):
+    ensure_store(path)
+    create_store(path).close()
+    conn = connect(path, readonly=False)
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        added = 0
+        for species, name, language in rows:
+            cursor = conn.execute("INSERT OR IGNORE INTO common_names (species, name, language) VALUES (?, ?, ?)", (species, name, language))
+            added += cursor.rowcount
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+    if added:
+        dump_store(path)
+    return added
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the PLANTIFY data store from its SQL seed, or rewrite the seed")
+    parser.add_argument("command", choices=["build", "dump"], help="build: store from seed; dump: seed from store")
+    parser.add_argument("--db", default=DB_PATH, help="path of the SQLite store; its seed is the same path with .sql")
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        build_store(args.db)
+        print(f"Built {args.db} from {seed_path(args.db)}")
+    else:
+        dump_store(args.db)
+        print(f"Wrote {seed_path(args.db)} from {args.db}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,235 @@
+# Offline model evaluation and selection.
+#
+#   python plantify_evaluate.py                 # evaluate, reusing a current report
+#   python plantify_evaluate.py --force -j 8    # re-run on 8 cores
+#
+# The served pipeline and every candidate estimator are scored with
+# leave-one-out and repeated 5-fold CV, with all (candidate, split) fits spread
+# over the cores by joblib. For the served pipeline each fold trains the model
+# and builds its trait index, compiled trees and similarity engine from the
+# training rows, then ranks the held-out rows with rank_batch, exactly as the
+# app and API do. Every species has a single record, so a held-out species is
+# never in the training set and species-level CV accuracy is zero by
+# construction; it is not reported. The score is family-level accuracy (is the
+# top-ranked species in the right family), which is what the app shows. The
+# report is keyed on the trait table hash and only recomputed when the data or
+# the evaluation settings change.
+import argparse
+import json
+import os
+import sys
+
+import numpy as np
+
+from plantify_data import load_species_records
+from plantify_model import ARTIFACT_PATH, build_dataset, build_trait_index, sklearn_version, trait_table_hash
+
+
+EVALUATION_FORMAT_VERSION = 2
+EVALUATION_PATH = os.path.join(os.path.dirname(ARTIFACT_PATH), "plantify_evaluation.json")
+DEFAULT_REPEATS = 10
+
+# train_model's estimator ranked through rank_batch, as the app and API serve it
+SERVED_CANDIDATE = "served(family_then_species + similarity rerank)"
+
+
+# (name, estimator) pairs to compare with the served pipeline
+def candidate_estimators(species_family=None):
+    from sklearn.ensemble import ExtraTreesClassifier, RandomForestClassifier
+    from sklearn.neighbors import KNeighborsClassifier
+    from sklearn.tree import DecisionTreeClassifier
+
+    from plantify_hierarchy import FamilySpeciesClassifier
+
+    candidates = []
+    for min_samples_leaf in (1, 2):
+        candidates.append((
+            f"family_then_species(min_samples_leaf={min_samples_leaf})",
+            FamilySpeciesClassifier(species_family, min_samples_leaf=min_samples_leaf, random_state=42, n_jobs=1),
+        ))
+    for max_depth in (None, 4, 6, 8, 12):
+        for min_samples_leaf in (1, 2, 3, 5):
+            candidates.append((
+                f"decision_tree(max_depth={max_depth}, min_samples_leaf={min_samples_leaf})",
+                DecisionTreeClassifier(random_state=42, max_depth=max_depth, min_samples_leaf=min_samples_leaf),
+            ))
+    for min_samples_leaf in (1, 2):
+        candidates.append((
+            f"random_forest(n_estimators=50, min_samples_leaf={min_samples_leaf})",
+            RandomForestClassifier(n_estimators=50, min_samples_leaf=min_samples_leaf, random_state=42, n_jobs=1),
+        ))
+        candidates.append((
+            f"extra_trees(n_estimators=50, min_samples_leaf={min_samples_leaf})",
+            ExtraTreesClassifier(n_estimators=50, min_samples_leaf=min_samples_leaf, random_state=42, n_jobs=1),
+        ))
+    for n_neighbors in (1, 3, 5):
+        candidates.append((
+            f"knn_hamming(n_neighbors={n_neighbors})",
+            KNeighborsClassifier(n_neighbors=n_neighbors, metric="hamming", algorithm="brute"),
+        ))
+    return candidates
+
+def cv_schemes(repeats=DEFAULT_REPEATS):
+    from sklearn.model_selection import LeaveOneOut, RepeatedKFold
+
+    return [
+        ("leave_one_out", LeaveOneOut()),
+        (f"repeated_5fold_x{repeats}", RepeatedKFold(n_splits=5, n_repeats=repeats, random_state=42)),
+    ]
+
+# One CV fit, run in a joblib worker: returns the test rows and their predictions
+def fit_predict(estimator, X, y, train, test):
+    from sklearn.base import clone
+
+    model = clone(estimator).fit(X[train], y[train])
+    return test, model.predict(X[test])
+
+# One CV fold of the served pipeline: the top species rank_batch gives each test row
+def fit_rank(records, train, test):
+    from plantify_model import prepare_model, rank_batch, train_model
+
+    training = [records[i] for i in train]
+    model = prepare_model(train_model(training, n_jobs=1), training)
+    ranked = rank_batch(model, [tuple(records[i][0]) for i in test])
+    return test, np.array([candidates[0][0] for candidates in ranked], dtype=object)
+
+def score_predictions(pairs, y, family_of):
+    correct_family = 0
+    total = 0
+    for test, predicted in pairs:
+        correct_family += int(np.sum(family_of(predicted) == family_of(y[test])))
+        total += len(test)
+    return {
+        "family_accuracy": correct_family / total,
+        "predictions": total,
+    }
+
+def settings(repeats):
+    return {
+        "format_version": EVALUATION_FORMAT_VERSION,
+        "sklearn_version": sklearn_version(),
+        "repeats": repeats,
+        "candidates": [SERVED_CANDIDATE] + [name for name, _ in candidate_estimators()],
+    }
+
+def run_evaluation(records, n_jobs=-1, repeats=DEFAULT_REPEATS):
+    from joblib import Parallel, delayed
+
+    df, df_encoded = build_dataset(records)
+    X = df_encoded.to_numpy(dtype=np.float32)
+    y = df["species"].to_numpy()
+    species_family = dict(zip(df["species"], df["family"]))
+    family_of = np.vectorize(species_family.get, otypes=[object])
+
+    # None stands for the served pipeline, which fits on the records rather than X
+    candidates = [(SERVED_CANDIDATE, None)] + candidate_estimators(species_family)
+    schemes = cv_schemes(repeats)
+    jobs = []
+    for candidate_index, (name, estimator) in enumerate(candidates):
+        for scheme_index, (scheme, splitter) in enumerate(schemes):
+            for train, test in splitter.split(X):
+                jobs.append((candidate_index, scheme_index, estimator, train, test))
+
+    outputs = Parallel(n_jobs=n_jobs, batch_size="auto")(
+        delayed(fit_rank)(records, train, test) if estimator is None else delayed(fit_predict)(estimator, X, y, train, test)
+        for _, _, estimator, train, test in jobs
+    )
+
+    grouped = {}
+    for (candidate_index, scheme_index, _, _, _), (test, predicted) in zip(jobs, outputs):
+        grouped.setdefault((candidate_index, scheme_index), []).append((test, predicted))
+
+    results = []
+    for candidate_index, (name, _) in enumerate(candidates):
+        entry = {"candidate": name}
+        for scheme_index, (scheme, _) in enumerate(schemes):
+            entry[scheme] = score_predictions(grouped[(candidate_index, scheme_index)], y, family_of)
+        results.append(entry)
+
+    # Best family accuracy under leave-one-out, ties broken by repeated k-fold
+    # and then by candidate order (simpler models first)
+    repeated = schemes[1][0]
+    best = max(
+        enumerate(results),
+        key=lambda item: (item[1]["leave_one_out"]["family_accuracy"], item[1][repeated]["family_accuracy"], -item[0]),
+    )[1]
+    served = next(entry for entry in results if entry["candidate"] == SERVED_CANDIDATE)
+    trait_index = build_trait_index(records)
+    return {
+        "data_hash": trait_table_hash(records),
+        "settings": settings(repeats),
+        "species": len(y),
+        "families": len(set(species_family.values())),
+        # Species whose trait combination no other species shares: the most any
+        # trait-only classifier could name exactly
+        "trait_identifiable_species": sum(1 for names in trait_index.values() if len(names) == 1),
+        "served": served,
+        "selected": best,
+        "results": results,
+    }
+
+def save_evaluation(report, path=EVALUATION_PATH):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path + ".tmp", "w") as f:
+        json.dump(report, f, indent=2)
+    os.replace(path + ".tmp", path)
+
+# The saved report, or None if there is none for this trait table
+def load_evaluation(path=EVALUATION_PATH, expected_hash=None):
+    try:
+        with open(path) as f:
+            report = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if report.get("settings", {}).get("format_version") != EVALUATION_FORMAT_VERSION:
+        return None
+    if expected_hash is not None and report.get("data_hash") != expected_hash:
+        return None
+    return report
+
+# Reuse the saved report when the data and settings are unchanged
+def evaluate(records, path=EVALUATION_PATH, n_jobs=-1, repeats=DEFAULT_REPEATS, force=False):
+    if not force:
+        report = load_evaluation(path, expected_hash=trait_table_hash(records))
+        if report is not None and report["settings"] == settings(repeats):
+            return report, True
+    report = run_evaluation(records, n_jobs=n_jobs, repeats=repeats)
+    save_evaluation(report, path)
+    return report, False
+
+def print_report(report):
+    schemes = [key for key in report["served"] if key != "candidate"]
+    print(f"{report['species']} species in {report['families']} families; "
+          f"{report['trait_identifiable_species']} have a trait combination no other species shares")
+    header = "".join(f"  {scheme:>24}" for scheme in schemes)
+    print("\nFamily accuracy (species accuracy is zero by construction: every species has one record)")
+    print(f"{'candidate':<56}{header}")
+    for entry in sorted(report["results"], key=lambda e: e["leave_one_out"]["family_accuracy"], reverse=True):
+        cells = "".join(f"  {entry[scheme]['family_accuracy']:>24.1%}" for scheme in schemes)
+        marker = " *" if entry["candidate"] == report["served"]["candidate"] else ""
+        print(f"{entry['candidate'] + marker:<56}{cells}")
+    print("\n* served by the app")
+    print(f"Best by leave-one-out family accuracy: {report['selected']['candidate']} "
+          f"({report['selected']['leave_one_out']['family_accuracy']:.1%})")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Cross-validate and compare PLANTIFY classifiers offline")
+    parser.add_argument("--output", default=EVALUATION_PATH, help="path of the evaluation report JSON")
+    parser.add_argument("-j", "--n-jobs", type=int, default=-1, help="parallel workers (default: all cores)")
+    parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS, help="repetitions of 5-fold CV")
+    parser.add_argument("--force", action="store_true", help="re-run even if the report is current")
+    args = parser.parse_args(argv)
+
+    # sklearn warns on every split where a class has fewer members than folds;
+    # set through the environment so the joblib workers inherit it
+    os.environ.setdefault("PYTHONWARNINGS", "ignore::UserWarning")
+    import warnings
+    warnings.filterwarnings("ignore", category=UserWarning)
+    report, cached = evaluate(load_species_records(), args.output, n_jobs=args.n_jobs, repeats=args.repeats, force=args.force)
+    print_report(report)
+    print(f"\n{'Report is current' if cached else 'Wrote'} {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
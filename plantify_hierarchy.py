@@ -0,0 +1,86 @@
+# Two-stage classifier: a family model, then a species model per family.
+#
+# One decision tree over every species gets deeper, slower to fit and larger to
+# store as the catalogue grows, and any data edit refits all of it. Here a tree
+# over the families picks the family and a small tree per family picks the
+# species within it, so a species' confidence is P(family) * P(species | family).
+# The per-family trees are fitted in parallel threads (the tree builder releases
+# the GIL). Each one is keyed by a hash of its family's rows, and a refit given
+# the previous estimator reuses every family tree whose rows are unchanged: after
+# an edit to one family only the family model and that family's tree are refitted.
+# The result is the same as a full refit because every tree is seeded.
+#
+# Serving uses the compiled form, plantify_tree.CompiledHierarchy.
+import hashlib
+
+import numpy as np
+from sklearn.base import BaseEstimator, ClassifierMixin
+from sklearn.tree import DecisionTreeClassifier
+
+
+# Fit one family's species tree; runs in a joblib worker thread
+def fit_species_tree(params, X, y):
+    return DecisionTreeClassifier(**params).fit(X, y)
+
+
+class FamilySpeciesClassifier(ClassifierMixin, BaseEstimator):
+    def __init__(self, species_family=None, min_samples_leaf=1, random_state=42, n_jobs=None):
+        self.species_family = species_family
+        self.min_samples_leaf = min_samples_leaf
+        self.random_state = random_state
+        self.n_jobs = n_jobs
+
+    def _tree_params(self):
+        return {"random_state": self.random_state, "min_samples_leaf": self.min_samples_leaf}
+
+    # Hash of a family's training rows and the tree settings; equal hashes mean
+    # refitting that family's tree would give the same tree
+    def _family_hash(self, X, y):
+        digest = hashlib.sha256(repr(sorted(self._tree_params().items())).encode())
+        digest.update(np.ascontiguousarray(X, dtype=np.float32).tobytes())
+        digest.update("\0".join(y).encode())
+        return digest.hexdigest()
+
+    # Fit on encoded rows X and species labels y. With `previous` (an earlier
+    # fitted FamilySpeciesClassifier over the same feature columns), family
+    # trees whose rows have not changed are taken from it instead of refitted.
+    def fit(self, X, y, previous=None):
+        from joblib import Parallel, delayed
+
+        X = np.asarray(X, dtype=np.float32)
+        y = np.asarray(y).astype(str)
+        families = np.array([self.species_family[name] for name in y])
+        self.classes_ = np.unique(y)
+        self.family_clf_ = DecisionTreeClassifier(**self._tree_params()).fit(X, families)
+
+        rows = {str(family): np.flatnonzero(families == family) for family in self.family_clf_.classes_}
+        self.family_hashes_ = {family: self._family_hash(X[r], y[r]) for family, r in rows.items()}
+        self.species_clfs_ = {}
+        if previous is not None:
+            for family, digest in self.family_hashes_.items():
+                if previous.family_hashes_.get(family) == digest:
+                    self.species_clfs_[family] = previous.species_clfs_[family]
+        self.refitted_ = [family for family in rows if family not in self.species_clfs_]
+        fitted = Parallel(n_jobs=self.n_jobs, prefer="threads")(
+            delayed(fit_species_tree)(self._tree_params(), X[rows[family]], y[rows[family]]) for family in self.refitted_
+        )
+        self.species_clfs_.update(zip(self.refitted_, fitted))
+        return self
+
+    # Species probabilities in classes_ order: each family's species tree is
+    # only evaluated on the rows the family model gives that family any weight
+    def predict_proba(self, X):
+        X = np.asarray(X, dtype=np.float32)
+        family_proba = self.family_clf_.predict_proba(X)
+        proba = np.zeros((X.shape[0], len(self.classes_)))
+        for j, family in enumerate(self.family_clf_.classes_):
+            rows = np.flatnonzero(family_proba[:, j] > 0)
+            if len(rows) == 0:
+                continue
+            clf = self.species_clfs_[family]
+            columns = np.searchsorted(self.classes_, clf.classes_)
+            proba[np.ix_(rows, columns)] += family_proba[rows, j][:, None] * clf.predict_proba(X[rows])
+        return proba
+
+    def predict(self, X):
+        return self.classes_[np.argmax(self.predict_proba(X), axis=1)]
@@ -0,0 +1,358 @@
+# Optional photo identification.
+#
+#   pip install -r requirements-image.txt
+#   python plantify_image.py build photos/          # photos/<species name>/*.jpg
+#
+# `build` fine-tunes a small ImageNet-pretrained CNN (MobileNetV2) on the
+# photos and converts it to TFLite with full-integer INT8 quantization, writing
+# models/plantify_image.tflite and a label manifest. Building needs TensorFlow;
+# serving only needs a TFLite interpreter (ai-edge-litert or tflite-runtime,
+# TensorFlow's own if that is what is installed). Without a built model or an
+# interpreter the photo path is simply unavailable.
+#
+# Serving: each photo is decoded at reduced scale (JPEG draft mode), centre
+# cropped and resized to the model input, then normalized and quantized in one
+# table lookup per pixel. Decoding runs in the caller's thread (Pillow
+# releases the GIL), and photos that queue up while the interpreter is busy are
+# run together by a MicroBatcher as one call of up to MAX_BATCH photos, which
+# lets the interpreter's threads split larger tensors.
+import argparse
+import json
+import os
+import queue
+import sys
+import threading
+import time
+from concurrent.futures import Future
+from functools import lru_cache
+from io import BytesIO
+
+import numpy as np
+
+from plantify_metrics import timed
+from plantify_model import ARTIFACT_PATH, file_checksum
+
+
+IMAGE_FORMAT_VERSION = 1
+IMAGE_MODEL_PATH = os.path.join(os.path.dirname(ARTIFACT_PATH), "plantify_image.tflite")
+IMAGE_SIZE = 160
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".webp")
+# MobileNetV2 expects pixels scaled to [-1, 1]
+INPUT_RANGE = (-1.0, 1.0)
+
+# Share of the merged confidence that comes from the photo
+IMAGE_WEIGHT = float(os.environ.get("PLANTIFY_IMAGE_WEIGHT", "0.5"))
+MAX_BATCH = 8
+# How long the batcher waits for more photos once it has one. Zero batches only
+# what queued while the previous batch ran: measured on a single core, waiting
+# 2 ms cost a lone request about a quarter of its throughput and gained nothing
+# under load.
+MAX_WAIT_SECONDS = float(os.environ.get("PLANTIFY_IMAGE_MAX_WAIT", "0"))
+NUM_THREADS = os.cpu_count() or 1
+
+
+def labels_path(model_path):
+    return os.path.splitext(model_path)[0] + ".json"
+
+def interpreter_class():
+    try:
+        from ai_edge_litert.interpreter import Interpreter
+        return Interpreter
+    except ImportError:
+        pass
+    try:
+        from tflite_runtime.interpreter import Interpreter
+        return Interpreter
+    except ImportError:
+        pass
+    try:
+        import tensorflow as tf
+        return tf.lite.Interpreter
+    except ImportError:
+        return None
+
+# Decode, centre-crop and resize one photo to an (size, size, 3) uint8 array
+def load_pixels(data, size=IMAGE_SIZE):
+    from PIL import Image, ImageOps
+
+    with Image.open(BytesIO(data) if isinstance(data, bytes) else data) as image:
+        # JPEG: let the decoder produce a 1/2..1/8 scale image directly
+        image.draft("RGB", (size, size))
+        image = ImageOps.exif_transpose(image).convert("RGB")
+        image = ImageOps.fit(image, (size, size), Image.BILINEAR)
+    return np.asarray(image, dtype=np.uint8)
+
+
+class ImageClassifier:
+    def __init__(self, model_path=IMAGE_MODEL_PATH, num_threads=NUM_THREADS):
+        Interpreter = interpreter_class()
+        if Interpreter is None:
+            raise ImportError("photo identification needs a TFLite interpreter: pip install -r requirements-image.txt")
+        with open(labels_path(model_path)) as f:
+            manifest = json.load(f)
+        if manifest.get("format_version") != IMAGE_FORMAT_VERSION:
+            raise ValueError(f"Image model format {manifest.get('format_version')} does not match {IMAGE_FORMAT_VERSION}")
+        if manifest.get("sha256") != file_checksum(model_path):
+            raise ValueError("Image model checksum mismatch")
+        self.species = manifest["species"]
+        self.model_path = model_path
+        self.num_threads = num_threads
+        self._Interpreter = Interpreter
+        # One interpreter per batch size bucket, so a batch never reallocates tensors
+        self._interpreters = {}
+        self._lock = threading.Lock()
+
+        interpreter = self._interpreter(1)
+        details = interpreter.get_input_details()[0]
+        self.size = int(details["shape"][1])
+        self.input_dtype = details["dtype"]
+        # Normalization and input quantization folded into a 256-entry table
+        low, high = manifest.get("input_range", INPUT_RANGE)
+        values = low + np.arange(256, dtype=np.float64) * (high - low) / 255.0
+        scale, zero_point = details["quantization"]
+        if scale:
+            info = np.iinfo(self.input_dtype)
+            values = np.clip(np.round(values / scale + zero_point), info.min, info.max)
+        self.pixel_table = values.astype(self.input_dtype)
+        self.batcher = MicroBatcher(self.predict_batch)
+
+    def _interpreter(self, batch_size):
+        interpreter = self._interpreters.get(batch_size)
+        if interpreter is None:
+            interpreter = self._Interpreter(model_path=self.model_path, num_threads=self.num_threads)
+            if batch_size != 1:
+                details = interpreter.get_input_details()[0]
+                interpreter.resize_tensor_input(details["index"], [batch_size] + list(details["shape"][1:]))
+            interpreter.allocate_tensors()
+            self._interpreters[batch_size] = interpreter
+        return interpreter
+
+    # Model input for one photo: decoded pixels mapped through the table
+    def preprocess(self, data):
+        return self.pixel_table[load_pixels(data, self.size)]
+
+    # Species probabilities for an (n, size, size, 3) array of preprocessed photos
+    def predict_batch(self, inputs):
+        n = len(inputs)
+        bucket = 1
+        while bucket < n:
+            bucket *= 2
+        if bucket > n:
+            inputs = np.concatenate([inputs, np.zeros((bucket - n,) + inputs.shape[1:], dtype=inputs.dtype)])
+        with self._lock, timed("plantify_image_seconds", batch=str(bucket)):
+            interpreter = self._interpreter(bucket)
+            input_details = interpreter.get_input_details()[0]
+            output_details = interpreter.get_output_details()[0]
+            interpreter.set_tensor(input_details["index"], inputs)
+            interpreter.invoke()
+            output = interpreter.get_tensor(output_details["index"])[:n].astype(np.float32)
+        scale, zero_point = output_details["quantization"]
+        if scale:
+            output = (output - zero_point) * scale
+        return output
+
+    # Up to top_k (species, probability) candidates, best first. Photos from
+    # concurrent callers are run together.
+    def rank(self, data, top_k=5):
+        with timed("plantify_image_preprocess_seconds"):
+            pixels = self.preprocess(data)
+        probabilities = self.batcher(pixels)
+        order = np.argsort(-probabilities, kind="stable")[:top_k]
+        return [(self.species[i], float(probabilities[i])) for i in order.tolist()]
+
+
+# Gathers single items submitted from many threads into batches: the worker
+# takes the first waiting item, then whatever else is queued or arrives within
+# max_wait, up to max_batch, and runs them through `run` together.
+class MicroBatcher:
+    def __init__(self, run, max_batch=MAX_BATCH, max_wait=MAX_WAIT_SECONDS):
+        self.run = run
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self._queue = queue.Queue()
+        self._worker = None
+        self._lock = threading.Lock()
+
+    def submit(self, item):
+        future = Future()
+        self._queue.put((item, future))
+        if self._worker is None:
+            with self._lock:
+                if self._worker is None:
+                    self._worker = threading.Thread(target=self._serve, name="plantify-image-batcher", daemon=True)
+                    self._worker.start()
+        return future
+
+    def __call__(self, item):
+        return self.submit(item).result()
+
+    def _serve(self):
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.max_wait
+            while len(batch) < self.max_batch:
+                try:
+                    batch.append(self._queue.get_nowait())
+                    continue
+                except queue.Empty:
+                    pass
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            try:
+                results = self.run(np.stack([item for item, _ in batch]))
+            except Exception as e:
+                for _, future in batch:
+                    future.set_exception(e)
+                continue
+            for (_, future), result in zip(batch, results):
+                future.set_result(result)
+
+
+# The classifier for the built model, or None if there is no model or no
+# interpreter. Loaded once per model file version.
+def get_image_classifier(model_path=IMAGE_MODEL_PATH):
+    try:
+        stat = os.stat(labels_path(model_path))
+    except OSError:
+        return None
+    return _load_classifier(model_path, stat.st_mtime_ns)
+
+@lru_cache(maxsize=1)
+def _load_classifier(model_path, version):
+    try:
+        return ImageClassifier(model_path)
+    except (ImportError, OSError, ValueError) as e:
+        print(f"Photo identification unavailable: {str(e)}")
+        return None
+
+# Blend photo and trait candidates. Each species gets
+# image_weight * photo probability + (1 - image_weight) * trait confidence;
+# photo candidates not in the species table are dropped.
+def merge_rankings(trait_candidates, image_candidates, species_family, image_weight=IMAGE_WEIGHT, top_k=5):
+    scores = {}
+    for name, confidence in trait_candidates:
+        scores[name] = (1 - image_weight) * confidence
+    for name, probability in image_candidates:
+        if name in species_family:
+            scores[name] = scores.get(name, 0.0) + image_weight * probability
+    merged = sorted(scores.items(), key=lambda item: -item[1])
+    return [(name, round(score, 4)) for name, score in merged[:top_k]]
+
+# Headless identification from a photo (bytes, a path or a file object),
+# optionally combined with the eight traits. Returns (species, confidence)
+# candidates, best first.
+def identify(photo, traits=None, model=None, top_k=5):
+    classifier = get_image_classifier()
+    if classifier is None:
+        raise RuntimeError("No image model available; run `python plantify_image.py build` first")
+    if isinstance(photo, str):
+        with open(photo, "rb") as f:
+            photo = f.read()
+    image_candidates = classifier.rank(photo, top_k=max(top_k, MAX_BATCH))
+    if traits is None:
+        return image_candidates[:top_k]
+    from plantify_lookup import LOOKUP_TOP_K
+    from plantify_model import normalize_inputs, rank, validate_inputs
+
+    traits = normalize_inputs(traits)
+    is_valid, error_msg = validate_inputs(traits)
+    if not is_valid:
+        raise ValueError(error_msg)
+
+    if model is None:
+        from plantify_data import load_species_records
+        from plantify_model import load_or_train
+
+        model = load_or_train(load_species_records())
+    return merge_rankings(rank(model, traits, LOOKUP_TOP_K), image_candidates, model["species_family"], top_k=top_k)
+
+
+def photo_dataset(directory, size, batch_size):
+    import tensorflow as tf
+
+    return tf.keras.utils.image_dataset_from_directory(
+        directory, image_size=(size, size), batch_size=batch_size, label_mode="int", crop_to_aspect_ratio=True,
+    )
+
+# Fine-tune a pretrained MobileNetV2 head on the photos and write the INT8 TFLite model
+# `weights` is passed to Keras: "imagenet" (downloaded), a local weights file, or
+# None to train the backbone from scratch
+def build_image_model(photos, output=IMAGE_MODEL_PATH, size=IMAGE_SIZE, alpha=0.35, epochs=5, weights="imagenet", calibration_batches=20):
+    import tensorflow as tf
+
+    dataset = photo_dataset(photos, size, 32)
+    species = list(dataset.class_names)
+    low, high = INPUT_RANGE
+    backbone = tf.keras.applications.MobileNetV2(input_shape=(size, size, 3), alpha=alpha, include_top=False, weights=weights)
+    backbone.trainable = weights is None
+    inputs = tf.keras.Input((size, size, 3))
+    features = tf.keras.layers.GlobalAveragePooling2D()(backbone(inputs, training=False))
+    outputs = tf.keras.layers.Dense(len(species), activation="softmax")(tf.keras.layers.Dropout(0.2)(features))
+    classifier = tf.keras.Model(inputs, outputs)
+    classifier.compile(optimizer="adam", loss="sparse_categorical_crossentropy", metrics=["accuracy"])
+    # The served model takes pixels already normalized to INPUT_RANGE
+    normalized = dataset.map(lambda x, y: (x * ((high - low) / 255.0) + low, y)).prefetch(tf.data.AUTOTUNE)
+    classifier.fit(normalized, epochs=epochs)
+
+    def representative_data():
+        for x, _ in normalized.unbatch().batch(1).take(calibration_batches * 8):
+            yield [x]
+
+    converter = tf.lite.TFLiteConverter.from_keras_model(classifier)
+    converter.optimizations = [tf.lite.Optimize.DEFAULT]
+    converter.representative_dataset = representative_data
+    converter.target_spec.supported_ops = [tf.lite.OpsSet.TFLITE_BUILTINS_INT8]
+    converter.inference_input_type = tf.int8
+    converter.inference_output_type = tf.int8
+    tflite_model = converter.convert()
+
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output + ".tmp", "wb") as f:
+        f.write(tflite_model)
+    os.replace(output + ".tmp", output)
+    manifest = {
+        "format_version": IMAGE_FORMAT_VERSION,
+        "sha256": file_checksum(output),
+        "backbone": f"MobileNetV2(alpha={alpha})",
+        "size": size,
+        "input_range": list(INPUT_RANGE),
+        "species": species,
+    }
+    with open(labels_path(output) + ".tmp", "w") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(labels_path(output) + ".tmp", labels_path(output))
+    return manifest
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Photo identification for PLANTIFY")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    build = subparsers.add_parser("build", help="fine-tune and convert the INT8 TFLite image model")
+    build.add_argument("photos", help="directory with one sub-directory of photos per species")
+    build.add_argument("--output", default=IMAGE_MODEL_PATH)
+    build.add_argument("--size", type=int, default=IMAGE_SIZE, help="input resolution in pixels")
+    build.add_argument("--alpha", type=float, default=0.35, help="MobileNetV2 width multiplier")
+    build.add_argument("--epochs", type=int, default=5)
+    build.add_argument("--weights", default="imagenet", help="'imagenet', a local weights file for offline builds, or 'none'")
+    identify_parser = subparsers.add_parser("identify", help="identify the species in one or more photos")
+    identify_parser.add_argument("photos", nargs="+")
+    identify_parser.add_argument("--top-k", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        weights = None if args.weights == "none" else args.weights
+        manifest = build_image_model(args.photos, args.output, size=args.size, alpha=args.alpha, epochs=args.epochs, weights=weights)
+        print(f"Wrote {args.output} ({len(manifest['species'])} species, {os.path.getsize(args.output) / 1e6:.1f} MB)")
+        return 0
+    for path in args.photos:
+        candidates = identify(path, top_k=args.top_k)
+        print(f"{path}: " + ", ".join(f"{name} ({score:.1%})" for name, score in candidates))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
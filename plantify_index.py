@@ -0,0 +1,191 @@
+import numpy as np
+
+from plantify_model import FEATURE_COLUMNS, TRAIT_OPTIONS
+
+
+# Ranks species against any subset of the eight traits.
+# For every (trait, value) pair it keeps a posting mask over the species table
+# (1 where the species has that value), so a query is the sum of at most eight
+# uint8 vectors followed by one radix sort of the match counts.
+class TraitQueryEngine:
+    def __init__(self, records):
+        self.species = [species for _, (family, species) in records]
+        self.families = [family for _, (family, species) in records]
+        self.n_species = len(self.species)
+        values = np.array([list(traits) for traits, _ in records], dtype=object).reshape(-1, len(FEATURE_COLUMNS))
+        self.postings = {}
+        for position, col in enumerate(FEATURE_COLUMNS):
+            for value in TRAIT_OPTIONS[col]:
+                self.postings[(col, value)] = (values[:, position] == value).astype(np.uint8)
+
+    # Return up to top_k (species, family, matched traits, score) tuples, best first.
+    # Blank traits are ignored; score is the fraction of given traits that match.
+    def query(self, traits, top_k=5):
+        specified = {col: value for col, value in traits.items() if value}
+        for col, value in specified.items():
+            if (col, value) not in self.postings:
+                raise ValueError(f"Invalid value for {col}: {value}")
+        if not specified or self.n_species == 0:
+            return []
+
+        matched = np.zeros(self.n_species, dtype=np.uint8)
+        for col, value in specified.items():
+            matched += self.postings[(col, value)]
+        # Sorting the mismatch count keeps the dtype uint8, which numpy sorts with a
+        # stable radix sort, so equal scores stay in table order
+        order = np.argsort(np.uint8(len(specified)) - matched, kind="stable")[:top_k]
+        return [
+            (self.species[i], self.families[i], int(matched[i]), float(matched[i]) / len(specified))
+            for i in order
+        ]
+
+
+# Relative importance of each trait in the similarity distance. A disagreement
+# on a trait costs its weight; distances are divided by the total weight of the
+# traits compared, so they run from 0 (identical) to 1 (nothing in common).
+TRAIT_WEIGHTS = {col: 1.0 for col in FEATURE_COLUMNS}
+
+# Trait codes outside every vocabulary, used for blank or unknown values
+UNKNOWN_CODE = 255
+
+
+# Weighted Hamming distance from a trait combination to every species.
+# Each (trait, value) pair keeps a float32 penalty vector (the trait's weight
+# where a species has a different value, else 0), so a query is at most eight
+# vector adds followed by a partial sort for the k nearest. Species traits are
+# also kept as a uint8 code matrix for scoring specific (row, species) pairs.
+# The penalty vectors are rows of one matrix, in FEATURE_COLUMNS then
+# TRAIT_OPTIONS order, so the engine can also be attached to shared arrays.
+class SimilarityEngine:
+    def __init__(self, records, weights=None):
+        weights = dict(TRAIT_WEIGHTS, **(weights or {}))
+        weights = np.array([weights[col] for col in FEATURE_COLUMNS], dtype=np.float32)
+        codes = self.encode([tuple(traits) for traits, _ in records])
+        penalties = np.zeros((sum(len(TRAIT_OPTIONS[col]) for col in FEATURE_COLUMNS), len(records)), dtype=np.float32)
+        row = 0
+        for position, col in enumerate(FEATURE_COLUMNS):
+            for code in range(len(TRAIT_OPTIONS[col])):
+                penalties[row] = (codes[:, position] != code) * weights[position]
+                row += 1
+        self._attach(
+            [species for _, (family, species) in records],
+            [family for _, (family, species) in records],
+            codes, weights, penalties,
+        )
+
+    # Engine over arrays built earlier, e.g. memory-mapped from a serving pack
+    @classmethod
+    def from_arrays(cls, species, families, codes, weights, penalties):
+        engine = cls.__new__(cls)
+        engine._attach(species, families, codes, weights, penalties)
+        return engine
+
+    def _attach(self, species, families, codes, weights, penalties):
+        self.species = list(species)
+        self.families = list(families)
+        self.species_index = {}
+        for i, name in enumerate(self.species):
+            self.species_index.setdefault(name, i)
+        self.n_species = len(self.species)
+        self.codes = codes
+        self.weights = weights
+        self.penalty_matrix = penalties
+        self.penalties = {}
+        # First penalty row of each trait, so a trait code maps straight to its row
+        self.penalty_offsets = np.cumsum([0] + [len(TRAIT_OPTIONS[col]) for col in FEATURE_COLUMNS[:-1]])
+        row = 0
+        for col in FEATURE_COLUMNS:
+            for value in TRAIT_OPTIONS[col]:
+                self.penalties[(col, value)] = penalties[row]
+                row += 1
+
+    # (N, 8) uint8 codes of trait rows in FEATURE_COLUMNS order
+    def encode(self, rows):
+        lookups = [{value: code for code, value in enumerate(TRAIT_OPTIONS[col])} for col in FEATURE_COLUMNS]
+        codes = np.full((len(rows), len(FEATURE_COLUMNS)), UNKNOWN_CODE, dtype=np.uint8)
+        for i, row in enumerate(rows):
+            for position, value in enumerate(row):
+                codes[i, position] = lookups[position].get(value, UNKNOWN_CODE)
+        return codes
+
+    # Up to k (species, family, distance) tuples, nearest first, ties in table
+    # order. Blank traits are left out of the comparison.
+    def nearest(self, traits, k=5):
+        specified = [(position, col, traits.get(col)) for position, col in enumerate(FEATURE_COLUMNS) if traits.get(col)]
+        for position, col, value in specified:
+            if (col, value) not in self.penalties:
+                raise ValueError(f"Invalid value for {col}: {value}")
+        if not specified or self.n_species == 0 or k <= 0:
+            return []
+
+        distance = np.zeros(self.n_species, dtype=np.float32)
+        for position, col, value in specified:
+            distance += self.penalties[(col, value)]
+        total = float(sum(self.weights[position] for position, _, _ in specified))
+        k = min(k, self.n_species)
+        # Everything within the k-th smallest distance, then a stable sort of just those
+        kth = np.partition(distance, k - 1)[k - 1]
+        candidates = np.flatnonzero(distance <= kth)
+        order = candidates[np.argsort(distance[candidates], kind="stable")][:k]
+        return [(self.species[i], self.families[i], float(distance[i]) / total) for i in order]
+
+    # For each trait row, the ids of the species nearest to it (every species
+    # at the smallest distance) and their similarity, 1 - distance. Blank or
+    # unknown values are left out of the comparison, as in nearest().
+    def nearest_groups(self, rows):
+        codes = self.encode(rows)
+        groups = []
+        # Rows per chunk, so the gathered penalties stay around 32 MB
+        chunk_size = max(1, (1 << 20) // max(1, self.n_species))
+        for start in range(0, len(codes), chunk_size):
+            chunk = codes[start:start + chunk_size]
+            # One gather of every row's eight penalty vectors; unknown values add nothing
+            known = chunk != UNKNOWN_CODE
+            penalty_rows = np.where(known, self.penalty_offsets + chunk, 0)
+            distance = (self.penalty_matrix[penalty_rows] * known[:, :, None]).sum(axis=1)
+            total = known @ self.weights
+            closest = distance.min(axis=1, initial=np.inf)
+            near = distance <= closest[:, None] + 1e-6
+            for i, (row_total, row_closest) in enumerate(zip(total.tolist(), closest.tolist())):
+                similarity = 1.0 - row_closest / row_total if row_total > 0 else 0.0
+                groups.append((np.flatnonzero(near[i]), similarity))
+        return groups
+
+    # Rank unseen trait rows among the species nearest to them, so the answer is
+    # never farther from the input than a species nearest() lists. `rankings`
+    # holds the classifier's (species, probability) candidates for each row.
+    # They decide between the equally near species: each is weighted by its
+    # probability, or, when none of them has any, by its family's probability
+    # (the sum over that family's candidates) shared among the family's nearest
+    # species, or else equally. Returns (species, family confidence, species
+    # confidence, similarity) lists, most likely first, where the family
+    # confidence is the family's share of the weight and the species confidence
+    # the species' share within its family. The confidence reported for a species
+    # is similarity * family confidence * species confidence.
+    def rank_nearest(self, rows, rankings):
+        ranked = []
+        for (ids, similarity), candidates in zip(self.nearest_groups(rows), rankings):
+            probability = dict(candidates)
+            members = [(self.species[i], self.families[i]) for i in ids.tolist()]
+            weights = [probability.get(name, 0.0) for name, _ in members]
+            if not any(weights):
+                family_probability = {}
+                for name, p in candidates:
+                    family = self.families[self.species_index[name]]
+                    family_probability[family] = family_probability.get(family, 0.0) + p
+                family_members = {}
+                for _, family in members:
+                    family_members[family] = family_members.get(family, 0) + 1
+                weights = [family_probability.get(family, 0.0) / family_members[family] for _, family in members]
+            if not any(weights):
+                weights = [1.0] * len(members)
+            total = sum(weights)
+            family_share = {}
+            for (_, family), weight in zip(members, weights):
+                family_share[family] = family_share.get(family, 0.0) + weight / total
+            scored = [
+                (name, family_share[family], weight / total / family_share[family], similarity)
+                for (name, family), weight in zip(members, weights) if weight > 0
+            ]
+            ranked.append(sorted(scored, key=lambda candidate: -candidate[1] * candidate[2]))
+        return ranked
@@ -0,0 +1,162 @@
+# Add species to the data store and rebuild what depends on them.
+#
+#   python plantify_ingest.py new_species.csv
+#
+# The CSV has `species`, `family` and the eight trait columns, one row per
+# species. A family that is not in the store yet also needs an `order` column
+# (and may give `family_description`, `ethnobotanical_uses` and `reference`).
+# Trait values must come from the app's trait options: the encoder vocabulary
+# and the lookup table cover exactly those.
+#
+# All rows are validated before anything is written, then inserted in one
+# transaction; species already in the store are skipped. The store's seed
+# (data/plantify.sql) is rewritten with the new rows. If anything was added,
+# the model artifact, prediction lookup table and serving pack are rebuilt;
+# with --evaluate the cross-validation report is refreshed too (it takes
+# minutes, so it is left to `python plantify_evaluate.py` by default). Running
+# servers and app sessions pick the new model up on their own (plantify_reload.py).
+#
+#   python plantify_ingest.py --names names.csv
+#
+# adds English and regional names (columns `species`, `name`, `language`) for
+# species already in the store. Names only feed the search index, so nothing is
+# rebuilt.
+import argparse
+import csv
+import sys
+
+from plantify_data import TRAIT_COLUMNS, insert_common_names, insert_species, list_families, load_species_records
+from plantify_model import ARTIFACT_PATH, normalize_inputs, validate_inputs
+
+
+FAMILY_FIELDS = {
+    "description": ("family_description", "Description not available."),
+    "ethnobotanical_uses": ("ethnobotanical_uses", "Ethnobotanical uses not documented."),
+    "reference": ("reference", "Not available."),
+}
+
+
+def read_rows(path, required):
+    with open(path, newline="", encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+        missing = [col for col in required if col not in (reader.fieldnames or [])]
+        if missing:
+            raise ValueError(f"Missing columns: {', '.join(missing)}")
+        return [{key: (value or "").strip() for key, value in row.items() if key} for row in reader]
+
+# Species and new-family rows ready for insert_species, plus a list of problems.
+# Nothing should be written unless the problem list is empty.
+def parse_rows(rows, known_families):
+    species_rows = []
+    families = {}
+    errors = []
+    seen = set()
+    for line, row in enumerate(rows, start=2):
+        name, family = row["species"], row["family"]
+        if not name or not family:
+            errors.append(f"line {line}: species and family are required")
+            continue
+        if name in seen:
+            errors.append(f"line {line}: {name} appears more than once")
+            continue
+        seen.add(name)
+        row = normalize_inputs(row)
+        is_valid, error_msg = validate_inputs(row)
+        if not is_valid:
+            errors.append(f"line {line}: {error_msg}")
+            continue
+        if family not in known_families and family not in families:
+            if not row.get("order"):
+                errors.append(f"line {line}: family {family} is not in the store; give its order in an 'order' column")
+                continue
+            families[family] = {"name": family, "order_name": row["order"]}
+            for field, (column, default) in FAMILY_FIELDS.items():
+                families[family][field] = row.get(column) or default
+        species_rows.append({"name": name, "family": family, **{col: row[col] for col in TRAIT_COLUMNS}})
+    return species_rows, list(families.values()), errors
+
+# (species, name, language) rows for names of known species, plus a list of problems
+def parse_names(rows, known_species):
+    names = []
+    errors = []
+    for line, row in enumerate(rows, start=2):
+        species, name, language = row["species"], row["name"], row["language"]
+        if not species or not name or not language:
+            errors.append(f"line {line}: species, name and language are required")
+        elif species not in known_species:
+            errors.append(f"line {line}: {species} is not in the store")
+        else:
+            names.append((species, name, language))
+    return names, errors
+
+# Retrain and rewrite the serving artifacts for the store's current contents.
+# Returns the artifact manifest.
+def rebuild(artifact_path=ARTIFACT_PATH, evaluation=False):
+    from plantify_model import build_artifacts
+
+    records = load_species_records()
+    manifest, _ = build_artifacts(records, artifact_path)
+    print(f"Rebuilt model artifact for {len(records)} species ({manifest['sha256'][:12]})")
+    if evaluation:
+        from plantify_evaluate import evaluate
+
+        evaluate(records)
+        print("Refreshed evaluation report")
+    return manifest
+
+def ingest_names(rows, dry_run=False):
+    names, errors = parse_names(rows, {species for _, (family, species) in load_species_records()})
+    if errors:
+        for error in errors:
+            print(error, file=sys.stderr)
+        print(f"{len(errors)} problem(s) found; nothing was added", file=sys.stderr)
+        return 1
+    if dry_run:
+        print(f"{len(names)} names are valid")
+        return 0
+    added = insert_common_names(names)
+    print(f"Added {added} names" + (f"; {len(names) - added} already recorded were skipped" if added < len(names) else ""))
+    return 0
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Add species to the PLANTIFY data store and rebuild the model")
+    parser.add_argument("input", help="CSV file with species, family and the eight trait columns")
+    parser.add_argument("--names", action="store_true", help="the file holds common names (species, name, language) instead")
+    parser.add_argument("--dry-run", action="store_true", help="validate the file without writing anything")
+    parser.add_argument("--no-build", action="store_true", help="only update the data store; servers retrain in-process until the next build")
+    parser.add_argument("--evaluate", action="store_true", help="also refresh the cross-validation report after the rebuild")
+    parser.add_argument("--output", default=ARTIFACT_PATH, help="path of the model artifact")
+    args = parser.parse_args(argv)
+
+    try:
+        rows = read_rows(args.input, ["species", "name", "language"] if args.names else ["species", "family"] + TRAIT_COLUMNS)
+    except (OSError, ValueError) as e:
+        print(f"Error reading {args.input}: {str(e)}", file=sys.stderr)
+        return 1
+    if args.names:
+        return ingest_names(rows, args.dry_run)
+    species_rows, families, errors = parse_rows(rows, set(list_families()))
+    if errors:
+        for error in errors:
+            print(error, file=sys.stderr)
+        print(f"{len(errors)} problem(s) found; nothing was added", file=sys.stderr)
+        return 1
+    if args.dry_run:
+        print(f"{len(species_rows)} species and {len(families)} new families are valid")
+        return 0
+
+    added = insert_species(species_rows, families)
+    skipped = len(species_rows) - len(added)
+    print(f"Added {len(added)} species" + (f"; {skipped} already in the store were skipped" if skipped else ""))
+    if not added:
+        print("Data store unchanged; artifacts are current")
+        return 0
+    if args.no_build:
+        print("Skipping rebuild; run `python plantify_model.py build` to update the artifacts")
+        return 0
+    rebuild(args.output, evaluation=args.evaluate)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
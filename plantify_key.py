@@ -0,0 +1,150 @@
+# Adaptive identification key: after each answered trait, the species still in
+# the running and the trait that best tells them apart.
+#
+# Every (trait, value) pair has a bitset of the species that have it: a Python
+# int with bit i set for species i. The candidates for a set of answers are the
+# AND of their bitsets. With c_v of the n candidates showing value v, asking a
+# trait is worth H = -sum(c_v / n * log2(c_v / n)) bits (the expected drop in
+# entropy over equally likely candidates), so ranking the open traits takes one
+# AND and popcount per (trait, value) pair. A step is therefore at most 8 + 36
+# bitset operations whatever the size of the flora, each over n / 64 machine
+# words. The table for no answers is computed up front and later states are
+# memoized by their answers.
+#
+#   python plantify_key.py        # interactive key in the terminal
+import argparse
+import math
+import sys
+from functools import lru_cache
+
+import numpy as np
+
+from plantify_model import FEATURE_COLUMNS, TRAIT_OPTIONS
+
+
+STATE_CACHE_SIZE = 4096
+
+
+def trait_label(col):
+    return col.replace("_", " ").capitalize()
+
+
+class IdentificationKey:
+    def __init__(self, records):
+        self.species = [species for _, (family, species) in records]
+        self.families = [family for _, (family, species) in records]
+        self.n_species = len(self.species)
+        self.all = (1 << self.n_species) - 1
+        values = np.array([list(traits) for traits, _ in records], dtype=object).reshape(-1, len(FEATURE_COLUMNS))
+        self.bitsets = {}
+        for position, col in enumerate(FEATURE_COLUMNS):
+            for value in TRAIT_OPTIONS[col]:
+                # packbits builds each bitset in one pass instead of n shifts and ORs
+                mask = np.packbits(values[:, position] == value, bitorder="little")
+                self.bitsets[(col, value)] = int.from_bytes(mask.tobytes(), "little")
+        self._state = lru_cache(maxsize=STATE_CACHE_SIZE)(self._compute_state)
+        self.root = self._state(())
+
+    # Bitset of the species consistent with every answer
+    def candidates(self, answers):
+        candidates = self.all
+        for answer in answers:
+            candidates &= self.bitsets[answer]
+        return candidates
+
+    # Open traits that still split the candidates, as (trait, bits, groups),
+    # most informative first; ties keep the form's trait order
+    def ranking(self, candidates, answered=()):
+        n = candidates.bit_count()
+        if n < 2:
+            return []
+        ranked = []
+        for col in FEATURE_COLUMNS:
+            if col in answered:
+                continue
+            bits = 0.0
+            groups = 0
+            for value in TRAIT_OPTIONS[col]:
+                count = (candidates & self.bitsets[(col, value)]).bit_count()
+                if count:
+                    p = count / n
+                    bits -= p * math.log2(p)
+                    groups += 1
+            if groups > 1:
+                ranked.append((col, bits, groups))
+        ranked.sort(key=lambda entry: -entry[1])
+        return ranked
+
+    def _compute_state(self, answers):
+        candidates = self.candidates(answers)
+        return {
+            "candidates": candidates,
+            "count": candidates.bit_count(),
+            "ranking": self.ranking(candidates, {col for col, _ in answers}),
+        }
+
+    # Candidate count, bitset and next-trait ranking for a (partial) trait
+    # dict; blank traits are open
+    def state(self, traits):
+        answers = []
+        for col in FEATURE_COLUMNS:
+            value = traits.get(col)
+            if value:
+                if (col, value) not in self.bitsets:
+                    raise ValueError(f"Invalid value for {col}: {value}")
+                answers.append((col, value))
+        return self._state(tuple(answers))
+
+    # Up to limit (species, family) pairs from a candidate bitset, in table order
+    def members(self, candidates, limit=None):
+        found = []
+        while candidates and (limit is None or len(found) < limit):
+            lowest = candidates & -candidates
+            i = lowest.bit_length() - 1
+            found.append((self.species[i], self.families[i]))
+            candidates ^= lowest
+        return found
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Identify a herb by answering the most informative trait questions first")
+    parser.add_argument("--show", type=int, default=10, help="candidates to list after each answer")
+    args = parser.parse_args(argv)
+
+    from plantify_data import load_species_records
+
+    key = IdentificationKey(load_species_records())
+    traits = {}
+    skipped = set()
+    while True:
+        state = key.state(traits)
+        print(f"\n{state['count']} species left: " + ", ".join(name for name, _ in key.members(state["candidates"], args.show))
+              + (" ..." if state["count"] > args.show else ""))
+        if state["count"] == 0:
+            print("No species in the table has these traits.")
+            return 1
+        ranking = [entry for entry in state["ranking"] if entry[0] not in skipped]
+        if not ranking:
+            if state["count"] == 1:
+                species, family = key.members(state["candidates"])[0]
+                print(f"Identified: {species} ({family})")
+            else:
+                print("The remaining species cannot be told apart by the traits left.")
+            return 0
+        col, bits, groups = ranking[0]
+        options = TRAIT_OPTIONS[col]
+        print(f"{trait_label(col)}? ({bits:.2f} bits, {groups} groups)  " + "  ".join(f"[{i}] {value}" for i, value in enumerate(options, 1)) + "  [s] skip")
+        answer = input("> ").strip()
+        if answer == "s":
+            skipped.add(col)
+            continue
+        if answer.isdigit() and 1 <= int(answer) <= len(options):
+            answer = options[int(answer) - 1]
+        if answer not in options:
+            print(f"Choose one of: {', '.join(options)}")
+            continue
+        traits[col] = answer
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,163 @@
+# Precomputed predictions for every possible trait combination.
+#
+# validate_inputs only accepts prod(len(TRAIT_OPTIONS[col])) = 36,960 inputs, so
+# `plantify_model.py build` ranks all of them once, through the same path as
+# live requests, and stores the top candidates as uint16 species ids and
+# float32 confidences, with the family confidence, species confidence and
+# similarity each confidence is the product of. Every path rounds confidences
+# to plantify_model.CONFIDENCE_DECIMALS, so a table read gives the same value as
+# the live path. Rows are indexed by the mixed-radix number of the eight
+# trait codes (last trait fastest, the order of itertools.product), so serving
+# a prediction is a few integer operations and one array read. The arrays are
+# plain .npy files beside the model artifact and are memory-mapped by default;
+# the table is tied to the artifact's checksum and ignored once it changes.
+import json
+import os
+
+import numpy as np
+
+from plantify_model import CONFIDENCE_DECIMALS, FEATURE_COLUMNS, TRAIT_OPTIONS, candidate_stages, rank_batch
+
+
+LOOKUP_FORMAT_VERSION = 3
+# Candidates stored per combination; also the API's top_k limit
+LOOKUP_TOP_K = 10
+NO_SPECIES = np.iinfo(np.uint16).max
+
+RADICES = [len(TRAIT_OPTIONS[col]) for col in FEATURE_COLUMNS]
+TABLE_SIZE = int(np.prod(RADICES))
+VALUE_CODES = [{value: code for code, value in enumerate(TRAIT_OPTIONS[col])} for col in FEATURE_COLUMNS]
+
+# Below this many rows the plain-Python index is faster than the vectorized one
+VECTORIZE_ROWS = 64
+
+
+def lookup_paths(artifact_path):
+    base = os.path.splitext(artifact_path)[0] + ".lookup"
+    return base + ".json", base + ".species.npy", base + ".confidence.npy", base + ".stages.npy"
+
+# Mixed-radix index of one row of trait values, or None if a value is not in the vocabulary
+def combination_index(row):
+    index = 0
+    for codes, radix, value in zip(VALUE_CODES, RADICES, row):
+        code = codes.get(value)
+        if code is None:
+            return None
+        index = index * radix + code
+    return index
+
+# List of indices for a batch of rows; -1 marks rows with a value outside the vocabulary
+def combination_indices(rows):
+    if len(rows) < VECTORIZE_ROWS:
+        return [-1 if index is None else index for index in map(combination_index, rows)]
+    values = np.asarray(rows, dtype=object).reshape(len(rows), len(FEATURE_COLUMNS))
+    indices = np.zeros(len(rows), dtype=np.int64)
+    for position, (codes, radix) in enumerate(zip(VALUE_CODES, RADICES)):
+        uniques, inverse = np.unique(values[:, position].astype(str), return_inverse=True)
+        column = np.array([codes.get(value, -1) for value in uniques], dtype=np.int64)[inverse]
+        indices = np.where((indices < 0) | (column < 0), -1, indices * radix + column)
+    return indices.tolist()
+
+
+class LookupTable:
+    def __init__(self, species, species_ids, confidences, stages):
+        self.species = list(species)
+        self.species_id = {name: i for i, name in enumerate(self.species)}
+        # Plain ndarray views: still backed by the mapping, without np.memmap's per-slice overhead
+        self.species_ids = species_ids.view(np.ndarray)
+        self.confidences = confidences.view(np.ndarray)
+        self.stages = stages.view(np.ndarray)
+        self.top_k = species_ids.shape[1]
+
+    def indices(self, rows):
+        return combination_indices(rows)
+
+    # Up to top_k (species, confidence) candidates for one combination index
+    def rank_index(self, index, top_k=1):
+        ids = self.species_ids[index, :top_k].tolist()
+        confidences = self.confidences[index, :top_k].tolist()
+        # float32 holds the rounded confidence to about seven significant digits; rounding again restores it exactly
+        return [(self.species[i], round(confidence, CONFIDENCE_DECIMALS)) for i, confidence in zip(ids, confidences) if i != NO_SPECIES]
+
+    # (family confidence, species confidence, similarity) behind one stored
+    # candidate's confidence, or None if the species is not stored for the combination
+    def stage_index(self, index, species):
+        columns = np.flatnonzero(self.species_ids[index] == self.species_id.get(species, NO_SPECIES))
+        if len(columns) == 0:
+            return None
+        return tuple(round(value, CONFIDENCE_DECIMALS) for value in self.stages[index, columns[0]].tolist())
+
+
+# Rank every combination with the model's live path (exact-match index, compiled
+# tree and similarity rescoring) and pack the results
+def build_lookup(model):
+    from plantify_tree import all_trait_combinations
+
+    species = sorted(model["species_family"])
+    if len(species) >= NO_SPECIES:
+        raise ValueError(f"{len(species)} species do not fit in uint16 species ids")
+    species_id = {name: i for i, name in enumerate(species)}
+    serving = {key: value for key, value in model.items() if key != "lookup"}
+    combos = all_trait_combinations()
+    species_ids = np.full((len(combos), LOOKUP_TOP_K), NO_SPECIES, dtype=np.uint16)
+    confidences = np.zeros((len(combos), LOOKUP_TOP_K), dtype=np.float32)
+    stages = np.zeros((len(combos), LOOKUP_TOP_K, 3), dtype=np.float32)
+    ranked = rank_batch(serving, combos, LOOKUP_TOP_K)
+    for row, (candidates, candidate_stage) in enumerate(zip(ranked, candidate_stages(serving, combos))):
+        for column, (name, confidence) in enumerate(candidates):
+            species_ids[row, column] = species_id[name]
+            confidences[row, column] = confidence
+            stages[row, column] = candidate_stage[name][1:]
+    return LookupTable(species, species_ids, confidences, stages)
+
+def _save_array(path, array):
+    with open(path + ".tmp", "wb") as f:
+        np.save(f, array)
+    os.replace(path + ".tmp", path)
+
+# Write the arrays, then the manifest that ties them to the model artifact
+def save_lookup(table, artifact_path, artifact_sha256):
+    manifest_file, species_file, confidence_file, stages_file = lookup_paths(artifact_path)
+    _save_array(species_file, np.ascontiguousarray(table.species_ids))
+    _save_array(confidence_file, np.ascontiguousarray(table.confidences))
+    _save_array(stages_file, np.ascontiguousarray(table.stages))
+    manifest = {
+        "format_version": LOOKUP_FORMAT_VERSION,
+        "artifact_sha256": artifact_sha256,
+        "vocabulary": {col: TRAIT_OPTIONS[col] for col in FEATURE_COLUMNS},
+        "top_k": table.top_k,
+        "species": table.species,
+    }
+    with open(manifest_file + ".tmp", "w") as f:
+        json.dump(manifest, f)
+    os.replace(manifest_file + ".tmp", manifest_file)
+    return manifest
+
+# The table built for the artifact with this checksum, or None if it is missing
+# or stale. With mmap the arrays are paged in on demand and shared between
+# processes through the page cache.
+def load_lookup(artifact_path, artifact_sha256, mmap=True):
+    manifest_file, species_file, confidence_file, stages_file = lookup_paths(artifact_path)
+    try:
+        with open(manifest_file) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if manifest.get("format_version") != LOOKUP_FORMAT_VERSION or manifest.get("artifact_sha256") != artifact_sha256:
+        print("Prediction lookup table is stale; serving from the model")
+        return None
+    if manifest.get("vocabulary") != {col: TRAIT_OPTIONS[col] for col in FEATURE_COLUMNS}:
+        print("Prediction lookup table was built for other trait options; serving from the model")
+        return None
+    try:
+        mode = "r" if mmap else None
+        species_ids = np.load(species_file, mmap_mode=mode)
+        confidences = np.load(confidence_file, mmap_mode=mode)
+        stages = np.load(stages_file, mmap_mode=mode)
+    except (OSError, ValueError) as e:
+        print(f"Error loading prediction lookup table: {str(e)}")
+        return None
+    if species_ids.shape != (TABLE_SIZE, manifest["top_k"]) or confidences.shape != species_ids.shape or stages.shape != species_ids.shape + (3,):
+        print(f"Prediction lookup table has shape {species_ids.shape}, expected ({TABLE_SIZE}, {manifest['top_k']})")
+        return None
+    return LookupTable(manifest["species"], species_ids, confidences, stages)
@@ -0,0 +1,185 @@
+# In-process instrumentation: counters and latency histograms for the hot paths
+# (model load, encoding, tree inference, similarity, PDF rendering, contact I/O),
+# exported in Prometheus text format or as a JSON snapshot.
+#
+# Counters are always exact. Latency timers are sampled: set
+# PLANTIFY_METRICS_SAMPLE_RATE (default 1.0) to e.g. 0.1 to time one call in ten.
+import os
+import random
+import threading
+from bisect import bisect_left
+from time import perf_counter
+
+
+SAMPLE_RATE = float(os.environ.get("PLANTIFY_METRICS_SAMPLE_RATE", "1.0"))
+LOW_CONFIDENCE_THRESHOLD = 0.7
+LATENCY_BUCKETS = (0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+HELP = {
+    "plantify_model_load_seconds": "Time to load the classifier, by source (artifact or train)",
+    "plantify_model_reloads_total": "Background model reloads after the store or artifact changed, by outcome",
+    "plantify_encode_seconds": "Time to encode trait rows into the feature matrix",
+    "plantify_tree_seconds": "Time spent walking the compiled family and species trees",
+    "plantify_similarity_seconds": "Time to rank the nearest species by trait similarity and tree weight",
+    "plantify_lookup_seconds": "Time to read predictions from the precomputed lookup table",
+    "plantify_predictions_total": "Ranked predictions, by answering path (lookup, index or tree)",
+    "plantify_low_confidence_predictions_total": f"Predictions whose top confidence is below {LOW_CONFIDENCE_THRESHOLD}",
+    "plantify_image_preprocess_seconds": "Time to decode, resize and quantize one photo",
+    "plantify_image_seconds": "Image model inference time per batch, by padded batch size",
+    "plantify_pdf_requests_total": "PDF reports requested",
+    "plantify_pdf_render_seconds": "Time to render a PDF report that was not cached",
+    "plantify_contacts_seconds": "Contact store operation time, by operation",
+}
+
+
+class Histogram:
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    # Upper bound of the bucket holding the q-th quantile
+    def quantile(self, q):
+        if not self.count:
+            return None
+        target = q * self.count
+        running = 0
+        for bound, count in zip(self.buckets, self.counts):
+            running += count
+            if running >= target:
+                return bound
+        return float("inf")
+
+
+class Registry:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.counters = {}
+        self.histograms = {}
+
+    def inc(self, name, amount=1, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self.lock:
+            self.counters[key] = self.counters.get(key, 0) + amount
+
+    def observe(self, name, value, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self.lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = Histogram()
+            histogram.observe(value)
+
+    def counter_value(self, name, **labels):
+        with self.lock:
+            if labels:
+                return self.counters.get((name, tuple(sorted(labels.items()))), 0)
+            return sum(value for (metric, _), value in self.counters.items() if metric == name)
+
+    def reset(self):
+        with self.lock:
+            self.counters.clear()
+            self.histograms.clear()
+
+
+registry = Registry()
+
+
+# Time the enclosed block into a latency histogram, for a sample of calls.
+# A plain class rather than @contextmanager: it sits on microsecond paths.
+class timed:
+    __slots__ = ("name", "labels", "start")
+
+    def __init__(self, name, **labels):
+        self.name = name
+        self.labels = labels
+
+    def __enter__(self):
+        self.start = perf_counter() if SAMPLE_RATE >= 1.0 or random.random() < SAMPLE_RATE else None
+        return self
+
+    def __exit__(self, *exc_info):
+        if self.start is not None:
+            registry.observe(self.name, perf_counter() - self.start, **self.labels)
+        return False
+
+def record_predictions(confidences, path):
+    low = sum(1 for confidence in confidences if confidence < LOW_CONFIDENCE_THRESHOLD)
+    registry.inc("plantify_predictions_total", len(confidences), path=path)
+    if low:
+        registry.inc("plantify_low_confidence_predictions_total", low)
+
+def low_confidence_rate():
+    total = registry.counter_value("plantify_predictions_total")
+    return registry.counter_value("plantify_low_confidence_predictions_total") / total if total else 0.0
+
+def _label_text(labels, extra=()):
+    pairs = list(labels) + list(extra)
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{key}="{value}"' for key, value in pairs) + "}"
+
+def _format_bound(bound):
+    return "+Inf" if bound == float("inf") else repr(bound)
+
+# Prometheus text exposition format (version 0.0.4)
+def render_prometheus():
+    lines = []
+    with registry.lock:
+        counters = sorted(registry.counters.items())
+        histograms = sorted((key, (h.buckets, list(h.counts), h.sum, h.count)) for key, h in registry.histograms.items())
+    seen = set()
+    for (name, labels), value in counters:
+        if name not in seen:
+            seen.add(name)
+            lines.append(f"# HELP {name} {HELP.get(name, name)}")
+            lines.append(f"# TYPE {name} counter")
+        lines.append(f"{name}{_label_text(labels)} {value}")
+    for (name, labels), (buckets, counts, total, count) in histograms:
+        if name not in seen:
+            seen.add(name)
+            lines.append(f"# HELP {name} {HELP.get(name, name)}")
+            lines.append(f"# TYPE {name} histogram")
+        running = 0
+        for bound, bucket_count in zip(list(buckets) + [float("inf")], counts):
+            running += bucket_count
+            lines.append(f"{name}_bucket{_label_text(labels, [('le', _format_bound(bound))])} {running}")
+        lines.append(f"{name}_sum{_label_text(labels)} {total}")
+        lines.append(f"{name}_count{_label_text(labels)} {count}")
+    lines.append("# HELP plantify_low_confidence_rate Share of predictions below the confidence threshold")
+    lines.append("# TYPE plantify_low_confidence_rate gauge")
+    lines.append(f"plantify_low_confidence_rate {low_confidence_rate()}")
+    return "\n".join(lines) + "\n"
+
+# JSON-friendly view of every metric
+def snapshot():
+    with registry.lock:
+        counters = [
+            {"name": name, "labels": dict(labels), "value": value}
+            for (name, labels), value in sorted(registry.counters.items())
+        ]
+        histograms = [
+            {
+                "name": name,
+                "labels": dict(labels),
+                "count": histogram.count,
+                "mean_s": histogram.sum / histogram.count if histogram.count else None,
+                "p50_s": histogram.quantile(0.5),
+                "p95_s": histogram.quantile(0.95),
+                "p99_s": histogram.quantile(0.99),
+            }
+            for (name, labels), histogram in sorted(registry.histograms.items())
+        ]
+    return {
+        "sample_rate": SAMPLE_RATE,
+        "low_confidence_threshold": LOW_CONFIDENCE_THRESHOLD,
+        "low_confidence_rate": low_confidence_rate(),
+        "counters": counters,
+        "histograms": histograms,
+    }
@@ -0,0 +1,507 @@
+import argparse
+import hashlib
+import json
+import os
+from collections import Counter
+from importlib.metadata import version
+
+import numpy as np
+
+from plantify_data import load_species_records
+from plantify_metrics import record_predictions, timed
+from plantify_tree import CompiledHierarchy, check_parity
+
+
+# pandas, joblib and the sklearn training/CV modules are imported where they are
+# used, so serving from a prebuilt artifact does not pay for them at startup
+
+
+# Bump whenever the layout of the saved model bundle changes
+ARTIFACT_FORMAT_VERSION = 5
+ARTIFACT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "models", "plantify_model.joblib")
+
+FEATURE_COLUMNS = ["leaf_arrangement", "flower_symmetry", "petal_number", "ovary_position", "habit", "fruit_type", "leaf_shape", "inflorescence_type"]
+CATEGORICAL_COLUMNS = ["leaf_arrangement", "flower_symmetry", "ovary_position", "habit", "fruit_type", "leaf_shape", "inflorescence_type"]
+
+# Accepted values for each trait, in the order they are offered in the UI
+TRAIT_OPTIONS = {
+    "leaf_arrangement": ["alternate", "opposite", "whorled"],
+    "flower_symmetry": ["actinomorphic", "zygomorphic"],
+    "petal_number": ["3", "4", "5", "6"],
+    "ovary_position": ["superior", "inferior"],
+    "habit": ["herb", "shrub"],
+    "fruit_type": ["capsule", "nutlet", "schizocarp", "achene", "berry"],
+    "leaf_shape": ["simple", "palmate", "pinnate", "lobed", "cordate", "lanceolate", "ovate", "linear", "toothed", "serrate", "fleshy"],
+    "inflorescence_type": ["spike", "raceme", "umbel", "cyme", "head", "panicle", "solitary"]
+}
+
+# Number of ranked candidates returned by default
+DEFAULT_TOP_K = 3
+
+
+# A trait value as every entry point accepts it: surrounding whitespace trimmed
+# and lowercased like the vocabularies, and a whole number (a petal count from a
+# numeric Parquet column, say) written without a decimal point
+def normalize_trait(value):
+    if value is None:
+        return None
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return str(value).strip().lower()
+
+# Copy of a trait dict with its trait values normalized; apply before validate_inputs
+def normalize_inputs(inputs):
+    return {**inputs, **{col: normalize_trait(inputs.get(col)) for col in FEATURE_COLUMNS}}
+
+def validate_inputs(inputs):
+    for key in FEATURE_COLUMNS:
+        value = inputs.get(key)
+        if value not in TRAIT_OPTIONS[key]:
+            return False, f"Invalid value for {key}: {value}"
+    return True, ""
+
+# Content hash of the trait records, used to tell whether a model is still current
+def trait_table_hash(records):
+    digest = hashlib.sha256()
+    for traits, (family, species) in records:
+        digest.update(repr((tuple(traits), family, species)).encode("utf-8"))
+    return digest.hexdigest()
+
+def trait_key(inputs):
+    return tuple(inputs.get(col) for col in FEATURE_COLUMNS)
+
+# Map every full trait combination to all species that share it, in record order
+def build_trait_index(records):
+    index = {}
+    for traits, (family, species) in records:
+        index.setdefault(tuple(traits), []).append(species)
+    return index
+
+# How many species a dict keyed on traits would have silently dropped
+def collision_report(index):
+    n_species = sum(len(species) for species in index.values())
+    shared = {key: species for key, species in index.items() if len(species) > 1}
+    return {
+        "species": n_species,
+        "distinct_trait_combinations": len(index),
+        "species_lost_to_collisions": n_species - len(index),
+        "shared_combinations": len(shared),
+        "largest_collision": max((len(species) for species in shared.values()), default=0),
+    }
+
+def file_checksum(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def manifest_path(artifact_path):
+    return os.path.splitext(artifact_path)[0] + ".json"
+
+def sklearn_version():
+    return version("scikit-learn")
+
+# Parse a petal count the way pd.to_numeric(errors="coerce").fillna(0) would
+def to_number(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+# Prepare dataset for decision tree
+def build_dataset(records):
+    import pandas as pd
+
+    data = []
+    labels = []
+    families = []
+    for traits, (family, species) in records:
+        data.append(traits)
+        labels.append(species)
+        families.append(family)
+
+    df = pd.DataFrame(data, columns=FEATURE_COLUMNS)
+    df["species"] = labels
+    df["family"] = families
+
+    # Encode categorical variables. Every vocabulary value gets a column whether
+    # or not a species has it yet, so adding species does not shift the columns
+    # and the per-family trees of unchanged families stay reusable.
+    df_encoded = pd.get_dummies(df.drop(columns=["species", "family"]), columns=CATEGORICAL_COLUMNS)
+    columns = ["petal_number"] + [
+        f"{col}_{value}" for col in CATEGORICAL_COLUMNS for value in sorted(set(TRAIT_OPTIONS[col]) | set(df[col]))
+    ]
+    df_encoded = df_encoded.reindex(columns=columns, fill_value=False)
+    df_encoded["petal_number"] = df["petal_number"].astype(int)
+    return df, df_encoded
+
+# Maps trait values straight to the model's one-hot feature layout.
+# Each categorical value gets the index of its dummy column in `columns`
+# (the order of df_encoded.columns); values the model never saw during training
+# have no column and encode to all zeros, as pd.get_dummies + reindex did.
+class TraitEncoder:
+    def __init__(self, columns, vocabularies=TRAIT_OPTIONS):
+        self.columns = list(columns)
+        self.n_features = len(self.columns)
+        column_index = {name: i for i, name in enumerate(self.columns)}
+        self.petal_index = column_index["petal_number"]
+        self.value_index = {}
+        for trait in CATEGORICAL_COLUMNS:
+            self.value_index[trait] = {
+                value: column_index[f"{trait}_{value}"]
+                for value in vocabularies[trait]
+                if f"{trait}_{value}" in column_index
+            }
+
+    # Encode a single trait dict into a (1, n_features) float32 row
+    def encode(self, inputs):
+        row = np.zeros((1, self.n_features), dtype=np.float32)
+        for trait, lookup in self.value_index.items():
+            index = lookup.get(inputs.get(trait))
+            if index is not None:
+                row[0, index] = 1.0
+        try:
+            row[0, self.petal_index] = int(inputs.get("petal_number"))
+        except (TypeError, ValueError):
+            pass
+        return row
+
+    # Encode an (N, 8) batch of trait values, columns in FEATURE_COLUMNS order
+    def encode_batch(self, rows):
+        values = np.asarray(rows, dtype=object)
+        if values.ndim != 2 or values.shape[1] != len(FEATURE_COLUMNS):
+            raise ValueError(f"Expected an (N, {len(FEATURE_COLUMNS)}) batch, got shape {values.shape}")
+        matrix = np.zeros((values.shape[0], self.n_features), dtype=np.float32)
+        if values.shape[0] == 0:
+            return matrix
+        row_ids = np.arange(values.shape[0])
+        for position, trait in enumerate(FEATURE_COLUMNS):
+            # Look each distinct value up once, then scatter by the inverse index
+            uniques, inverse = np.unique(values[:, position].astype(str), return_inverse=True)
+            if trait == "petal_number":
+                numbers = np.array([to_number(value) for value in uniques], dtype=np.float32)
+                matrix[:, self.petal_index] = np.nan_to_num(numbers)[inverse]
+                continue
+            lookup = self.value_index[trait]
+            indices = np.array([lookup.get(value, -1) for value in uniques])[inverse]
+            known = indices >= 0
+            matrix[row_ids[known], indices[known]] = 1.0
+        return matrix
+
+# Fit the family-then-species classifier (plantify_hierarchy.py), returning
+# everything needed to serve predictions. Every record is a training row, so
+# species sharing a trait combination end up in the same leaf with split
+# probabilities instead of overwriting each other. Given the previous model
+# bundle, family trees whose species are unchanged are reused rather than refitted.
+# Accuracy is measured offline by plantify_evaluate.py, not on every fit.
+def train_model(records, previous=None, n_jobs=-1):
+    from plantify_hierarchy import FamilySpeciesClassifier
+
+    df, df_encoded = build_dataset(records)
+
+    species_family = dict(zip(df["species"], df["family"]))
+    clf = FamilySpeciesClassifier(species_family, random_state=42, min_samples_leaf=1, n_jobs=n_jobs)
+    # Fit on the bare float32 matrix so predictions can be made on TraitEncoder output
+    X = df_encoded.to_numpy(dtype=np.float32)
+    if previous is not None and previous["columns"] != list(df_encoded.columns):
+        previous = None
+    clf.fit(X, df["species"], previous=previous["clf"] if previous is not None else None)
+
+    return {
+        "format_version": ARTIFACT_FORMAT_VERSION,
+        "data_hash": trait_table_hash(records),
+        "clf": clf,
+        "columns": list(df_encoded.columns),
+        "species_family": species_family,
+        "metrics": {
+            "collisions": collision_report(build_trait_index(records)),
+        },
+    }
+
+# Confidences are rounded to this many decimal places on every serving path,
+# so the lookup table's float32 copies read back as exactly the live values
+CONFIDENCE_DECIMALS = 6
+
+# Rank up to top_k (species, confidence) candidates for each row of trait values
+# (in FEATURE_COLUMNS order). When the model has a precomputed lookup table
+# (see plantify_lookup.py) valid rows are read from it. Otherwise known trait
+# combinations are answered from the trait index, sharing the confidence between every species that has them.
+# Each distinct unseen combination is scored once: the candidates are the
+# species nearest to it by trait similarity, weighted by the compiled family and
+# species trees (see SimilarityEngine.rank_nearest), and the confidence is
+# scaled by their similarity to the input, so it falls as the input moves away
+# from every known species.
+def rank_batch(model, rows, top_k=1):
+    rows = [tuple(row) for row in rows]
+    ranked = [None] * len(rows)
+    pending = range(len(rows))
+    lookup = model.get("lookup")
+    if lookup is not None and top_k <= lookup.top_k:
+        # Precomputed table: one array read per row; only rows with values
+        # outside the vocabulary go on to the index and tree below
+        with timed("plantify_lookup_seconds"):
+            pending = []
+            for i, table_index in enumerate(lookup.indices(rows)):
+                if table_index < 0:
+                    pending.append(i)
+                else:
+                    ranked[i] = lookup.rank_index(table_index, top_k)
+        if len(pending) < len(rows):
+            record_predictions([candidates[0][1] for candidates in ranked if candidates], "lookup")
+
+    index = model["trait_index"]
+    unseen = []
+    indexed_confidences = []
+    for i in pending:
+        row = rows[i]
+        matches = index.get(row)
+        if matches:
+            share = round(1.0 / len(matches), CONFIDENCE_DECIMALS)
+            ranked[i] = [(species, share) for species in matches[:top_k]]
+            indexed_confidences.append(share)
+        else:
+            unseen.append(i)
+    if indexed_confidences:
+        record_predictions(indexed_confidences, "index")
+    if unseen:
+        combos = list(dict.fromkeys(rows[i] for i in unseen))
+        rankings = rank_stages(model, combos)
+        by_combo = {
+            combo: [
+                (name, round(similarity * family_confidence * species_confidence, CONFIDENCE_DECIMALS))
+                for name, family_confidence, species_confidence, similarity in candidates[:top_k]
+            ]
+            for combo, candidates in zip(combos, rankings)
+        }
+        for i in unseen:
+            ranked[i] = by_combo[rows[i]]
+        record_predictions([ranked[i][0][1] for i in unseen], "tree")
+    return ranked
+
+# Ranked (species, family confidence, species confidence, similarity) candidates
+# for each of the distinct trait combinations `combos`: the species nearest to
+# the combination, weighted by the compiled family and species trees (see
+# SimilarityEngine.rank_nearest). A candidate's confidence is the product of the three.
+def rank_stages(model, combos):
+    hierarchy = model["hierarchy"]
+    if len(combos) == 1:
+        # One row: the dict encoder and the plain-Python tree walks skip all batch setup
+        with timed("plantify_encode_seconds"):
+            row = model["encoder"].encode(dict(zip(FEATURE_COLUMNS, combos[0])))[0].tolist()
+        with timed("plantify_tree_seconds"):
+            candidates = [hierarchy.rank_one(row)]
+    else:
+        with timed("plantify_encode_seconds"):
+            X = model["encoder"].encode_batch(combos)
+        with timed("plantify_tree_seconds"):
+            candidates = hierarchy.rank(X)
+    with timed("plantify_similarity_seconds"):
+        return model["similarity"].rank_nearest(combos, candidates)
+
+def rank(model, inputs, top_k=1):
+    return rank_batch(model, [trait_key(inputs)], top_k)[0]
+
+# Most likely species and its confidence for a single trait dict
+def predict(model, inputs):
+    return rank(model, inputs)[0]
+
+def round_stages(*stages):
+    return tuple(round(float(stage), CONFIDENCE_DECIMALS) for stage in stages)
+
+# For each distinct row of trait values, a dict from every candidate species
+# to (family, family confidence, species confidence, similarity), in
+# rank_batch's order, with confidence = family confidence * species
+# confidence * similarity. A known trait combination has similarity 1 and its
+# confidence split between the species that share it: the family's share of
+# them, then the species' share of its family's. An unseen one has the stages
+# from rank_stages.
+def candidate_stages(model, rows):
+    species_family = model["species_family"]
+    index = model["trait_index"]
+    combos = list(dict.fromkeys(tuple(row) for row in rows))
+    stages = {}
+    unseen = []
+    for combo in combos:
+        matches = index.get(combo)
+        if matches:
+            families = Counter(species_family[name] for name in matches)
+            stages[combo] = {
+                name: (species_family[name],) + round_stages(families[species_family[name]] / len(matches), 1.0 / families[species_family[name]], 1.0)
+                for name in matches
+            }
+        else:
+            unseen.append(combo)
+    if unseen:
+        for combo, candidates in zip(unseen, rank_stages(model, unseen)):
+            stages[combo] = {
+                name: (species_family[name],) + round_stages(family_confidence, species_confidence, similarity)
+                for name, family_confidence, species_confidence, similarity in candidates
+            }
+    return [stages[combo] for combo in combos]
+
+# What each row's predicted species' confidence is made of, as in
+# candidate_stages; read from the lookup table when the model has one. None for
+# a species that is not among the row's candidates, e.g. one picked by the photo model.
+def stage_confidences(model, rows, species):
+    rows = [tuple(row) for row in rows]
+    stages = [None] * len(rows)
+    pending = range(len(rows))
+    lookup = model.get("lookup")
+    if lookup is not None:
+        pending = []
+        for i, table_index in enumerate(lookup.indices(rows)):
+            stage = None if table_index < 0 else lookup.stage_index(table_index, species[i])
+            if stage is None:
+                pending.append(i)
+            else:
+                stages[i] = (model["species_family"][species[i]],) + stage
+    if pending:
+        combos = list(dict.fromkeys(rows[i] for i in pending))
+        by_combo = dict(zip(combos, candidate_stages(model, combos)))
+        for i in pending:
+            stages[i] = by_combo[rows[i]].get(species[i])
+    return stages
+
+# Write the model bundle plus a JSON manifest holding its version and checksum.
+# The bundle is written to a temporary file first so readers never see a partial file.
+def save_artifact(model, path=ARTIFACT_PATH):
+    import joblib
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + ".tmp"
+    joblib.dump(model, tmp_path)
+    manifest = {
+        "format_version": model["format_version"],
+        "data_hash": model["data_hash"],
+        "sklearn_version": sklearn_version(),
+        "sha256": file_checksum(tmp_path),
+        "metrics": model["metrics"],
+    }
+    os.replace(tmp_path, path)
+    with open(manifest_path(path) + ".tmp", "w") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(manifest_path(path) + ".tmp", manifest_path(path))
+    return manifest
+
+# Load a saved model bundle. Returns None if the artifact is missing, corrupt,
+# built by another format/sklearn version or trained on a different trait table.
+def load_artifact(path=ARTIFACT_PATH, expected_hash=None):
+    try:
+        with open(manifest_path(path)) as f:
+            manifest = json.load(f)
+    except FileNotFoundError:
+        print(f"No model artifact at {path}")
+        return None
+    except (OSError, ValueError) as e:
+        print(f"Unreadable model manifest: {str(e)}")
+        return None
+
+    if manifest.get("format_version") != ARTIFACT_FORMAT_VERSION:
+        print(f"Model artifact format {manifest.get('format_version')} does not match {ARTIFACT_FORMAT_VERSION}")
+        return None
+    if manifest.get("sklearn_version") != sklearn_version():
+        print(f"Model artifact built with scikit-learn {manifest.get('sklearn_version')}, running {sklearn_version()}")
+        return None
+    if expected_hash is not None and manifest.get("data_hash") != expected_hash:
+        print("Model artifact is stale: trait table has changed")
+        return None
+    try:
+        if file_checksum(path) != manifest.get("sha256"):
+            print("Model artifact checksum mismatch")
+            return None
+        import joblib
+
+        model = joblib.load(path)
+    except Exception as e:
+        print(f"Error loading model artifact: {str(e)}")
+        return None
+    model["artifact_sha256"] = manifest["sha256"]
+    return model
+
+# Attach the serving structures to a trained model bundle. The encoder,
+# compiled trees, trait index and similarity engine are cheap to rebuild so
+# they are not persisted.
+def prepare_model(model, records):
+    from plantify_index import SimilarityEngine
+
+    model["encoder"] = TraitEncoder(model["columns"])
+    model["hierarchy"] = CompiledHierarchy.from_sklearn(model["clf"])
+    model["trait_index"] = build_trait_index(records)
+    model["similarity"] = SimilarityEngine(records)
+    return model
+
+# Serve from the artifact when it is current, otherwise retrain in-process,
+# reusing the stale artifact's trees for families whose species are unchanged.
+# An artifact built with `build` also brings its prediction lookup table and a
+# serving pack; with `shared` (the default) the pack's memory-mapped arrays are
+# used and the scikit-learn estimator is not loaded at all.
+def load_or_train(records, path=ARTIFACT_PATH, shared=True):
+    data_hash = trait_table_hash(records)
+    if shared:
+        from plantify_shared import attach_pack
+
+        with timed("plantify_model_load_seconds", source="shared"):
+            model = attach_pack(path, expected_hash=data_hash)
+        if model is not None:
+            model["trait_index"] = build_trait_index(records)
+            return model
+    with timed("plantify_model_load_seconds", source="artifact"):
+        model = load_artifact(path)
+    if model is None or model["data_hash"] != data_hash:
+        if model is not None:
+            print("Model artifact is stale: trait table has changed")
+        print("Retraining classifier in-process")
+        with timed("plantify_model_load_seconds", source="train"):
+            model = train_model(records, previous=model)
+    prepare_model(model, records)
+    if "artifact_sha256" in model:
+        from plantify_lookup import load_lookup
+
+        model["lookup"] = load_lookup(path, model["artifact_sha256"])
+    return model
+
+# Train on the records and write the artifact, its lookup table and serving
+# pack. Only the families whose species changed since the existing artifact are
+# refitted. Each file is replaced atomically and the lookup table and pack are
+# tied to the new artifact's checksum, so a process loading meanwhile never
+# pairs them with the wrong model.
+def build_artifacts(records, path=ARTIFACT_PATH, n_jobs=-1):
+    from plantify_lookup import build_lookup, save_lookup
+    from plantify_shared import export_pack
+
+    model = train_model(records, previous=load_artifact(path), n_jobs=n_jobs)
+    refitted = model["clf"].refitted_
+    print(f"Fitted species trees for {len(refitted)} of {len(model['clf'].species_clfs_)} families"
+          + (f" ({', '.join(refitted)})" if 0 < len(refitted) <= 5 else ""))
+    mismatches, total = check_parity(model)
+    if mismatches:
+        raise SystemExit(f"Compiled trees disagree with predict_proba on {mismatches} of {total} trait combinations; artifact not written")
+    manifest = save_artifact(model, path)
+    prepare_model(model, records)
+    table = build_lookup(model)
+    save_lookup(table, path, manifest["sha256"])
+    export_pack(model, path, manifest["sha256"])
+    return manifest, table
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the PLANTIFY classifier artifact")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    build_parser = subparsers.add_parser("build", help="train the classifier and write the model artifact")
+    build_parser.add_argument("--output", default=ARTIFACT_PATH, help="path of the .joblib artifact to write")
+    build_parser.add_argument("-j", "--jobs", type=int, default=-1, help="threads fitting the per-family species trees (-1: all cores)")
+    args = parser.parse_args(argv)
+
+    if args.command == "build":
+        manifest, table = build_artifacts(load_species_records(), args.output, n_jobs=args.jobs)
+        collisions = manifest["metrics"]["collisions"]
+        print(f"Wrote {args.output} (sha256 {manifest['sha256'][:12]}); run plantify_evaluate.py for accuracy figures")
+        print(f"{collisions['species']} species share {collisions['distinct_trait_combinations']} trait combinations: "
+              f"{collisions['species_lost_to_collisions']} would be lost to key collisions in a trait-keyed table "
+              f"({collisions['shared_combinations']} shared combinations, largest has {collisions['largest_collision']} species)")
+        print(f"Precomputed the top {table.top_k} candidates for all {len(table.species_ids)} trait combinations")
+        print("Exported the serving pack; workers attach to its memory-mapped arrays")
+
+
+if __name__ == "__main__":
+    main()
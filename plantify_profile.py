@@ -0,0 +1,89 @@
+# Startup-time profile: runs a fresh interpreter with `-X importtime` and
+# summarizes where the import time goes.
+#
+#   python plantify_profile.py                      # the Streamlit script (Welcome page)
+#   python plantify_profile.py -m plantify_api      # any importable module
+#   python plantify_profile.py -m plantify_model --json profile.json
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+from collections import defaultdict
+
+
+IMPORT_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+# Parse `-X importtime` stderr into (module, self us, cumulative us, depth) rows
+def parse_importtime(stderr):
+    rows = []
+    for line in stderr.splitlines():
+        match = IMPORT_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            rows.append((module, int(self_us), int(cumulative_us), (len(indent) - 1) // 2))
+    return rows
+
+def run_importtime(module=None, script=None):
+    if module:
+        command = [sys.executable, "-X", "importtime", "-c", f"import {module}"]
+    else:
+        command = [sys.executable, "-X", "importtime", script]
+    env = dict(os.environ, PYTHONDONTWRITEBYTECODE="1")
+    completed = subprocess.run(command, capture_output=True, text=True, env=env, cwd=os.path.dirname(os.path.abspath(__file__)))
+    return parse_importtime(completed.stderr)
+
+def summarize(rows, top=15):
+    packages = defaultdict(int)
+    for module, self_us, cumulative_us, depth in rows:
+        packages[module.split(".")[0]] += self_us
+    total_us = sum(self_us for _, self_us, _, _ in rows)
+    return {
+        "total_ms": total_us / 1000,
+        "modules_imported": len(rows),
+        "packages": [
+            {"package": name, "self_ms": us / 1000}
+            for name, us in sorted(packages.items(), key=lambda item: item[1], reverse=True)[:top]
+        ],
+        "slowest_top_level": [
+            {"module": module, "cumulative_ms": cumulative_us / 1000}
+            for module, self_us, cumulative_us, depth in sorted(
+                (row for row in rows if row[3] == 0), key=lambda row: row[2], reverse=True
+            )[:top]
+        ],
+    }
+
+def print_summary(target, summary):
+    print(f"Import profile for {target}: {summary['total_ms']:.1f} ms across {summary['modules_imported']} modules")
+    print("\nTime by package (self):")
+    for entry in summary["packages"]:
+        print(f"  {entry['package']:<30} {entry['self_ms']:>9.1f} ms")
+    print("\nSlowest top-level imports (cumulative):")
+    for entry in summary["slowest_top_level"]:
+        print(f"  {entry['module']:<30} {entry['cumulative_ms']:>9.1f} ms")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Report per-module import cost of a PLANTIFY entry point")
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument("-m", "--module", help="module to import, e.g. plantify_api")
+    target.add_argument("--script", default="plantify_app.py", help="script to run (default: plantify_app.py)")
+    parser.add_argument("--top", type=int, default=15, help="rows per table")
+    parser.add_argument("--json", dest="json_path", help="also write the summary as JSON to this file")
+    args = parser.parse_args(argv)
+
+    rows = run_importtime(module=args.module, script=None if args.module else args.script)
+    if not rows:
+        print("No import timings captured; did the target fail to start?", file=sys.stderr)
+        return 1
+    summary = summarize(rows, args.top)
+    print_summary(args.module or args.script, summary)
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(summary, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,133 @@
+# Zero-downtime model reloads for long-running servers.
+#
+# A ModelReloader holds the current (version, model) pair. The version is a
+# fingerprint of the species store and the artifact, lookup and serving-pack
+# manifests, checked at most every RELOAD_INTERVAL seconds from get(). When it
+# changes, and has stayed the same for one more interval (so an ingest or
+# build that writes several files triggers one reload), the new model is loaded
+# on a background thread while requests keep being answered by the old one,
+# then swapped in with a single reference assignment. A caller takes the model once per request and uses that object
+# throughout, so it never sees a half-loaded model and never waits for a load.
+import os
+import threading
+import time
+
+from plantify_data import DB_PATH, clear_caches, data_version, load_species_records
+from plantify_metrics import registry
+from plantify_model import ARTIFACT_PATH, load_or_train, manifest_path
+
+
+RELOAD_INTERVAL = float(os.environ.get("PLANTIFY_RELOAD_INTERVAL", "2.0"))
+
+
+def _file_version(path):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+# Changes whenever the store is written or `build` replaces the artifact. The
+# manifests are written last, so a changed version means the files are complete.
+def serving_version(artifact_path=ARTIFACT_PATH, db_path=DB_PATH):
+    from plantify_lookup import lookup_paths
+    from plantify_shared import pack_pointer
+
+    return (
+        data_version(db_path),
+        _file_version(manifest_path(artifact_path)),
+        _file_version(lookup_paths(artifact_path)[0]),
+        _file_version(pack_pointer(artifact_path)),
+    )
+
+# Load the model for the current store contents, optionally with the app's
+# partial-trait structures (query engine and identification key) built from the
+# same records so they always agree
+def load_serving_model(artifact_path=ARTIFACT_PATH, query_engine=False):
+    clear_caches()
+    records = load_species_records()
+    model = load_or_train(records, artifact_path)
+    if query_engine:
+        from plantify_index import TraitQueryEngine
+        from plantify_key import IdentificationKey
+
+        model["query_engine"] = TraitQueryEngine(records)
+        model["key"] = IdentificationKey(records)
+    return model
+
+
+class ModelReloader:
+    def __init__(self, load=load_serving_model, version=serving_version, interval=RELOAD_INTERVAL):
+        self.load = load
+        self.version = version
+        self.interval = interval
+        self.reloads = 0
+        self.last_error = None
+        self._lock = threading.Lock()
+        self._loading = None
+        self._failed_version = None
+        self._pending_version = None
+        self._next_check = time.monotonic() + interval
+        # The first model is loaded synchronously: there is nothing to serve yet
+        version = self.version()
+        self._current = (version, self.load())
+
+    @property
+    def model(self):
+        return self._current[1]
+
+    # The model to answer one request with. Cheap: a clock read on most calls.
+    def get(self):
+        now = time.monotonic()
+        if now >= self._next_check:
+            self._next_check = now + self.interval
+            self.check()
+        return self._current[1]
+
+    # Start a background reload if the store or artifact changed (and, with
+    # settle, has not changed again since the previous check). Returns the
+    # loading thread, or None if there is nothing to do.
+    def check(self, settle=True):
+        try:
+            version = self.version()
+        except OSError as e:
+            print(f"Error checking model version: {str(e)}")
+            return None
+        if version == self._current[0] or version == self._failed_version:
+            return None
+        if settle and version != self._pending_version:
+            self._pending_version = version
+            return None
+        with self._lock:
+            if self._loading is not None:
+                return None
+            thread = self._loading = threading.Thread(target=self._reload, args=(version,), name="plantify-model-reload", daemon=True)
+        thread.start()
+        return thread
+
+    def _reload(self, version):
+        try:
+            model = self.load()
+        except Exception as e:
+            print(f"Model reload failed, still serving the previous model: {str(e)}")
+            self.last_error = str(e)
+            self._failed_version = version
+            registry.inc("plantify_model_reloads_total", outcome="failed")
+        else:
+            # Recorded with the version read before loading: a change made
+            # during the load is picked up by the next check
+            self._current = (version, model)
+            self.reloads += 1
+            self.last_error = None
+            registry.inc("plantify_model_reloads_total", outcome="ok")
+            print(f"Reloaded model for trait table {model['data_hash'][:12]} ({len(model['species_family'])} species)")
+        finally:
+            with self._lock:
+                self._loading = None
+
+    # Check now and wait for any reload to finish (for CLIs and tests)
+    def refresh(self, timeout=None):
+        thread = self.check(settle=False)
+        if thread is not None:
+            thread.join(timeout)
+        return self.model
@@ -0,0 +1,256 @@
+import argparse
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from io import BytesIO
+
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.utils import simpleSplit
+
+from plantify_data import data_version, get_family_info, get_taxonomy
+from plantify_metrics import registry, timed
+
+
+REPORT_CACHE_SIZE = 256
+
+PAGE_WIDTH, PAGE_HEIGHT = letter
+LEFT_MARGIN = 100
+RIGHT_MARGIN = 60
+TOP = 750
+BOTTOM_MARGIN = 60
+FONT = "Helvetica"
+BOLD_FONT = "Helvetica-Bold"
+FONT_SIZE = 12
+
+DISCLAIMER = "Disclaimer: This classification report is generated for educational purposes to aid in the study of South Indian medicinal herbs. It should not be used for professional field identification without consulting a trained botanist."
+ACKNOWLEDGMENT = "Acknowledgment: Information in this report is based on publicly available botanical studies with proper attribution to sources like FRLHT and The Plant List."
+
+
+# Confidence is printed to two decimal places of a percent, so reports whose
+# confidences round to the same figure are byte-for-byte identical
+def confidence_bucket(confidence):
+    return round(float(confidence), 4)
+
+def pdf_string(text):
+    encoded = text.encode("cp1252", errors="replace")
+    return b"(" + encoded.replace(b"\\", b"\\\\").replace(b"(", b"\\(").replace(b")", b"\\)") + b")"
+
+
+# Wrapping is the costly part of layout and most text (family blurbs, disclaimers)
+# repeats from report to report
+@lru_cache(maxsize=4096)
+def wrap_text(text, font, width):
+    return simpleSplit(text, font, FONT_SIZE, width) or [""]
+
+# Lays text out top to bottom, wrapping long lines to the page width and
+# starting a new page whenever the cursor reaches the bottom margin.
+# Each finished page is a PDF content stream.
+class PageLayout:
+    def __init__(self):
+        self.pages = []
+        self.ops = []
+        self.y = TOP
+
+    def new_page(self):
+        self.pages.append(b"\n".join(self.ops))
+        self.ops = []
+        self.y = TOP
+
+    def space(self, amount):
+        self.y -= amount
+
+    def text(self, text, indent=0, leading=20, bold=False):
+        font = BOLD_FONT if bold else FONT
+        resource = b"/F2" if bold else b"/F1"
+        x = LEFT_MARGIN + indent
+        for line in wrap_text(text, font, PAGE_WIDTH - x - RIGHT_MARGIN):
+            if self.y < BOTTOM_MARGIN:
+                self.new_page()
+            self.ops.append(b"BT %s %d Tf %.2f %.2f Td %s Tj ET" % (resource, FONT_SIZE, x, self.y, pdf_string(line)))
+            self.y -= leading
+
+    def finish(self):
+        if self.ops:
+            self.new_page()
+        return self.pages
+
+
+# Writes a PDF incrementally: each page is flushed to the output as soon as it is
+# added, and only the object offsets are kept, so memory stays flat however many
+# pages are written. Uses the standard Helvetica fonts, which need no embedding.
+class PdfStreamWriter:
+    def __init__(self, stream):
+        self.stream = stream
+        self.position = 0
+        self.offsets = {}
+        self.page_ids = []
+        # Objects 1-4 are written at close: catalog, page tree and the two fonts
+        self.next_id = 5
+        self.write(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+
+    def write(self, data):
+        self.stream.write(data)
+        self.position += len(data)
+
+    def write_object(self, obj_id, body):
+        self.offsets[obj_id] = self.position
+        self.write(b"%d 0 obj\n" % obj_id + body + b"\nendobj\n")
+
+    def add_page(self, content):
+        compressed = zlib.compress(content)
+        content_id, page_id = self.next_id, self.next_id + 1
+        self.next_id += 2
+        self.write_object(content_id, b"<< /Length %d /Filter /FlateDecode >>\nstream\n" % len(compressed) + compressed + b"\nendstream")
+        self.write_object(page_id, b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 %d %d] /Resources << /Font << /F1 3 0 R /F2 4 0 R >> >> /Contents %d 0 R >>" % (PAGE_WIDTH, PAGE_HEIGHT, content_id))
+        self.page_ids.append(page_id)
+
+    def close(self):
+        self.write_object(3, b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>")
+        self.write_object(4, b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica-Bold /Encoding /WinAnsiEncoding >>")
+        kids = b" ".join(b"%d 0 R" % page_id for page_id in self.page_ids)
+        self.write_object(2, b"<< /Type /Pages /Kids [" + kids + b"] /Count %d >>" % len(self.page_ids))
+        self.write_object(1, b"<< /Type /Catalog /Pages 2 0 R >>")
+        xref_offset = self.position
+        size = self.next_id
+        entries = [b"0000000000 65535 f \n"]
+        for obj_id in range(1, size):
+            entries.append(b"%010d 00000 n \n" % self.offsets[obj_id])
+        self.write(b"xref\n0 %d\n" % size + b"".join(entries))
+        self.write(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (size, xref_offset))
+
+
+# Text lines of the taxonomy and family blocks, which only depend on the species
+# and the store's contents: `version` is plantify_data.data_version(), so an
+# edited taxonomy or family row gets new sections instead of the cached ones
+@lru_cache(maxsize=1024)
+def species_sections(species, family, version):
+    taxonomy = get_taxonomy(species, family)
+    family_info = get_family_info(family)
+    taxonomy_lines = tuple(f"{key}: {value}" for key, value in taxonomy.items())
+    family_lines = (
+        f"Description: {family_info['description']}",
+        f"Ethnobotanical Uses: {family_info['ethnobotanical_uses']}",
+        f"Reference: {family_info['reference']}",
+    )
+    return taxonomy_lines, family_lines
+
+# Lay out one classification result as page content streams
+def layout_report(species, family, confidence, inputs, version):
+    taxonomy_lines, family_lines = species_sections(species, family, version)
+    layout = PageLayout()
+    layout.text("PLANTIFY! Classification Report", bold=True)
+    layout.text(f"Species: {species}")
+    layout.text(f"Family: {family}")
+    layout.text(f"Confidence: {confidence:.2%}")
+    layout.space(10)
+
+    layout.text("Taxonomic Hierarchy:", bold=True)
+    for line in taxonomy_lines:
+        layout.text(line, indent=20, leading=15)
+    layout.space(10)
+
+    layout.text("Morphological Characteristics Used:", bold=True)
+    for key, value in inputs:
+        layout.text(f"{key.replace('_', ' ').title()}: {value}", indent=20, leading=15)
+    layout.space(10)
+
+    layout.text("Family Details:", bold=True)
+    for line in family_lines:
+        layout.text(line, indent=20, leading=15)
+    layout.space(10)
+
+    layout.text(DISCLAIMER, leading=15)
+    layout.space(5)
+    layout.text(ACKNOWLEDGMENT, leading=15)
+    return layout.finish()
+
+@lru_cache(maxsize=REPORT_CACHE_SIZE)
+def render_report(species, family, confidence, inputs, version):
+    with timed("plantify_pdf_render_seconds"):
+        buffer = BytesIO()
+        writer = PdfStreamWriter(buffer)
+        for page in layout_report(species, family, confidence, inputs, version):
+            writer.add_page(page)
+        writer.close()
+    return buffer.getvalue()
+
+# PDF bytes for a classification, memoized on (species, confidence bucket,
+# inputs, data version); a change to the store starts new cache entries and the
+# stale ones age out of the LRU
+def generate_pdf_report(species, family, confidence, inputs):
+    registry.inc("plantify_pdf_requests_total")
+    return render_report(species, family, confidence_bucket(confidence), tuple(inputs.items()), data_version())
+
+def layout_result(result):
+    return layout_report(
+        result["species"], result["family"], confidence_bucket(result["confidence"]), tuple(result["inputs"].items()), data_version()
+    )
+
+def _windows(results, size):
+    window = []
+    for result in results:
+        window.append(result)
+        if len(window) == size:
+            yield window
+            window = []
+    if window:
+        yield window
+
+# Write one report per classification result into a single PDF at `destination`
+# (a path or a binary file object). Results are dicts with species, family,
+# confidence and inputs, and may be any iterable, e.g. a generator over a file.
+# Pages are written as soon as they are laid out; with processes > 1 the layout
+# runs in a process pool, a window of results at a time, keeping result order.
+# Returns the number of reports written.
+def write_batch_report(results, destination, processes=None, window=256):
+    stream = open(destination, "wb") if isinstance(destination, str) else destination
+    count = 0
+    try:
+        writer = PdfStreamWriter(stream)
+        if processes and processes > 1:
+            with ProcessPoolExecutor(max_workers=processes) as pool:
+                for chunk in _windows(results, window):
+                    for pages in pool.map(layout_result, chunk, chunksize=max(1, len(chunk) // processes)):
+                        for page in pages:
+                            writer.add_page(page)
+                        count += 1
+        else:
+            for result in results:
+                for page in layout_result(result):
+                    writer.add_page(page)
+                count += 1
+        writer.close()
+    finally:
+        if stream is not destination:
+            stream.close()
+    return count
+
+# Classification results from a plantify_batch output file, skipping rejected rows
+def read_batch_results(path, chunk_size=10000):
+    import pandas as pd
+    from plantify_model import FEATURE_COLUMNS
+
+    for chunk in pd.read_csv(path, dtype=str, keep_default_na=False, chunksize=chunk_size):
+        for row in chunk.to_dict("records"):
+            if row.get("error") or not row.get("species"):
+                continue
+            yield {
+                "species": row["species"],
+                "family": row["family"],
+                "confidence": float(row["confidence"]),
+                "inputs": {col: row[col] for col in FEATURE_COLUMNS},
+            }
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render a combined PDF report from batch classification results")
+    parser.add_argument("results", help="CSV written by plantify_batch.py")
+    parser.add_argument("output", help="PDF file to write")
+    parser.add_argument("--processes", type=int, default=1, help="lay out pages in this many worker processes")
+    args = parser.parse_args(argv)
+
+    count = write_batch_report(read_batch_results(args.results), args.output, processes=args.processes)
+    print(f"Wrote {count} reports to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+# Species search by scientific and common names.
+#
+# Every species is indexed under its scientific name and the English and
+# regional names in the store (Tulsi, Vallarai, Holy basil, ...):
+# - a hash index from the normalized name to its species finds exact matches
+#   with one dict probe;
+# - a trigram index answers typo-tolerant search. Each name and each word of it
+#   is a search term; the query's trigrams pick the terms that share any, the
+#   shared counts come from one np.bincount over their posting arrays, and
+#   terms are scored by the Dice coefficient of the two trigram sets.
+# The index is rebuilt when the data store changes (get_search_index).
+#
+#   python plantify_search.py tulsy
+import argparse
+import re
+import sys
+import unicodedata
+
+import numpy as np
+
+from plantify_data import data_version, list_common_names, load_species_records
+from plantify_model import FEATURE_COLUMNS
+
+
+# Lowest Dice score reported by search
+MIN_SCORE = 0.4
+# Best-scoring terms examined per requested result (a species has several terms)
+CANDIDATES_PER_RESULT = 8
+SCIENTIFIC = "la"
+LANGUAGES = {"la": "Latin", "en": "English", "hi": "Hindi", "ml": "Malayalam", "sa": "Sanskrit", "ta": "Tamil"}
+
+
+def normalize(text):
+    text = unicodedata.normalize("NFKD", text)
+    text = "".join(ch for ch in text if not unicodedata.combining(ch)).casefold()
+    return " ".join(re.sub(r"[^0-9a-z]+", " ", text).split())
+
+def trigrams(term):
+    padded = f"  {term} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class SpeciesSearch:
+    def __init__(self, records, common_names=()):
+        # Hash index: scientific name -> record
+        self.records = {
+            species: {"species": species, "family": family, "traits": dict(zip(FEATURE_COLUMNS, traits))}
+            for traits, (family, species) in records
+        }
+        self.order = {species: i for i, species in enumerate(self.records)}
+        # Every name: (display name, species, language)
+        self.names = [(species, species, SCIENTIFIC) for species in self.records]
+        self.names += [(name, species, language) for species, name, language in common_names if species in self.records]
+        self.aliases = {}
+        for name, species, language in self.names[len(self.records):]:
+            self.aliases.setdefault(species, []).append((name, language))
+        # Hash index: normalized name -> names ids
+        self.exact = {}
+        for name_id, (name, _, _) in enumerate(self.names):
+            self.exact.setdefault(normalize(name), []).append(name_id)
+
+        # Terms are whole names and their words, so "basil" finds "Holy basil"
+        term_names = []
+        term_sizes = []
+        postings = {}
+        for name_id, (name, _, _) in enumerate(self.names):
+            normalized = normalize(name)
+            words = normalized.split()
+            for term in dict.fromkeys([normalized] + (words if len(words) > 1 else [])):
+                grams = trigrams(term)
+                term_id = len(term_names)
+                term_names.append(name_id)
+                term_sizes.append(len(grams))
+                for gram in grams:
+                    postings.setdefault(gram, []).append(term_id)
+        self.term_names = np.array(term_names, dtype=np.int32)
+        self.term_sizes = np.array(term_sizes, dtype=np.float32)
+        self.postings = {gram: np.array(ids, dtype=np.int32) for gram, ids in postings.items()}
+
+    # Common names of a species as (name, language) pairs
+    def common_names(self, species):
+        return self.aliases.get(species, [])
+
+    # Up to limit matches, best first, one per species: dicts with the species,
+    # family, the name that matched, its language and the score (1.0 for an
+    # exact name match)
+    def search(self, text, limit=10, min_score=MIN_SCORE):
+        query = normalize(text)
+        if not query:
+            return []
+        best = {}
+        for name_id in self.exact.get(query, []):
+            best.setdefault(self.names[name_id][1], (1.0, name_id))
+        query_grams = trigrams(query)
+        grams = [self.postings[gram] for gram in query_grams if gram in self.postings]
+        if grams:
+            shared = np.bincount(np.concatenate(grams), minlength=len(self.term_names))
+            scores = 2.0 * shared / (self.term_sizes + len(query_grams))
+            candidates = np.flatnonzero(scores >= min_score)
+            # Only the best terms can make the top `limit`; a few per species is plenty
+            keep = limit * CANDIDATES_PER_RESULT
+            if len(candidates) > keep:
+                candidates = candidates[np.argpartition(-scores[candidates], keep)[:keep]]
+            for term_id in candidates.tolist():
+                name_id = int(self.term_names[term_id])
+                species = self.names[name_id][1]
+                score = float(scores[term_id])
+                if score > best.get(species, (0.0, None))[0]:
+                    best[species] = (score, name_id)
+        ranked = sorted(best.items(), key=lambda item: (-item[1][0], self.order[item[0]]))[:limit]
+        return [
+            {
+                "species": species,
+                "family": self.records[species]["family"],
+                "matched": self.names[name_id][0],
+                "language": self.names[name_id][2],
+                "score": round(score, 3),
+            }
+            for species, (score, name_id) in ranked
+        ]
+
+
+_index = None
+
+
+# The search index for the current store contents, rebuilt after the store changes
+def get_search_index():
+    global _index
+    version = data_version()
+    if _index is None or _index[0] != version:
+        _index = (version, SpeciesSearch(load_species_records(), list_common_names()))
+    return _index[1]
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Search species by scientific or common name")
+    parser.add_argument("query", nargs="+")
+    parser.add_argument("--limit", type=int, default=10)
+    args = parser.parse_args(argv)
+
+    results = get_search_index().search(" ".join(args.query), limit=args.limit)
+    if not results:
+        print("No matching species")
+        return 1
+    for result in results:
+        via = "" if result["matched"] == result["species"] else f"  ({result['matched']}, {result['language']})"
+        print(f"{result['score']:.2f}  {result['species']} [{result['family']}]{via}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
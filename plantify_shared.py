@@ -0,0 +1,164 @@
+# Serving pack: the model's arrays in memory-mapped files shared by every worker.
+#
+# `plantify_model.py build` exports the compiled family and species trees
+# (concatenated into one set of node arrays), the similarity engine's
+# code and penalty matrices and the species/family tables next to the model
+# artifact. Workers (uvicorn --workers N, several Streamlit servers) attach to
+# the pack instead of unpickling the scikit-learn model: the arrays are mapped
+# read-only, so every process reads the same physical pages from the page cache
+# and adding a worker costs only its Python objects. Serving from the pack needs
+# neither scikit-learn nor pandas to be imported.
+#
+# Python dicts and lists cannot be mapped, so the species/family tables (read
+# from the manifest), the trait index and the app's and API's query, key and
+# search structures are still built in every worker from the manifest or the
+# store; plantify_api.py lists their cost.
+import glob
+import json
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+from plantify_model import ARTIFACT_FORMAT_VERSION, TraitEncoder, manifest_path
+from plantify_index import SimilarityEngine
+from plantify_tree import CompiledHierarchy
+
+
+PACK_FORMAT_VERSION = 2
+
+PACK_ARRAYS = {
+    "tree_feature": np.int32,
+    "tree_threshold": np.float64,
+    "tree_left": np.int32,
+    "tree_right": np.int32,
+    "tree_leaf_proba": np.float64,
+    "tree_offsets": np.int64,
+    "tree_proba_offsets": np.int64,
+    "similarity_codes": np.uint8,
+    "similarity_weights": np.float32,
+    "similarity_penalties": np.float32,
+}
+
+
+# Small JSON file naming the current pack directory
+def pack_pointer(artifact_path):
+    return os.path.splitext(artifact_path)[0] + ".serving.json"
+
+# Directory of the current pack, or None if no pack has been exported
+def pack_dir(artifact_path):
+    try:
+        with open(pack_pointer(artifact_path)) as f:
+            name = json.load(f)["directory"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    return os.path.join(os.path.dirname(os.path.abspath(artifact_path)), name)
+
+# Write the pack for a prepared model (see plantify_model.prepare_model). Every
+# pack gets a new directory that is never modified once written, and the
+# pointer file is switched to it with one os.replace, so a worker attaching
+# meanwhile reads the manifest and arrays of either the old pack or the new
+# one, never a mix, and there is always a pack to attach to. The pack before
+# the new one is kept for workers that have just read the old pointer; older
+# packs are deleted (workers already mapping their files keep them until they exit).
+def export_pack(model, artifact_path, artifact_sha256):
+    base = os.path.splitext(os.path.abspath(artifact_path))[0] + ".serving"
+    os.makedirs(os.path.dirname(base), exist_ok=True)
+    directory = tempfile.mkdtemp(prefix=f"{os.path.basename(base)}-{artifact_sha256[:12]}-", dir=os.path.dirname(base))
+
+    trees, families, classes = model["hierarchy"].to_arrays()
+    similarity = model["similarity"]
+    arrays = {
+        **{"tree_" + name: array for name, array in trees.items()},
+        "similarity_codes": similarity.codes,
+        "similarity_weights": similarity.weights,
+        "similarity_penalties": similarity.penalty_matrix,
+    }
+    for name, dtype in PACK_ARRAYS.items():
+        np.save(os.path.join(directory, name + ".npy"), np.ascontiguousarray(arrays[name], dtype=dtype))
+    manifest = {
+        "format_version": PACK_FORMAT_VERSION,
+        "artifact_format_version": ARTIFACT_FORMAT_VERSION,
+        "artifact_sha256": artifact_sha256,
+        "data_hash": model["data_hash"],
+        "columns": model["columns"],
+        "tree_families": families,
+        "tree_classes": classes,
+        "species": similarity.species,
+        "families": similarity.families,
+        "species_family": model["species_family"],
+        "metrics": model["metrics"],
+    }
+    with open(os.path.join(directory, "manifest.json"), "w") as f:
+        json.dump(manifest, f)
+
+    # mkdtemp creates the directory owner-only; workers may run as other users
+    os.chmod(directory, 0o755)
+    previous = pack_dir(artifact_path)
+    pointer = pack_pointer(artifact_path)
+    with open(pointer + ".tmp", "w") as f:
+        json.dump({"directory": os.path.basename(directory), "artifact_sha256": artifact_sha256}, f)
+    os.replace(pointer + ".tmp", pointer)
+    keep = {directory, previous}
+    for old in glob.glob(glob.escape(base) + "-*"):
+        if old not in keep:
+            shutil.rmtree(old, ignore_errors=True)
+    # Pack directory of the layout before the pointer file
+    shutil.rmtree(base, ignore_errors=True)
+    return manifest
+
+# Map the pack's arrays read-only. Returns a model bundle that serves exactly
+# like one from load_or_train, minus the scikit-learn estimator, or None if
+# there is no pack for the current artifact and trait table.
+def attach_pack(artifact_path, expected_hash=None):
+    directory = pack_dir(artifact_path)
+    if directory is None:
+        return None
+    try:
+        with open(os.path.join(directory, "manifest.json")) as f:
+            manifest = json.load(f)
+        with open(manifest_path(artifact_path)) as f:
+            artifact_sha256 = json.load(f).get("sha256")
+    except (OSError, ValueError):
+        return None
+    if manifest.get("format_version") != PACK_FORMAT_VERSION or manifest.get("artifact_format_version") != ARTIFACT_FORMAT_VERSION:
+        print("Serving pack format does not match; loading the model artifact")
+        return None
+    if manifest.get("artifact_sha256") != artifact_sha256:
+        print("Serving pack is stale: model artifact has changed")
+        return None
+    if expected_hash is not None and manifest.get("data_hash") != expected_hash:
+        print("Serving pack is stale: trait table has changed")
+        return None
+    try:
+        arrays = {}
+        for name, dtype in PACK_ARRAYS.items():
+            array = np.load(os.path.join(directory, name + ".npy"), mmap_mode="r")
+            if array.dtype != dtype:
+                raise ValueError(f"{name} has dtype {array.dtype}, expected {np.dtype(dtype)}")
+            arrays[name] = array.view(np.ndarray)
+    except (OSError, ValueError) as e:
+        print(f"Error attaching serving pack: {str(e)}")
+        return None
+
+    from plantify_lookup import load_lookup
+
+    return {
+        "format_version": ARTIFACT_FORMAT_VERSION,
+        "data_hash": manifest["data_hash"],
+        "columns": manifest["columns"],
+        "species_family": manifest["species_family"],
+        "metrics": manifest["metrics"],
+        "artifact_sha256": artifact_sha256,
+        "encoder": TraitEncoder(manifest["columns"]),
+        "hierarchy": CompiledHierarchy.from_arrays(
+            {name[len("tree_"):]: array for name, array in arrays.items() if name.startswith("tree_")},
+            manifest["tree_families"], manifest["tree_classes"],
+        ),
+        "similarity": SimilarityEngine.from_arrays(
+            manifest["species"], manifest["families"],
+            arrays["similarity_codes"], arrays["similarity_weights"], arrays["similarity_penalties"],
+        ),
+        "lookup": load_lookup(artifact_path, artifact_sha256),
+    }
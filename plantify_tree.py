@@ -0,0 +1,248 @@
+# Array-backed decision tree inference.
+#
+# A fitted DecisionTreeClassifier is flattened into its node arrays (feature,
+# threshold, children and per-leaf class probabilities). Batches are walked with
+# vectorized NumPy, one step per tree level; a single row is walked in plain
+# Python, which for a tree of a few dozen nodes is much cheaper than the input
+# validation sklearn's predict_proba does on every call. Each leaf's ranked
+# candidates are computed once, so prediction and confidence come out of the
+# same walk.
+#
+# CompiledHierarchy serves the two-stage family-then-species model
+# (plantify_hierarchy.py) from one compiled tree per stage and family.
+import argparse
+import itertools
+import sys
+
+import numpy as np
+
+
+class CompiledTree:
+    def __init__(self, feature, threshold, left, right, leaf_proba, classes):
+        self.feature = np.asarray(feature, dtype=np.int32)
+        # sklearn compares float32 inputs against float64 thresholds
+        self.threshold = np.asarray(threshold, dtype=np.float64)
+        self.left = np.asarray(left, dtype=np.int32)
+        self.right = np.asarray(right, dtype=np.int32)
+        self.leaf_proba = np.asarray(leaf_proba, dtype=np.float64)
+        self.classes = [str(name) for name in classes]
+        self.is_leaf = self.left < 0
+        self.depth = self._depth()
+        # Python lists for the single-row walk; indexing them beats NumPy scalars
+        self._nodes = list(zip(self.feature.tolist(), self.threshold.tolist(), self.left.tolist(), self.right.tolist()))
+        # Candidates at each leaf, most likely first, ties in class order
+        # (the order np.argsort(-proba, kind="stable") gives)
+        self.leaf_ranking = {}
+        for node in np.flatnonzero(self.is_leaf):
+            proba = self.leaf_proba[node]
+            order = np.argsort(-proba, kind="stable")
+            self.leaf_ranking[int(node)] = [(self.classes[j], float(proba[j])) for j in order if proba[j] > 0]
+
+    @classmethod
+    def from_sklearn(cls, clf):
+        tree = clf.tree_
+        value = tree.value[:, 0, :]
+        totals = value.sum(axis=1, keepdims=True)
+        leaf_proba = np.divide(value, totals, out=np.zeros_like(value), where=totals > 0)
+        return cls(tree.feature, tree.threshold, tree.children_left, tree.children_right, leaf_proba, clf.classes_)
+
+    def _depth(self):
+        depth = 0
+        frontier = [0]
+        while frontier:
+            frontier = [child for node in frontier if not self.is_leaf[node] for child in (self.left[node], self.right[node])]
+            depth += 1
+        return depth
+
+    @property
+    def node_count(self):
+        return len(self.feature)
+
+    # Leaf reached by one encoded row (a float32 array or a list of its values)
+    def leaf(self, row):
+        if isinstance(row, np.ndarray):
+            row = row.tolist()
+        node = 0
+        nodes = self._nodes
+        feature, threshold, left, right = nodes[0]
+        while left >= 0:
+            node = left if row[feature] <= threshold else right
+            feature, threshold, left, right = nodes[node]
+        return node
+
+    # Leaves reached by an (N, n_features) matrix, walking every row a level at a time
+    def leaves(self, X):
+        X = np.asarray(X, dtype=np.float32)
+        nodes = np.zeros(X.shape[0], dtype=np.int32)
+        rows = np.arange(X.shape[0])
+        for _ in range(self.depth):
+            active = ~self.is_leaf[nodes]
+            if not active.any():
+                break
+            current = nodes[active]
+            go_left = X[rows[active], self.feature[current]].astype(np.float64) <= self.threshold[current]
+            nodes[active] = np.where(go_left, self.left[current], self.right[current])
+        return nodes
+
+    def predict_proba(self, X):
+        return self.leaf_proba[self.leaves(X)]
+
+    # Up to top_k (species, confidence) candidates per row, best first
+    def rank(self, X, top_k=1):
+        return [self.leaf_ranking[node][:top_k] for node in self.leaves(X).tolist()]
+
+    def rank_one(self, row, top_k=1):
+        return self.leaf_ranking[self.leaf(row)][:top_k]
+
+    def predict(self, X):
+        return [ranking[0] for ranking in self.rank(X)]
+
+
+# The family tree plus one species tree per family. A candidate's confidence is
+# the family's probability at the family leaf times the species' probability at
+# the leaf of that family's tree; only families present at the family leaf are
+# walked, usually just one.
+class CompiledHierarchy:
+    def __init__(self, family_tree, species_trees):
+        self.family_tree = family_tree
+        self.species_trees = species_trees
+        self.classes = sorted(name for tree in species_trees.values() for name in tree.classes)
+
+    @classmethod
+    def from_sklearn(cls, clf):
+        return cls(
+            CompiledTree.from_sklearn(clf.family_clf_),
+            {family: CompiledTree.from_sklearn(tree) for family, tree in clf.species_clfs_.items()},
+        )
+
+    @property
+    def node_count(self):
+        return self.family_tree.node_count + sum(tree.node_count for tree in self.species_trees.values())
+
+    # Ranked (species, confidence) candidates for one encoded row
+    def rank_one(self, row):
+        if isinstance(row, np.ndarray):
+            row = row.tolist()
+        candidates = []
+        for family, p in self.family_tree.leaf_ranking[self.family_tree.leaf(row)]:
+            tree = self.species_trees[family]
+            candidates += [(name, p * q) for name, q in tree.leaf_ranking[tree.leaf(row)]]
+        candidates.sort(key=lambda candidate: -candidate[1])
+        return candidates
+
+    # Ranked candidates for every row of an (N, n_features) matrix; each
+    # family's tree is walked once for all the rows that reach that family
+    def rank(self, X):
+        X = np.asarray(X, dtype=np.float32)
+        family_rankings = [self.family_tree.leaf_ranking[leaf] for leaf in self.family_tree.leaves(X).tolist()]
+        rows_by_family = {}
+        for i, ranking in enumerate(family_rankings):
+            for family, _ in ranking:
+                rows_by_family.setdefault(family, []).append(i)
+        species_leaves = {
+            family: dict(zip(rows, self.species_trees[family].leaves(X[rows]).tolist()))
+            for family, rows in rows_by_family.items()
+        }
+        rankings = []
+        for i, ranking in enumerate(family_rankings):
+            candidates = []
+            for family, p in ranking:
+                tree = self.species_trees[family]
+                candidates += [(name, p * q) for name, q in tree.leaf_ranking[species_leaves[family][i]]]
+            candidates.sort(key=lambda candidate: -candidate[1])
+            rankings.append(candidates)
+        return rankings
+
+    # Species probabilities in `classes` order
+    def predict_proba(self, X):
+        X = np.asarray(X, dtype=np.float32)
+        family_proba = self.family_tree.predict_proba(X)
+        column = {name: j for j, name in enumerate(self.classes)}
+        proba = np.zeros((X.shape[0], len(self.classes)))
+        for j, family in enumerate(self.family_tree.classes):
+            rows = np.flatnonzero(family_proba[:, j] > 0)
+            tree = self.species_trees[family]
+            columns = [column[name] for name in tree.classes]
+            proba[np.ix_(rows, columns)] += family_proba[rows, j][:, None] * tree.predict_proba(X[rows])
+        return proba
+
+    # Every tree's arrays concatenated (the family tree first, then the species
+    # trees in `families` order; child indices stay local to their tree) plus
+    # the offsets that slice them apart again
+    def to_arrays(self):
+        trees = [self.family_tree] + list(self.species_trees.values())
+        arrays = {
+            name: np.concatenate([getattr(tree, name) for tree in trees])
+            for name in ("feature", "threshold", "left", "right")
+        }
+        arrays["leaf_proba"] = np.concatenate([tree.leaf_proba.ravel() for tree in trees])
+        arrays["offsets"] = np.cumsum([0] + [tree.node_count for tree in trees])
+        arrays["proba_offsets"] = np.cumsum([0] + [tree.leaf_proba.size for tree in trees])
+        classes = [self.family_tree.classes] + [tree.classes for tree in self.species_trees.values()]
+        return arrays, list(self.species_trees), classes
+
+    # Rebuild from to_arrays output; the trees are views into the arrays, so
+    # memory-mapped arrays stay shared
+    @classmethod
+    def from_arrays(cls, arrays, families, classes):
+        offsets = arrays["offsets"].tolist()
+        proba_offsets = arrays["proba_offsets"].tolist()
+        trees = []
+        for t, tree_classes in enumerate(classes):
+            nodes = slice(offsets[t], offsets[t + 1])
+            leaf_proba = arrays["leaf_proba"][proba_offsets[t]:proba_offsets[t + 1]].reshape(offsets[t + 1] - offsets[t], len(tree_classes))
+            trees.append(CompiledTree(
+                arrays["feature"][nodes], arrays["threshold"][nodes], arrays["left"][nodes], arrays["right"][nodes],
+                leaf_proba, tree_classes,
+            ))
+        return cls(trees[0], dict(zip(families, trees[1:])))
+
+
+# Every combination of the trait vocabularies, as rows in FEATURE_COLUMNS order
+def all_trait_combinations():
+    from plantify_model import FEATURE_COLUMNS, TRAIT_OPTIONS
+
+    return list(itertools.product(*(TRAIT_OPTIONS[column] for column in FEATURE_COLUMNS)))
+
+# Compare the compiled hierarchy with clf.predict_proba on the given encoded rows
+# (default: every trait combination). Returns the number of disagreeing rows.
+def check_parity(model, X=None):
+    clf = model["clf"]
+    compiled = CompiledHierarchy.from_sklearn(clf)
+    if X is None:
+        from plantify_model import TraitEncoder
+
+        X = TraitEncoder(model["columns"]).encode_batch(all_trait_combinations())
+    expected = clf.predict_proba(X)
+    got = compiled.predict_proba(X)
+    mismatched = ~np.isclose(expected, got).all(axis=1)
+    # The single-row walk must rank the same candidates as the batch walk
+    sample = list(range(0, len(X), max(1, len(X) // 1000)))
+    batch = compiled.rank(X[sample])
+    mismatched[sample] |= np.array([compiled.rank_one(X[i]) != ranking for i, ranking in zip(sample, batch)])
+    return int(mismatched.sum()), len(X)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check the compiled trees against scikit-learn on every trait combination")
+    parser.parse_args(argv)
+
+    from plantify_data import load_species_records
+    from plantify_model import load_or_train
+
+    # The estimator itself is needed for the comparison, so skip the serving pack
+    model = load_or_train(load_species_records(), shared=False)
+    compiled = model["hierarchy"]
+    mismatches, total = check_parity(model)
+    family_tree = compiled.family_tree
+    print(f"Family tree: {family_tree.node_count} nodes, depth {family_tree.depth}, {len(family_tree.leaf_ranking)} leaves")
+    print(f"{len(compiled.species_trees)} species trees: {compiled.node_count - family_tree.node_count} nodes, "
+          f"max depth {max(tree.depth for tree in compiled.species_trees.values())}")
+    if mismatches:
+        print(f"{mismatches} of {total} trait combinations disagree with predict_proba", file=sys.stderr)
+        return 1
+    print(f"Matches predict_proba on all {total} trait combinations")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
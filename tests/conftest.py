@@ -0,0 +1,28 @@
+# Shared fixtures: one model built with `build` for the whole session, in a
+# temporary directory so the tests never touch models/.
+import pytest
+
+from plantify_data import load_species_records
+from plantify_model import build_artifacts, load_or_train
+
+
+@pytest.fixture(scope="session")
+def records():
+    return load_species_records()
+
+# Path of a freshly built artifact, with its lookup table and serving pack
+@pytest.fixture(scope="session")
+def artifact_path(records, tmp_path_factory):
+    path = str(tmp_path_factory.mktemp("models") / "plantify_model.joblib")
+    build_artifacts(records, path, n_jobs=1)
+    return path
+
+# Loaded from the artifact: has the scikit-learn estimator and the lookup table
+@pytest.fixture(scope="session")
+def model(records, artifact_path):
+    return load_or_train(records, artifact_path, shared=False)
+
+# The same model without its lookup table, so rank_batch takes the live path
+@pytest.fixture(scope="session")
+def live_model(model):
+    return {key: value for key, value in model.items() if key != "lookup"}
@@ -0,0 +1,107 @@
+import pytest
+from fastapi.testclient import TestClient
+
+import plantify_api
+from plantify_model import DEFAULT_TOP_K, FEATURE_COLUMNS, rank_batch
+from plantify_reload import ModelReloader, load_serving_model, serving_version
+
+
+# The API serving the session's artifact instead of models/
+@pytest.fixture(scope="module")
+def client(artifact_path):
+    def reloader():
+        return ModelReloader(load=lambda: load_serving_model(artifact_path), version=lambda: serving_version(artifact_path))
+
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(plantify_api, "ModelReloader", reloader)
+        with TestClient(plantify_api.app) as client:
+            yield client
+
+@pytest.fixture
+def specimen(records):
+    return dict(zip(FEATURE_COLUMNS, records[0][0]))
+
+def ranked(model, specimen, top_k=DEFAULT_TOP_K):
+    return rank_batch(model, [tuple(specimen[col] for col in FEATURE_COLUMNS)], top_k)[0]
+
+
+def test_health(client, model):
+    body = client.get("/health").json()
+    assert body["status"] == "ok"
+    assert body["data_hash"] == model["data_hash"]
+    assert body["species"] == len(model["species_family"])
+    assert body["reload_error"] is None
+
+def test_classify(client, model, specimen):
+    response = client.post("/classify", json=specimen)
+    assert response.status_code == 200
+    body = response.json()
+    candidates = ranked(model, specimen)
+    assert (body["species"], body["confidence"]) == candidates[0]
+    assert body["family"] == model["species_family"][body["species"]]
+    assert [(alternative["species"], alternative["confidence"]) for alternative in body["alternatives"]] == candidates[1:]
+    assert body["family_confidence"] * body["species_confidence"] * body["similarity"] == pytest.approx(body["confidence"], abs=2e-6)
+    assert body["taxonomy"] and body["family_details"]
+
+# Numbers, capitals and stray spaces are normalized as on every other entry point
+def test_classify_normalizes_values(client, specimen):
+    typed = {col: f" {value.upper()} " for col, value in specimen.items()}
+    typed["petal_number"] = int(specimen["petal_number"])
+    assert client.post("/classify", json=typed).json() == client.post("/classify", json=specimen).json()
+
+def test_classify_rejects_unknown_value(client, specimen):
+    response = client.post("/classify", json=dict(specimen, leaf_arrangement="spiral"))
+    assert response.status_code == 422
+    assert response.json()["detail"] == "Invalid value for leaf_arrangement: spiral"
+
+def test_classify_rejects_missing_trait(client, specimen):
+    del specimen["habit"]
+    assert client.post("/classify", json=specimen).status_code == 422
+
+def test_classify_batch(client, model, records):
+    specimens = [dict(zip(FEATURE_COLUMNS, traits)) for traits, _ in records[:5]]
+    response = client.post("/classify/batch", json={"specimens": specimens, "top_k": 3})
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert len(results) == 5
+    for specimen, result in zip(specimens, results):
+        candidates = ranked(model, specimen, 3)
+        assert (result["species"], result["confidence"]) == candidates[0]
+        assert len(result["alternatives"]) == len(candidates) - 1
+
+def test_classify_batch_reports_position(client, specimen):
+    response = client.post("/classify/batch", json={"specimens": [specimen, dict(specimen, habit="vine")]})
+    assert response.status_code == 422
+    assert response.json()["detail"] == "specimen 1: Invalid value for habit: vine"
+
+def test_classify_batch_limits_top_k(client, specimen):
+    assert client.post("/classify/batch", json={"specimens": [specimen], "top_k": 11}).status_code == 422
+
+def test_similar(client, model, specimen):
+    traits = {"leaf_arrangement": specimen["leaf_arrangement"], "habit": specimen["habit"]}
+    response = client.post("/similar?k=3", json=traits)
+    assert response.status_code == 200
+    expected = model["similarity"].nearest(traits, 3)
+    assert [(n["species"], n["family"], n["distance"]) for n in response.json()["neighbours"]] == expected
+
+def test_similar_rejects_unknown_key(client):
+    assert client.post("/similar", json={"habit": "herb", "leaf_colour": "green"}).status_code == 422
+
+def test_similar_rejects_unknown_value(client):
+    response = client.post("/similar", json={"habit": "vine"})
+    assert response.status_code == 422
+    assert response.json()["detail"] == "Invalid value for habit: vine"
+
+def test_search(client, records):
+    name = records[0][1][1]
+    results = client.get("/search", params={"q": name}).json()["results"]
+    assert results[0]["species"] == name
+    assert results[0]["family"] == records[0][1][0]
+    assert "common_names" in results[0]
+
+def test_metrics(client, specimen):
+    client.post("/classify", json=specimen)
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert client.get("/stats").status_code == 200
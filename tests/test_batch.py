@@ -0,0 +1,73 @@
+import pandas as pd
+import pytest
+
+from plantify_batch import classify_file, detect_format
+from plantify_model import DEFAULT_TOP_K, FEATURE_COLUMNS, rank_batch
+
+
+# Three known species, the first written the way people type it, then a row
+# with a missing trait and one with a value outside the vocabulary
+@pytest.fixture
+def specimens(records):
+    rows = [dict(zip(FEATURE_COLUMNS, traits)) for traits, _ in records[:3]]
+    rows[0] = {col: f"  {value.title()} " for col, value in rows[0].items()}
+    rows.append(dict(rows[1], habit=None))
+    rows.append(dict(rows[1], leaf_arrangement="spiral"))
+    df = pd.DataFrame(rows, columns=FEATURE_COLUMNS)
+    df.insert(0, "specimen_id", [f"S{i}" for i in range(len(df))])
+    return df
+
+def expected_species(model, records):
+    return [candidates[0][0] for candidates in rank_batch(model, [tuple(traits) for traits, _ in records[:3]])]
+
+def check_results(results, model, records):
+    assert list(results["specimen_id"]) == ["S0", "S1", "S2", "S3", "S4"]
+    assert list(results["species"][:3]) == expected_species(model, records)
+    assert list(results["family"][:3]) == [model["species_family"][name] for name in results["species"][:3]]
+    assert list(results["error"]) == ["", "", "", "Missing value for habit", "Invalid value for leaf_arrangement: spiral"]
+    assert list(results["species"][3:]) == ["", ""]
+    assert results["confidence"][3:].isna().all()
+
+
+def test_detect_format():
+    assert detect_format("specimens.CSV") == "csv"
+    assert detect_format("specimens.pq") == "parquet"
+    with pytest.raises(ValueError):
+        detect_format("specimens.xlsx")
+
+# chunk_size=2 makes the writer append across chunks
+@pytest.mark.parametrize("chunk_size", [2, 1000])
+def test_csv_round_trip(specimens, model, records, tmp_path, chunk_size):
+    source, destination = tmp_path / "in.csv", tmp_path / "out.csv"
+    specimens.to_csv(source, index=False)
+    assert classify_file(str(source), str(destination), model=model, chunk_size=chunk_size) == (3, 2)
+    check_results(pd.read_csv(destination, dtype={"species": str, "error": str}, keep_default_na=False, na_values={"confidence": [""]}), model, records)
+
+# Parquet keeps column types, so petal_number is read as a number and nulls as nulls
+@pytest.mark.parametrize("chunk_size", [2, 1000])
+def test_parquet_round_trip(specimens, model, records, tmp_path, chunk_size):
+    specimens["petal_number"] = pd.to_numeric(specimens["petal_number"].str.strip())
+    source, destination = tmp_path / "in.parquet", tmp_path / "out.parquet"
+    specimens.to_parquet(source, index=False)
+    assert classify_file(str(source), str(destination), model=model, chunk_size=chunk_size) == (3, 2)
+    check_results(pd.read_parquet(destination), model, records)
+
+def test_csv_and_parquet_agree(specimens, model, tmp_path):
+    specimens.to_csv(tmp_path / "in.csv", index=False)
+    specimens.to_parquet(tmp_path / "in.parquet", index=False)
+    classify_file(str(tmp_path / "in.csv"), str(tmp_path / "out.parquet"), model=model)
+    classify_file(str(tmp_path / "in.parquet"), str(tmp_path / "out2.parquet"), model=model)
+    columns = ["species", "family", "confidence", "family_confidence", "species_confidence", "similarity", "alternatives", "error"]
+    pd.testing.assert_frame_equal(pd.read_parquet(tmp_path / "out.parquet")[columns], pd.read_parquet(tmp_path / "out2.parquet")[columns])
+
+def test_alternatives_listed(specimens, model, tmp_path):
+    specimens.to_csv(tmp_path / "in.csv", index=False)
+    classify_file(str(tmp_path / "in.csv"), str(tmp_path / "out.parquet"), model=model, top_k=DEFAULT_TOP_K)
+    results = pd.read_parquet(tmp_path / "out.parquet")
+    ranked = rank_batch(model, [tuple(results.loc[1, FEATURE_COLUMNS])], DEFAULT_TOP_K)[0]
+    assert results.loc[1, "alternatives"] == "; ".join(f"{name} ({confidence:.2%})" for name, confidence in ranked[1:])
+
+def test_missing_column_is_rejected(specimens, model, tmp_path):
+    specimens.drop(columns=["habit"]).to_csv(tmp_path / "in.csv", index=False)
+    with pytest.raises(ValueError, match="Missing trait columns: habit"):
+        classify_file(str(tmp_path / "in.csv"), str(tmp_path / "out.csv"), model=model)
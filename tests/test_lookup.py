@@ -0,0 +1,59 @@
+import json
+
+import pytest
+
+from plantify_lookup import LOOKUP_TOP_K, combination_index, combination_indices, load_lookup
+from plantify_model import CONFIDENCE_DECIMALS, manifest_path, rank_batch, stage_confidences
+from plantify_tree import all_trait_combinations
+
+
+@pytest.fixture(scope="module")
+def combinations():
+    return all_trait_combinations()
+
+@pytest.fixture(scope="module")
+def live_ranked(live_model, combinations):
+    return rank_batch(live_model, combinations, LOOKUP_TOP_K)
+
+
+def test_lookup_is_loaded(model):
+    assert model["lookup"] is not None
+    assert model["lookup"].top_k == LOOKUP_TOP_K
+
+# Rows are stored in itertools.product order
+def test_combination_index_is_position(combinations):
+    assert combination_indices(combinations) == list(range(len(combinations)))
+    assert [combination_index(combo) for combo in combinations[::101]] == list(range(0, len(combinations), 101))
+
+def test_out_of_vocabulary_rows_have_no_index(combinations):
+    row = ("spiral",) + combinations[0][1:]
+    assert combination_index(row) is None
+    assert combination_indices([row] * 100) == [-1] * 100
+
+def test_lookup_matches_live_rank_batch(model, combinations, live_ranked):
+    assert rank_batch(model, combinations, LOOKUP_TOP_K) == live_ranked
+
+@pytest.mark.parametrize("top_k", [1, 3])
+def test_lookup_matches_live_rank_batch_for_smaller_top_k(model, live_model, combinations, top_k):
+    sample = combinations[::13]
+    assert rank_batch(model, sample, top_k) == rank_batch(live_model, sample, top_k)
+
+def test_lookup_stages_match_live_stages(model, live_model, combinations, live_ranked):
+    species = [candidates[0][0] for candidates in live_ranked]
+    stages = stage_confidences(model, combinations, species)
+    assert stages == stage_confidences(live_model, combinations, species)
+    for candidates, (family, family_confidence, species_confidence, similarity) in zip(live_ranked, stages):
+        assert round(family_confidence * species_confidence * similarity, CONFIDENCE_DECIMALS) == pytest.approx(candidates[0][1], abs=2e-6)
+
+# A row outside the vocabulary is not in the table and goes to the live path
+def test_out_of_vocabulary_row_falls_back(model, live_model, combinations):
+    rows = [("spiral",) + combinations[0][1:], combinations[0]]
+    assert rank_batch(model, rows, 5) == rank_batch(live_model, rows, 5)
+
+def test_lookup_for_other_artifact_is_ignored(artifact_path):
+    assert load_lookup(artifact_path, "0" * 64) is None
+
+def test_lookup_loads_for_its_artifact(artifact_path):
+    with open(manifest_path(artifact_path)) as f:
+        sha256 = json.load(f)["sha256"]
+    assert load_lookup(artifact_path, sha256) is not None
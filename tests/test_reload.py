@@ -0,0 +1,55 @@
+import pytest
+
+from plantify_reload import ModelReloader
+
+
+# A reloader over a fake store whose version the test controls; each load
+# returns a new model numbered by the load count
+@pytest.fixture
+def store():
+    state = {"version": 1, "loads": 0, "fail": False}
+
+    def load():
+        if state["fail"]:
+            raise RuntimeError("store is locked")
+        state["loads"] += 1
+        return {"data_hash": f"hash{state['loads']}", "species_family": {}}
+
+    state["reloader"] = ModelReloader(load=load, version=lambda: state["version"], interval=3600)
+    return state
+
+
+def test_first_model_is_loaded_synchronously(store):
+    assert store["reloader"].model["data_hash"] == "hash1"
+    assert store["reloader"].reloads == 0
+
+def test_refresh_without_change_keeps_model(store):
+    reloader = store["reloader"]
+    model = reloader.model
+    assert reloader.refresh() is model
+    assert store["loads"] == 1
+
+def test_refresh_swaps_in_new_model(store):
+    reloader = store["reloader"]
+    store["version"] = 2
+    assert reloader.refresh()["data_hash"] == "hash2"
+    assert reloader.get() is reloader.model
+    assert reloader.reloads == 1
+
+def test_get_waits_for_interval(store):
+    store["version"] = 2
+    assert store["reloader"].get()["data_hash"] == "hash1"
+    assert store["loads"] == 1
+
+def test_failed_reload_keeps_previous_model(store):
+    reloader = store["reloader"]
+    store["version"] = 2
+    store["fail"] = True
+    assert reloader.refresh()["data_hash"] == "hash1"
+    assert reloader.last_error == "store is locked"
+    # The failed version is not retried until the store changes again
+    store["fail"] = False
+    assert reloader.refresh()["data_hash"] == "hash1"
+    store["version"] = 3
+    assert reloader.refresh()["data_hash"] == "hash2"
+    assert reloader.last_error is None
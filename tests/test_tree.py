@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+
+from plantify_model import FEATURE_COLUMNS, TraitEncoder, load_or_train, rank_batch
+from plantify_tree import all_trait_combinations, check_parity
+
+
+@pytest.fixture(scope="module")
+def combinations():
+    return all_trait_combinations()
+
+# Every trait combination, encoded for the trees
+@pytest.fixture(scope="module")
+def encoded(model, combinations):
+    return TraitEncoder(model["columns"]).encode_batch(combinations)
+
+
+def test_compiled_proba_matches_sklearn(model, encoded):
+    np.testing.assert_allclose(model["hierarchy"].predict_proba(encoded), model["clf"].predict_proba(encoded))
+
+def test_classes_match_sklearn(model):
+    assert model["hierarchy"].classes == list(model["clf"].classes_)
+
+def test_rank_one_matches_rank(model, encoded):
+    hierarchy = model["hierarchy"]
+    for row, ranking in zip(encoded.tolist(), hierarchy.rank(encoded)):
+        assert hierarchy.rank_one(row) == ranking
+
+def test_check_parity_finds_no_mismatch(model):
+    mismatches, total = check_parity(model)
+    assert mismatches == 0
+    assert total == len(all_trait_combinations())
+
+def test_dict_encoder_matches_batch_encoder(model, combinations):
+    encoder = TraitEncoder(model["columns"])
+    sample = combinations[::97]
+    rows = np.vstack([encoder.encode(dict(zip(FEATURE_COLUMNS, combo))) for combo in sample])
+    np.testing.assert_array_equal(rows, encoder.encode_batch(sample))
+
+# The memory-mapped pack serves the same trees without the estimator
+def test_pack_matches_artifact(records, artifact_path, live_model, encoded, combinations):
+    pack = load_or_train(records, artifact_path)
+    assert "clf" not in pack
+    np.testing.assert_array_equal(pack["hierarchy"].predict_proba(encoded), live_model["hierarchy"].predict_proba(encoded))
+    pack = {key: value for key, value in pack.items() if key != "lookup"}
+    sample = combinations[::37]
+    assert rank_batch(pack, sample, top_k=5) == rank_batch(live_model, sample, top_k=5)